@@ -0,0 +1,2 @@
+from benchmarks.workloads import Workload, WORKLOADS
+from benchmarks.harness import Harness
@@ -0,0 +1,57 @@
+from benchmarks.workloads import WORKLOADS
+from benchmarks.harness import Harness
+import argparse
+import sys
+
+def run(args: argparse.Namespace) -> int:
+	"""
+	Runs selected workloads and saves their results
+	"""
+
+	workloads = [workload for workload in WORKLOADS if not args.only or workload.name in args.only]
+	harness = Harness(warmup = args.warmup, repeat = args.repeat, backends = args.backend)
+	results = harness.run(workloads)
+	if args.output: Harness.save(results, args.output)
+
+	return 0
+
+def compare(args: argparse.Namespace) -> int:
+	"""
+	Prints changes between two results, failing if any benchmark regressed
+	"""
+
+	rows = Harness.compare(Harness.load(args.base), Harness.load(args.new), args.threshold)
+	for row in rows:
+		flag = "REGRESSION" if row["regression"] else ""
+		print(
+			f"{row['name']:<20} {row['base'] / 1e6:>10.2f}ms -> {row['new'] / 1e6:>10.2f}ms"
+			f"  {row['change']:>+8.1%}  {flag}"
+		)
+
+	regressions = [row for row in rows if row["regression"]]
+	if regressions: print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+
+	return 1 if regressions else 0
+
+parser = argparse.ArgumentParser(prog = "python -m benchmarks", description = "Synt benchmarks")
+commands = parser.add_subparsers(dest = "command", required = True)
+
+run_parser = commands.add_parser("run", help = "measure workloads")
+run_parser.add_argument("-o", "--output", help = "JSON file to save results to")
+run_parser.add_argument("-w", "--warmup", type = int, default = 1, help = "runs before measuring")
+run_parser.add_argument("-r", "--repeat", type = int, default = 5, help = "measured runs")
+run_parser.add_argument("-b", "--backend", action = "append", choices = list(Harness.BACKEND_ARGS),
+	help = "backend to run programs with, all by default")
+run_parser.add_argument("only", nargs = "*", help = "workloads to run, all by default")
+run_parser.set_defaults(handler = run)
+
+compare_parser = commands.add_parser("compare", help = "compare two results")
+compare_parser.add_argument("base", help = "JSON results to compare against")
+compare_parser.add_argument("new", help = "JSON results to compare")
+compare_parser.add_argument("-t", "--threshold", type = float, default = 0.05,
+	help = "slowdown flagged as a regression, 0.05 by default")
+compare_parser.set_defaults(handler = compare)
+
+if __name__ == "__main__":
+	arguments = parser.parse_args()
+	sys.exit(arguments.handler(arguments))
@@ -0,0 +1,164 @@
+from typing import Self, Callable
+from benchmarks.workloads import Workload
+from modules.logger import Logger
+from modules.iterator import Iterator
+import subprocess
+import platform
+import tempfile
+import statistics
+import json
+import time
+import sys
+import os
+
+class Harness:
+	ENGINE_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+	BACKEND_ARGS: dict[str, list[str]] = {
+		"tree": [],
+		"vm": ["*vm"]
+	}
+
+	warmup: int = 1
+	repeat: int = 5
+	backends: list[str] = []
+
+	def __init__(self: Self, warmup: int = 1, repeat: int = 5, backends: list[str] = []) -> None:
+		"""
+		Measures workloads with warmup runs and repetitions
+		"""
+
+		self.warmup = warmup
+		self.repeat = repeat
+		self.backends = list(backends) if backends else list(self.BACKEND_ARGS)
+
+		return None
+	
+	def run(self: Self, workloads: list[Workload] = []) -> dict:
+		"""
+		Measures workloads, giving results ready to be saved as JSON
+		"""
+
+		results = {}
+		with tempfile.TemporaryDirectory() as temp_dir:
+			for workload in workloads:
+				if workload.parse_only:
+					results[workload.name] = self.measure(self.run_parse, workload.source())
+					print(self.format_result(workload.name, results[workload.name]), flush=True)
+					continue
+
+				path = workload.path
+				if workload.generate:
+					path = os.path.join(temp_dir, f"{workload.name}.synt")
+					with open(path, "w", encoding="utf-8") as source_file:
+						source_file.write(workload.source())
+
+				for backend in self.backends:
+					name = f"{workload.name}/{backend}"
+					results[name] = self.measure(self.run_process, path, backend)
+					print(self.format_result(name, results[name]), flush=True)
+
+		return {
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"warmup": self.warmup,
+			"repeat": self.repeat,
+			"unit": "ns",
+			"results": results
+		}
+	
+	def measure(self: Self, runner: Callable, *args) -> dict:
+		"""
+		Runs a measurement after warmup runs, summarizing the repetitions
+		"""
+
+		for _ in range(self.warmup): runner(*args)
+		runs = [runner(*args) for _ in range(self.repeat)]
+
+		return {
+			"runs": runs,
+			"min": min(runs),
+			"median": int(statistics.median(runs)),
+			"mean": int(statistics.mean(runs)),
+			"stdev": int(statistics.stdev(runs)) if len(runs) > 1 else 0
+		}
+	
+	def run_process(self: Self, path: str, backend: str = "tree") -> int:
+		"""
+		Runs a program in a new interpreter, giving the wall time in nanoseconds
+		"""
+
+		command = [sys.executable, self.ENGINE_PATH, path, *self.BACKEND_ARGS[backend]]
+		start_time = time.perf_counter_ns()
+		completed = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+			stderr=subprocess.PIPE)
+		elapsed = time.perf_counter_ns() - start_time
+
+		if completed.returncode:
+			raise RuntimeError(f"{path} exited with {completed.returncode}: {completed.stderr.decode()}")
+
+		return elapsed
+	
+	def run_parse(self: Self, source: str) -> int:
+		"""
+		Parses a program without running it, giving the time in nanoseconds
+		"""
+
+		iterator = Iterator(logger = Logger(exit_on_error=False))
+		start_time = time.perf_counter_ns()
+		iterator.iterate(source)
+
+		return time.perf_counter_ns() - start_time
+	
+	@staticmethod
+	def format_result(name: str, result: dict) -> str:
+		"""
+		Formats a result as one report line
+		"""
+
+		return (
+			f"{name:<20} median {result['median'] / 1e6:>10.2f}ms"
+			f"  min {result['min'] / 1e6:>10.2f}ms  stdev {result['stdev'] / 1e6:>8.2f}ms"
+		)
+	
+	@staticmethod
+	def save(results: dict, path: str) -> None:
+		"""
+		Writes results as JSON
+		"""
+
+		with open(path, "w", encoding="utf-8") as results_file:
+			json.dump(results, results_file, indent=1)
+
+		return None
+	
+	@staticmethod
+	def load(path: str) -> dict:
+		"""
+		Reads results from JSON
+		"""
+
+		with open(path, "r", encoding="utf-8") as results_file:
+			return json.load(results_file)
+	
+	@staticmethod
+	def compare(base: dict, new: dict, threshold: float = 0.05) -> list[dict]:
+		"""
+		Compares median times of benchmarks found in both results, a benchmark is a
+		regression when it got slower by more than the threshold
+		"""
+
+		rows = []
+		for name, base_result in base["results"].items():
+			new_result = new["results"].get(name)
+			if not new_result: continue
+
+			change = new_result["median"] / base_result["median"] - 1
+			rows.append({
+				"name": name,
+				"base": base_result["median"],
+				"new": new_result["median"],
+				"change": change,
+				"regression": change > threshold
+			})
+
+		return rows
@@ -0,0 +1,100 @@
+from typing import Self, Callable
+import os
+
+PROGRAMS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "programs")
+
+class Workload:
+	name: str = ""
+	path: str|None = None
+	generate: Callable[[], str]|None = None
+	parse_only: bool = False
+
+	def __init__(self: Self, name: str = "", path: str|None = None,
+			generate: Callable[[], str]|None = None, parse_only: bool = False
+		) -> None:
+		"""
+		Synt program measured by the benchmark harness, read from a file or generated
+		"""
+
+		self.name = name
+		self.path = path
+		self.generate = generate
+		self.parse_only = parse_only
+
+		return None
+	
+	def source(self: Self) -> str:
+		"""
+		Gets source code of the workload
+		"""
+
+		if self.generate: return self.generate()
+		with open(self.path, "r", encoding="utf-8") as source_file:
+			return source_file.read()
+
+def generate_collection(size: int = 500, lookups: int = 20000) -> str:
+	"""
+	Builds a collection of `size` positional and `size` named items, then looks
+	items up by position and by name
+	"""
+
+	lines = ["collection(items)"]
+	for index in range(size):
+		lines += ["\t" + str(index)]
+	for index in range(size):
+		lines += ["\tkv", f"\t\t\"key{index}", "\t\t" + str(index)]
+
+	lines += [
+		f"repeat({lookups}, i)",
+		"\titem(by_position)",
+		"\t\titems",
+		"\t\tremainder",
+		"\t\t\ti",
+		f"\t\t\t{size}",
+		"\titem(by_name)",
+		"\t\titems",
+		f"\t\t\"key{size // 2}",
+		"out",
+		"\tby_position",
+		"\tby_name"
+	]
+
+	return "\n".join(lines) + "\n"
+
+def generate_large_source(blocks: int = 5000) -> str:
+	"""
+	Builds a large program of algorithm definitions, loops and conditions to parse
+	"""
+
+	lines = []
+	for index in range(blocks):
+		lines += [
+			f"alg(step{index}, args)",
+			"\tvar(value)",
+			"\t\tnumber",
+			f"\t\t{index}",
+			"\trepeat(3, i)",
+			"\t\tif(TRUE)",
+			"\t\t\tadd(value)",
+			"\t\t\t\tvalue",
+			"\t\t\t\titem",
+			"\t\t\t\t\targs",
+			"\t\t\t\t\t0",
+			"\tresult",
+			"\t\tconcat",
+			f"\t\t\t\"step {index} \\n",
+			"\t\t\tvalue",
+			f"step{index}(out{index})",
+			f"\t{index}"
+		]
+
+	return "\n".join(lines) + "\n"
+
+WORKLOADS: list[Workload] = [
+	Workload("fib", os.path.join(PROGRAMS_DIR, "fib.synt")),
+	Workload("repeat", os.path.join(PROGRAMS_DIR, "repeat.synt")),
+	Workload("concat", os.path.join(PROGRAMS_DIR, "concat.synt")),
+	Workload("collection", generate = generate_collection),
+	Workload("if_chain", os.path.join(PROGRAMS_DIR, "if_chain.synt")),
+	Workload("parse", generate = generate_large_source, parse_only = True)
+]
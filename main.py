@@ -6,6 +6,10 @@ from modules import (
 	logger,
 	iterator,
 	runtime,
+	vm,
+	code_cache,
+	profiler,
+	sampler,
 	engine_modules
 )
 
@@ -23,6 +27,10 @@ synt = Esolang(
 	logger = logger,
 	iterator = iterator,
 	runtime = runtime,
+	vm = vm,
+	code_cache = code_cache,
+	profiler = profiler,
+	sampler = sampler,
 	modules = engine_modules,
 	debug = False
 )
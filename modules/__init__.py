@@ -2,6 +2,10 @@ from modules.esolang import Esolang
 from modules.logger import Logger
 from modules.iterator import Iterator
 from modules.runtime import Runtime
+from modules.compiler import Compiler
+from modules.vm import VirtualMachine
+from modules.cache import CodeCache
+from modules.profiler import Profiler, Sampler
 from modules.components.functions import (
     Modules,
     Comments,
@@ -10,6 +14,7 @@ from modules.components.functions import (
     System,
     Operations,
     Maths,
+    Statistics,
     Loops,
     Logic
 )
@@ -25,6 +30,26 @@ runtime = Runtime(
 	logger = logger,
     iterator = iterator
 )
+code_cache = CodeCache(
+	logger = logger,
+	iterator = iterator
+)
+compiler = Compiler(
+	logger = logger,
+	runtime = runtime
+)
+profiler = Profiler(
+	logger = logger
+)
+sampler = Sampler(
+	logger = logger,
+	runtime = runtime
+)
+vm = VirtualMachine(
+	logger = logger,
+	runtime = runtime,
+	compiler = compiler
+)
 engine_modules = Modules(
 	modules = [
         Comments,
@@ -33,6 +58,7 @@ engine_modules = Modules(
         System,
         Operations,
         Maths,
+        Statistics,
         Loops,
         Logic,
 	],
@@ -0,0 +1,142 @@
+from typing import Self
+from modules.logger import Logger
+from modules.iterator import Iterator, Line
+import modules.errors as errors
+import hashlib
+import json
+import os
+import tempfile
+
+class CodeCache:
+	DIR_NAME: str = "__syntcache__"
+	EXTENSION: str = ".json"
+	FORMAT: int = 2
+
+	ENABLED: bool = True
+
+	version: dict = {}
+
+	logger: Logger = None
+	iterator: Iterator = None
+
+	def __init__(self: Self, logger: Logger = None, iterator: Iterator = None) -> None:
+		"""
+		On-disk cache of iterated source files
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if not iterator: self.logger.error("Iterator missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+		if iterator: self.iterator = iterator
+
+		return None
+
+	def get_cache_path(self: Self, source_path: str = None) -> str|None:
+		"""
+		Gets the cache file path of a source file
+		"""
+
+		if not source_path: return None
+
+		source_dir, source_name = os.path.split(os.path.abspath(source_path))
+		return os.path.join(source_dir, self.DIR_NAME, source_name + self.EXTENSION)
+
+	def get_key(self: Self, source_code: str = "") -> str:
+		"""
+		Gets the key that a cached entry must match to be valid
+		"""
+
+		rules = {
+			"TERMINAL_CHARS": self.iterator.TERMINAL_CHARS,
+			"INDENT_CHARS": self.iterator.INDENT_CHARS
+		}
+		key_data = json.dumps([self.FORMAT, self.version, rules, source_code], sort_keys=True)
+
+		return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+	def load(self: Self, source_path: str = None, source_code: str = "") -> list|None:
+		"""
+		Loads iterated code of a source file if the cache entry is valid
+		"""
+
+		if not self.ENABLED: return None
+		cache_path = self.get_cache_path(source_path)
+		if not cache_path or not os.path.isfile(cache_path): return None
+
+		try:
+			with open(cache_path, "r", encoding="utf-8") as cache_file:
+				entry = json.load(cache_file)
+		except (OSError, ValueError, RecursionError):
+			return None
+
+		if not isinstance(entry, dict): return None
+		if entry.get("key") != self.get_key(source_code): return None
+		if not isinstance(entry.get("chunks"), list): return None
+
+		chunks = entry["chunks"]
+		places = self.get_line_places(chunks)
+		lines = entry.get("lines")
+		if not isinstance(lines, list) or len(lines) != len(places): return None
+
+		for (level, index), number in zip(places, lines): level[index] = Line(level[index], number)
+
+		return chunks
+
+	def save(self: Self, source_path: str = None, source_code: str = "",
+			chunks: list = []
+		) -> None:
+		"""
+		Atomically writes iterated code of a source file to the cache
+		"""
+
+		if not self.ENABLED: return None
+		cache_path = self.get_cache_path(source_path)
+		if not cache_path: return None
+
+		lines = [getattr(level[index], "number", 0) for level, index in self.get_line_places(chunks)]
+		entry = {"key": self.get_key(source_code), "chunks": chunks, "lines": lines}
+		cache_dir = os.path.dirname(cache_path)
+		temp_path = None
+
+		try:
+			os.makedirs(cache_dir, exist_ok=True)
+			temp_fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+			with os.fdopen(temp_fd, "w", encoding="utf-8") as temp_file:
+				json.dump(entry, temp_file, separators=(",", ":"))
+
+			os.chmod(temp_path, 0o644)
+			os.replace(temp_path, cache_path)
+		except (OSError, RecursionError):
+			if temp_path and os.path.isfile(temp_path): os.remove(temp_path)
+
+		return None
+
+	def get_line_places(self: Self, chunks: list = []) -> list[tuple[list, int]]:
+		"""
+		Gets where the texts of iterated code are, in the order their line numbers
+		are cached in
+		"""
+
+		places = []
+		pending = [chunks]
+		while pending:
+			level = pending.pop()
+			for index, item in enumerate(level):
+				if type(item) == list: pending.append(item)
+				else: places.append((level, index))
+
+		return places
+
+	def iterate(self: Self, source_path: str = None, source_code: str = "") -> list:
+		"""
+		Gets iterated code of a source file from cache, iterating it on a miss
+		"""
+
+		chunks = self.load(source_path, source_code)
+		if not isinstance(chunks, type(None)): return chunks
+
+		chunks = self.iterator.iterate(source_code)
+		if chunks and not self.iterator.has_errors: self.save(source_path, source_code, chunks)
+
+		return chunks
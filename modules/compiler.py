@@ -0,0 +1,503 @@
+from typing import Self, Callable
+from modules.logger import Logger
+from modules.runtime import Runtime
+from modules.nodes import Node, Literal, Reference, Call
+from modules.scope import Scope
+from modules.components.context import MemoryObject, Structure
+from functools import partial
+import modules.opcodes as opcodes
+import modules.errors as errors
+
+class Code:
+	name: str = ""
+	instructions: list[tuple[int, any]] = []
+
+	def __init__(self: Self, name: str = "") -> None:
+		"""
+		Compiled instruction stream of a chunk tree
+		"""
+
+		self.name = name
+		self.instructions = []
+
+		return None
+
+	def emit(self: Self, op: int, arg: any = None) -> int:
+		"""
+		Appends an instruction and returns its position
+		"""
+
+		self.instructions.append((op, arg))
+		return len(self.instructions) - 1
+
+	def patch(self: Self, position: int, arg: any = None) -> None:
+		"""
+		Replaces the argument of an emitted instruction
+		"""
+
+		self.instructions[position] = (self.instructions[position][0], arg)
+		return None
+
+	def disassemble(self: Self) -> str:
+		"""
+		Human readable listing of the instructions
+		"""
+
+		lines = [f"--- {self.name or '<main>'} ---"]
+		for position, (op, arg) in enumerate(self.instructions):
+			lines.append(f"{position:>5} {opcodes.NAMES[op]:<14} {arg!r}")
+
+		return "\n".join(lines)
+
+class Compiler:
+	DEFERRED: MemoryObject = MemoryObject("--deferred--")
+
+	STRUCTURES: dict[str, str] = {
+		"Comments.ignore": "compile_ignore",
+		"Logic.condition": "compile_condition",
+		"Loops.repeat": "compile_repeat",
+		"Loops.forever": "compile_forever",
+		"Loops.withdraw": "compile_withdraw",
+		"Variable.algorithm": "compile_algorithm",
+		"Variable.result": "compile_result"
+	}
+
+	logger: Logger = None
+	runtime: Runtime = None
+	pending: list[Node|Callable] = []
+
+	def __init__(self: Self, logger: Logger = None, runtime: Runtime = None) -> None:
+		"""
+		Lowers iterated chunk trees into instruction streams
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if not runtime: self.logger.error("Runtime missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+		if runtime: self.runtime = runtime
+		self.pending = []
+
+		return None
+
+	def compile(self: Self, chunks: list = [], name: str = "", *,
+			scope: Scope|None = None
+		) -> Code:
+		"""
+		Compiles a chunk tree into code
+		"""
+
+		code = Code(name)
+		self.compile_block(code, self.runtime.prepare(chunks), [], scope)
+		code.emit(opcodes.RETURN)
+
+		return code
+
+	def get_structure(self: Self, name: str = "") -> Structure|None:
+		"""
+		Gets the structure bound to a name at compile time
+		"""
+
+		obj = self.runtime.memory.get(name)
+		if isinstance(obj, MemoryObject) and obj.type == Structure: return obj
+
+		return None
+
+	def constant_params(self: Self, store: str = "") -> list[MemoryObject]|None:
+		"""
+		Evaluates structure parameters that never read variables
+		"""
+
+		params = self.runtime.get_params(store)
+		if any(type(param) == Call for param in params): return None
+
+		return self.runtime.evaluate_args(params, no_var = True)
+
+	def compile_block(self: Self, code: Code, nodes: list[Node], blocks: list,
+			scope: Scope|None
+		) -> None:
+		"""
+		Compiles nodes that run as statements, nested blocks from a work stack
+		"""
+
+		outer = self.pending
+		pending = self.pending = list(reversed(nodes or []))
+
+		try:
+			while pending:
+				item = pending.pop()
+				if type(item) == Call: self.compile_statement(code, item, blocks, scope); continue
+				if callable(item): item(); continue
+
+				code.emit(opcodes.INSPECT, (item.source, self.get_slot(scope, item.source)))
+		finally:
+			self.pending = outer
+
+		return None
+
+	def defer_block(self: Self, nodes: list[Node], *steps: Callable) -> None:
+		"""
+		Schedules the nodes of a nested block, followed by steps that close it
+		"""
+
+		self.pending.extend(reversed(steps))
+		self.pending.extend(reversed(nodes or []))
+
+		return None
+
+	def patch_target(self: Self, code: Code, position: int, *prefix) -> None:
+		"""
+		Points an emitted jump at the next instruction
+		"""
+
+		target = len(code.instructions)
+		code.patch(position, (*prefix, target) if prefix else target)
+
+		return None
+
+	def compile_statement(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> None:
+		"""
+		Compiles a single statement node
+		"""
+
+		structure = self.get_structure(node.name)
+
+		if not structure:
+			self.compile_call(code, node, scope, push = False)
+			return None
+
+		native = self.STRUCTURES.get(getattr(structure.task, "__qualname__", None))
+		if native and getattr(self, native)(code, node, blocks, scope):
+			return None
+
+		self.compile_fallback(code, node, blocks)
+		return None
+
+	def compile_fallback(self: Self, code: Code, node: Call, blocks: list) -> None:
+		"""
+		Compiles a structure the runtime runs, with exits for signals it lets through
+		"""
+
+		position = code.emit(opcodes.STRUCTURE, None)
+		exits = None
+		if blocks:
+			skip = code.emit(opcodes.JUMP, None)
+			exits = len(code.instructions)
+			for level in range(1, len(blocks) + 1): self.exit_blocks(code, blocks, level)
+			code.patch(skip, len(code.instructions))
+
+		code.patch(position, (node.name, node.store, node.args, False, exits, len(blocks), node.line))
+		return None
+
+	def compile_call(self: Self, code: Code, node: Call, scope: Scope|None = None, *,
+			push: bool = True, fail_msg: str|None = None, tail: bool = False
+		) -> None:
+		"""
+		Compiles an algorithm call and its arguments, nested calls from a work stack
+		"""
+
+		pending = [("call", node, push, fail_msg, tail)]
+
+		while pending:
+			item = pending.pop()
+			if item[0] == "emit": code.emit(item[1], item[2]); continue
+			if item[0] == "expression":
+				item = self.expression_item(code, item[1], scope)
+				if isinstance(item, type(None)): continue
+
+			_, node, push, fail_msg, tail = item
+			name, store = node.name, node.store
+			store_slot = self.get_slot(scope, store)
+			operands = self.simple_operands(node.args, scope)
+			if not isinstance(operands, type(None)):
+				argc = len(operands)
+				site = [None, None]
+				call = (
+					name, store, argc, push, 0, node.args, fail_msg, operands, site, store_slot, tail,
+					node.line
+				)
+				code.emit(opcodes.CALL_BUILTIN, (name, store, push, operands, site, store_slot, call))
+				continue
+
+			items = []
+			deferred = []
+			for arg in node.args:
+				if type(arg) == Call and arg.deferred:
+					items.append(("emit", opcodes.LOAD_CONST, self.DEFERRED))
+					deferred.append(arg)
+					continue
+
+				items.append(("expression", arg))
+
+			for arg in deferred:
+				items.append(("call", arg, True, f"Undefined value: {arg.source}", False))
+
+			argc = len(node.args)
+			items.append(("emit", opcodes.CALL, (
+				name, store, argc, push, len(deferred), node.args, fail_msg, None, [None, None], store_slot,
+				tail, node.line
+			)))
+			pending.extend(reversed(items))
+
+		return None
+
+	def get_slot(self: Self, scope: Scope|None = None, name: str = "") -> int|None:
+		"""
+		Gets the local slot of a name, if compiling an algorithm body
+		"""
+
+		if isinstance(scope, type(None)) or not name: return None
+		return scope.slot(name)
+
+	def simple_operands(self: Self, args: list[Node] = [], scope: Scope|None = None) -> tuple|None:
+		"""
+		Gets arguments that are all constants or names as inline operands
+		"""
+
+		operands = []
+		for arg in args:
+			if type(arg) == Literal: operands.append((None, None, arg.value)); continue
+			if type(arg) == Reference:
+				operands.append((arg.name, self.get_slot(scope, arg.name), None))
+				continue
+
+			return None
+
+		return tuple(operands)
+
+	def compile_expression(self: Self, code: Code, node: Node, scope: Scope|None = None) -> None:
+		"""
+		Compiles a node that is evaluated as an argument
+		"""
+
+		item = self.expression_item(code, node, scope)
+		if not isinstance(item, type(None)):
+			_, node, push, fail_msg, tail = item
+			self.compile_call(code, node, scope, push = push, fail_msg = fail_msg, tail = tail)
+
+		return None
+
+	def expression_item(self: Self, code: Code, node: Node, scope: Scope|None = None) -> tuple|None:
+		"""
+		Compiles a leaf argument node, or gets the call item it needs to be compiled as
+		"""
+
+		if type(node) == Literal:
+			code.emit(opcodes.LOAD_CONST, node.value)
+			return None
+
+		if type(node) == Reference:
+			slot = self.get_slot(scope, node.name)
+			if isinstance(slot, type(None)): code.emit(opcodes.LOAD_NAME, node.name)
+			else: code.emit(opcodes.LOAD_FAST, (slot, node.name))
+			return None
+
+		if self.get_structure(node.name):
+			code.emit(opcodes.STRUCTURE, (node.name, node.store, node.args, True, None, 0, node.line))
+			return None
+
+		fail_msg = f"Undefined value: {node.source}"
+		if not node.deferred: fail_msg = f"Undefined algorithm: {node.source}"
+
+		return ("call", node, True, fail_msg, False)
+
+	def exit_blocks(self: Self, code: Code, blocks: list, level: int) -> None:
+		"""
+		Emits a jump out of the innermost blocks up to given level
+		"""
+
+		exited = blocks[len(blocks) - level:]
+		loop_count = len([block for block in exited if block[0]])
+		position = code.emit(opcodes.EXIT, (loop_count, None))
+		exited[0][1].append(position)
+
+		return None
+
+	def open_block(self: Self, blocks: list, is_loop: bool = False) -> list:
+		"""
+		Opens a block whose exits are patched when it closes
+		"""
+
+		block = [is_loop, []]
+		blocks.append(block)
+
+		return block
+
+	def close_block(self: Self, code: Code, blocks: list) -> None:
+		"""
+		Closes the innermost block and patches its exits
+		"""
+
+		block = blocks.pop()
+		target = len(code.instructions)
+		for position in block[1]:
+			loop_count = code.instructions[position][1][0]
+			code.patch(position, (loop_count, target))
+
+		return None
+
+	def compile_ignore(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Comments compile to nothing
+		"""
+
+		return True
+
+	def compile_condition(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `if` into a conditional jump
+		"""
+
+		params = self.runtime.get_params(node.store)
+		if any(type(param) == Call for param in params): return False
+
+		if not params:
+			code.emit(opcodes.ERROR, ("Conditional Binary Required", errors.ARG_MISSING_ERROR))
+			return True
+
+		if all(type(param) == Literal for param in params):
+			if not all(param.value.to_binary() for param in params): return True
+
+			self.open_block(blocks)
+			self.defer_block(node.args, partial(self.close_block, code, blocks))
+			return True
+
+		for param in params: self.compile_expression(code, param, scope)
+		jump = code.emit(opcodes.JUMP_IF_FALSE, (len(params), None))
+
+		self.open_block(blocks)
+		self.defer_block(node.args,
+			partial(self.close_block, code, blocks),
+			partial(self.patch_target, code, jump, len(params))
+		)
+
+		return True
+
+	def compile_loop(self: Self, code: Code, amount: int|None, var: str|None,
+			nodes: list[Node], blocks: list, scope: Scope|None
+		) -> None:
+		"""
+		Compiles a counted or endless loop
+		"""
+
+		code.emit(opcodes.SETUP_LOOP, (amount, var, self.get_slot(scope, var)))
+		start = code.emit(opcodes.FOR_ITER, None)
+
+		self.open_block(blocks, True)
+		self.defer_block(nodes,
+			partial(code.emit, opcodes.JUMP, start),
+			partial(self.patch_target, code, start),
+			partial(code.emit, opcodes.POP_LOOP),
+			partial(self.close_block, code, blocks)
+		)
+
+		return None
+
+	def compile_repeat(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `repeat` into a loop
+		"""
+
+		params = self.constant_params(node.store)
+		if isinstance(params, type(None)): return False
+
+		amount = params[0].to_number() if params else None
+		var = params[1].to_text() if len(params) > 1 else None
+		self.compile_loop(code, amount, var, node.args, blocks, scope)
+
+		return True
+
+	def compile_forever(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `forever` into an endless loop
+		"""
+
+		params = self.constant_params(node.store)
+		if isinstance(params, type(None)): return False
+
+		var = params[0].to_text() if params else None
+		self.compile_loop(code, None, var, node.args, blocks, scope)
+
+		return True
+
+	def compile_withdraw(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `withdraw` into a jump out of enclosing blocks
+		"""
+
+		params = self.constant_params(node.store)
+		if isinstance(params, type(None)): return False
+
+		exit_count = params[0].to_number() if params else 1
+		if exit_count < 0:
+			error = ("Proccess Level can not be negative", errors.OUT_OF_BOUND_ERROR)
+			code.emit(opcodes.ERROR, error)
+			return True
+
+		levels = len(blocks) if isinstance(scope, type(None)) else len(blocks) + 1
+		if levels < exit_count:
+			error = ("Can not exit from non existent process", errors.OUT_OF_BOUND_ERROR)
+			code.emit(opcodes.ERROR, error)
+			return True
+
+		if exit_count > len(blocks): code.emit(opcodes.RETURN); return True
+		if exit_count: self.exit_blocks(code, blocks, exit_count)
+		return True
+
+	def compile_algorithm(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `alg` into an algorithm definition with a precompiled body
+		"""
+
+		params = self.constant_params(node.store)
+		if isinstance(params, type(None)): return False
+
+		if not params:
+			code.emit(opcodes.ERROR, ("Algorithm name required", errors.ARG_MISSING_ERROR))
+			return True
+
+		alg_name = params[0].to_text()
+		args_collection_name = params[1].to_text() if len(params) > 1 else None
+		alg_scope = self.runtime.create_scope(node.args, args_collection_name)
+		body = self.compile(node.args, alg_name, scope = alg_scope)
+		code.emit(opcodes.MAKE_ALG, (alg_name, args_collection_name, node.args, body, alg_scope))
+
+		return True
+
+	def compile_result(self: Self, code: Code, node: Call, blocks: list,
+			scope: Scope|None
+		) -> bool:
+		"""
+		Compiles `result` into setting the return value and returning
+		"""
+
+		if isinstance(scope, type(None)):
+			error = ("Cannot result out of an algorithm", errors.OUT_OF_BOUND_ERROR)
+			code.emit(opcodes.ERROR, error)
+			return True
+
+		tail = node.args[0] if len(node.args) == 1 else None
+		if type(tail) == Call and not tail.deferred and not self.get_structure(tail.name):
+			fail_msg = f"Undefined algorithm: {tail.source}"
+			self.compile_call(code, tail, scope, fail_msg = fail_msg, tail = True)
+		else:
+			for arg in node.args: self.compile_expression(code, arg, scope)
+
+		code.emit(opcodes.SET_RESULT, len(node.args))
+		code.emit(opcodes.RETURN)
+
+		return True
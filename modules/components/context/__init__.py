@@ -1,4 +1,5 @@
 from modules.components.context.memory import MemoryObject
+from modules.components.context.memo import Memo
 from modules.components.context.algorithm import Algorithm
 from modules.components.context.void import Void
 from modules.components.context.text import Text
@@ -6,6 +7,7 @@ from modules.components.context.number import Number
 from modules.components.context.decimal import Decimal
 from modules.components.context.binary import Binary
 from modules.components.context.collection import Collection
+from modules.components.context.array import Array
 from modules.components.context.module import Module
 from modules.components.context.kv_packet import KVPacket
 from modules.components.context.structure import Structure
\ No newline at end of file
@@ -2,16 +2,22 @@ from typing import Self, Callable
 from modules.components.context.memory import MemoryObject
 from modules.components.context.void import Void
 from modules.components.context.collection import Collection
+from modules.components.context.memo import Memo
+from modules.signals import Withdraw, Return, TailCall
 
 class Algorithm(MemoryObject):
-	code: Callable|str|None = None
+	code: Callable|list|str|None = None
 	args_collection_name: str|None = None
+	bytecode: any = None
+	scope: any = None
+	compiled: bool = False
 	rich_data: bool = False
 	help_data: str = ""
+	memo: Memo|None = None
 
 	def __init__(self: Self,
 			name: str|None = None,
-			code: Callable|str|None = None,
+			code: Callable|list|str|None = None,
 			help_data: str = "",
 			rich_data: bool = False,
 			need_engine: bool = False,
@@ -40,7 +46,7 @@ class Algorithm(MemoryObject):
 
 		calculated_args = []
 		for arg in args:
-			if not isinstance(arg, list): calculated_args.append(arg); continue
+			if isinstance(arg, MemoryObject): calculated_args.append(arg); continue
 			data = engine.run_chunk(arg)
 			calculated_args.append(data)
 			
@@ -55,31 +61,79 @@ class Algorithm(MemoryObject):
 			else:
 				return_value = self.code(*calculated_args)
 			
-			if isinstance(return_value, type(None)): return Void()
+			if isinstance(return_value, type(None)): return Void.of()
 			return return_value
 		
-		iterated_code = engine.iterator.iterate(self.code)
-		old_variable = None
-		if self.args_collection_name:
-			if self.args_collection_name in engine.memory:
-				old_variable = engine.memory[self.args_collection_name]
+		memos = []
+		if self.memo:
+			memo_key = self.memo.key(calculated_args)
+			if not isinstance(memo_key, type(None)):
+				cached = self.memo.get(memo_key)
+				if not isinstance(cached, type(None)): return cached
+				memos.append((self.memo, memo_key))
+
+		alg = self
+		while True:
+			if not alg.compiled: alg.compile(engine)
+			frame = engine.push_frame(alg)
+			if alg.args_collection_name:
+				frame.slots[frame.scope.slot(alg.args_collection_name)] = Collection(
+					name = f"--args--{alg.name}",
+					value = calculated_args
+				)
 			
-			engine.memory[self.args_collection_name] = Collection(
-				name = f"--args--{self.name}",
-				value = args
-			)
-		
-		engine.return_cache = Void()
-		engine.run(iterated_code)
-		return_data = engine.return_cache
-		engine.__delattr__("return_cache")
+			try:
+				engine.run(alg.code)
+			except Return as signal:
+				frame.result = signal.value
+			except TailCall as signal:
+				alg = signal.alg
+				if engine.profiler:
+					engine.profiler.exit()
+					engine.profiler.enter(engine.profiler.ALGORITHM, alg.name, signal.line)
+
+				calculated_args = []
+				for arg in signal.args:
+					if isinstance(arg, MemoryObject): calculated_args.append(arg); continue
+					calculated_args.append(engine.run_chunk(arg))
+
+				memo_key = alg.memo.key(calculated_args) if alg.memo else None
+				if isinstance(memo_key, type(None)): continue
+
+				cached = alg.memo.get(memo_key)
+				if isinstance(cached, type(None)):
+					memos.append((alg.memo, memo_key))
+					continue
+
+				frame.result = cached
+			except Withdraw:
+				pass
+			finally:
+				engine.pop_frame()
+
+			break
 
-		if self.args_collection_name:
-			del engine.memory[self.args_collection_name]
-			if old_variable:
-				engine.memory[self.args_collection_name] = old_variable
+		result = frame.result
+		if isinstance(result, type(None)): result = Void.of()
+		for memo, memo_key in memos: memo.put(memo_key, result)
 
-		return return_data
+		return result
+	
+	def compile(self: Self, engine = None) -> None:
+		"""
+		Compiles text code or iterated chunks into prepared nodes once
+		"""
+
+		if callable(self.code) or not self.code or not engine: return None
+		if isinstance(self.code, str): self.code = engine.iterator.iterate(self.code)
+
+		self.code = engine.prepare(self.code)
+		self.value = self.code
+		self.scope = engine.create_scope(self.code, self.args_collection_name)
+		self.bytecode = None
+		self.compiled = True
+
+		return None
 	
 	def to_text(self: Self) -> str:
 		return self.name if self.name else ""
@@ -0,0 +1,103 @@
+from typing import Self
+from array import array
+from modules.components.context.memory import MemoryObject
+from modules.components.context.text import Text
+from modules.components.context.number import Number
+from modules.components.context.decimal import Decimal
+from modules.components.context.binary import Binary
+from modules.components.context.collection import Collection
+
+class Array(MemoryObject):
+	value: array = array("q")
+	connector: Text = Text(None, "")
+
+	def __init__(self: Self,
+			name: str|None = None,
+			value: array|list[int|float]|None = None,
+			connector: Text = Text(None, "")
+		) -> None:
+		"""
+		Array type memory object, numbers packed contiguously as integers or decimals
+		"""
+
+		if not isinstance(value, array):
+			value = Array.pack(value if value else [])
+
+		super().__init__(name, Array, value)
+		self.connector = connector
+		if type(connector) == str:
+			self.connector = Text(f"--{name}-connector--", connector)
+
+		return None
+	
+	@staticmethod
+	def pack(values: list[int|float]) -> array:
+		"""
+		Packs numbers into an integer array, or a decimal array if any of them is not an integer
+		"""
+
+		if all(type(value) == int for value in values):
+			try:
+				return array("q", values)
+			except OverflowError:
+				pass
+		
+		return array("d", values)
+	
+	@staticmethod
+	def collect(objects: list[MemoryObject]) -> list[int|float]:
+		"""
+		Gets the numbers of objects, unpacking collections and arrays among them
+		"""
+
+		values: list[int|float] = []
+		for obj in objects:
+			if obj.type == Array:
+				values.extend(obj.value)
+				continue
+			
+			for item in (obj.value if obj.type == Collection else [obj]):
+				if item.type in (Number, Binary): values.append(item.to_number())
+				else: values.append(item.to_decimal())
+		
+		return values
+	
+	def to_number(self: Self) -> int:
+		"""
+		Convert object value to Number
+		"""
+
+		return int(len(self.value))
+	
+	def to_decimal(self: Self) -> float:
+		"""
+		Convert object value to Decimal
+		"""
+
+		return float(len(self.value))
+	
+	def to_binary(self: Self) -> bool:
+		"""
+		Convert object value to Binary
+		"""
+
+		return bool(len(self.value))
+	
+	def to_text(self: Self) -> str:
+		"""
+		Convert object value to Text
+		"""
+
+		return self.connector.to_text().join([str(v) for v in self.value])
+	
+	def get(self: Self, key: MemoryObject) -> Number|Decimal|None:
+		"""
+		Get number at its position in array
+		"""
+
+		position = key.value
+		if type(position) not in (int, float, bool) or position != int(position): return None
+		if not 0 <= position < len(self.value): return None
+
+		if self.value.typecode == "d": return Decimal(None, self.value[int(position)])
+		return Number(None, self.value[int(position)])
@@ -2,7 +2,9 @@ from typing import Self
 from modules.components.context.memory import MemoryObject
 
 class Binary(MemoryObject):
-	value: bool = False
+	__slots__ = ()
+	value: bool
+	interned: dict[bool, "Binary"] = {}
 
 	def __init__(self: Self,
 			name: str|None = None,
@@ -16,6 +18,13 @@ class Binary(MemoryObject):
 
 		return None
 	
+	def to_binary(self: Self) -> bool:
+		"""
+		Convert object value to Binary
+		"""
+
+		return self.value
+	
 	def to_text(self: Self) -> str:
 		"""
 		Convert object value to string
@@ -36,4 +45,15 @@ class Binary(MemoryObject):
 		"""
 
 		return 1.0 if self.value else 0.0
+	
+	@staticmethod
+	def of(value: bool = False) -> "Binary":
+		"""
+		Gets the shared unnamed TRUE or FALSE
+		"""
+
+		return Binary.interned[bool(value)]
+
+Binary.interned[True] = Binary(None, True)
+Binary.interned[False] = Binary(None, False)
 
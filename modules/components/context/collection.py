@@ -6,32 +6,41 @@ from modules.components.context.number import Number
 class Collection(MemoryObject):
 	value: list = []
 	index: list = []
+	positions: dict = {}
 	connector: Text = Text(None, "")
 
 	def __init__(self: Self,
 			name: str|None = None,
-			value: list[MemoryObject] = [],
-			index: list[MemoryObject] = [],
+			value: list[MemoryObject]|None = None,
+			index: list[MemoryObject]|None = None,
 			connector: Text = Text(None, "")
 		) -> None:
 		"""
 		Collection type memory object
 		"""
 
+		value = list(value) if value else []
 		super().__init__(name, Collection, value)
-		self.index = index
+		self.index = list(index) if index else []
+		self.positions = {}
 		self.connector = connector
 		if type(connector) == str:
 			self.connector = Text(f"--{name}-connector--", connector)
 		
-		if len(index) < len(value):
-			itr_index = 0
-			for _ in range(len(value) - len(index)):
-				while itr_index in [i.value for i in self.index]:
-					itr_index += 1
-				
-				self.index.append(Number(None, itr_index))
+		for position, key in enumerate(self.index):
+			try:
+				self.positions.setdefault(key.value, position)
+			except TypeError:
+				continue
+		
+		itr_index = 0
+		for position in range(len(self.index), len(value)):
+			while itr_index in self.positions:
 				itr_index += 1
+			
+			self.index.append(Number(None, itr_index))
+			self.positions[itr_index] = position
+			itr_index += 1
 
 		return None
 	
@@ -68,8 +77,13 @@ class Collection(MemoryObject):
 		Get object from its key in collection
 		"""
 
-		for index, value in zip(self.index, self.value):
-			if index.value == key.value: return value
+		try:
+			position = self.positions.get(key.value)
+		except TypeError:
+			for index, value in zip(self.index, self.value):
+				if index.value == key.value: return value
 
-		return None
+			return None
 
+		if isinstance(position, type(None)) or position >= len(self.value): return None
+		return self.value[position]
@@ -2,7 +2,8 @@ from typing import Self
 from modules.components.context.memory import MemoryObject
 
 class Decimal(MemoryObject):
-	value: float = 0.0
+	__slots__ = ()
+	value: float
 
 	def __init__(self: Self,
 			name: str|None = None,
@@ -0,0 +1,77 @@
+from typing import Self
+from collections import OrderedDict
+from modules.components.context.memory import MemoryObject
+from modules.components.context.void import Void
+from modules.components.context.text import Text
+from modules.components.context.number import Number
+from modules.components.context.decimal import Decimal
+from modules.components.context.binary import Binary
+
+class Memo:
+	SIZE: int = 1024
+	KEY_TYPES: tuple[type] = (Number, Decimal, Text, Binary, Void)
+
+	size: int = SIZE
+	results: OrderedDict = OrderedDict()
+	hits: int = 0
+	misses: int = 0
+
+	def __init__(self: Self, size: int = SIZE) -> None:
+		"""
+		Results of an algorithm keyed on its argument values, evicting the least
+		recently used result once `size` results are kept(0 keeps every result)
+		"""
+
+		self.size = size
+		self.results = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+		return None
+	
+	def key(self: Self, args: list[MemoryObject] = []) -> tuple|None:
+		"""
+		Gets the key of given arguments, None if any of them can not be keyed by value
+		"""
+
+		key = []
+		for arg in args:
+			if arg.type not in self.KEY_TYPES: return None
+			key.append((arg.type, arg.value))
+
+		return tuple(key)
+	
+	def get(self: Self, key: tuple = ()) -> MemoryObject|None:
+		"""
+		Gets the result kept for a key, None if it is not kept
+		"""
+
+		result = self.results.get(key)
+		if isinstance(result, type(None)): self.misses += 1; return None
+
+		self.results.move_to_end(key)
+		self.hits += 1
+
+		return result
+	
+	def put(self: Self, key: tuple = (), result: MemoryObject = None) -> None:
+		"""
+		Keeps the result of a key
+		"""
+
+		self.results[key] = result
+		self.results.move_to_end(key)
+		if self.size and len(self.results) > self.size: self.results.popitem(last = False)
+
+		return None
+	
+	def clear(self: Self) -> None:
+		"""
+		Drops kept results and resets counters
+		"""
+
+		self.results.clear()
+		self.hits = 0
+		self.misses = 0
+
+		return None
@@ -1,9 +1,10 @@
 from typing import Self
 
 class MemoryObject:
-	name: str|None = None
-	type: any = None
-	value: any = None
+	__slots__ = ("name", "type", "value")
+	name: str|None
+	type: any
+	value: any
 	help_data: str = "A Memory Object"
 
 	def __init__(self: Self,
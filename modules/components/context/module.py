@@ -9,6 +9,7 @@ class Module(MemoryObject):
 	structure_functions: list[Callable] = []
 	simple_data_functions: list[Callable] = []
 	engine_functions: list[Callable] = []
+	wait_time: int = 0
 
 	def __init__(self: Self,
 			name: str|None = None,
@@ -2,7 +2,9 @@ from typing import Self
 from modules.components.context.memory import MemoryObject
 
 class Number(MemoryObject):
-	value: int = 0
+	__slots__ = ()
+	value: int
+	interned: dict[int, "Number"] = {}
 
 	def __init__(self: Self,
 			name: str|None = None,
@@ -22,4 +24,18 @@ class Number(MemoryObject):
 		"""
 		
 		return bool(self.value)
+	
+	@staticmethod
+	def of(value: int = 0) -> "Number":
+		"""
+		Gets an unnamed Number, shared for small integers
+		"""
+
+		number = Number.interned.get(value)
+		if number and type(value) == int: return number
+
+		return Number(None, value)
+
+for integer in range(-5, 257):
+	Number.interned[integer] = Number(None, integer)
 
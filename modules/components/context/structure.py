@@ -3,12 +3,13 @@ from modules.components.context.memory import MemoryObject
 from modules.components.context.void import Void
 
 class Structure(MemoryObject):
-	task: Callable|str|None = None
+	task: Callable|list|str|None = None
 	help_data: str = ""
+	compiled: bool = False
 
 	def __init__(self: Self,
 			name: str|None = None,
-			task: str|None = None,
+			task: Callable|list|str|None = None,
 			help_data: str = "",
 		) -> None:
 		"""
@@ -26,16 +27,30 @@ class Structure(MemoryObject):
 		Run structure
 		"""
 
-		if not self.task: return Void()
+		if not self.task: return Void.of()
 		if callable(self.task):
 			self.task(engine, code, run_data)
 
-			return Void()
+			return Void.of()
 		
-		iterated_code = engine.iterator.iterate(self.task)
-		engine.run(iterated_code)
+		if not self.compiled: self.compile(engine)
+		engine.run(self.task)
 
-		return Void()
+		return Void.of()
+	
+	def compile(self: Self, engine = None) -> None:
+		"""
+		Compiles text task or iterated chunks into prepared nodes once
+		"""
+
+		if callable(self.task) or not self.task or not engine: return None
+		if isinstance(self.task, str): self.task = engine.iterator.iterate(self.task)
+
+		self.task = engine.prepare(self.task)
+		self.value = self.task
+		self.compiled = True
+
+		return None
 	
 	def to_text(self: Self) -> str:
 		return self.name if self.name else ""
@@ -1,8 +1,44 @@
 from typing import Self
+from functools import lru_cache
 from modules.components.context.memory import MemoryObject
 
+@lru_cache(maxsize = 1024)
+def text_to_number(value: str) -> int:
+	"""
+	Converts a text value to Number, its length if it is not numeric
+	"""
+
+	if not all([ch in "-0123456789.," for ch in str(value)]) or not value:
+		return len(value)
+	
+	if str(value).count("-") > 1: return len(value)
+	
+	if not (str(value).startswith("-") if "-" in value else True):
+		return len(value)
+	
+	if value.count(".") > 1: return len(value)
+	return int(float(str(value).replace(",", "")))
+
+@lru_cache(maxsize = 1024)
+def text_to_decimal(value: str) -> float:
+	"""
+	Converts a text value to Decimal, its length if it is not numeric
+	"""
+
+	if not all([ch in "0123456789.," for ch in str(value)]) or not value:
+		return float(len(value))
+	
+	if str(value).count("-") > 1: return float(len(value))
+	
+	if not (str(value).startswith("-") if "-" in value else True):
+		return float(len(value))
+	
+	if value.count(".") > 1: return float(len(value))
+	return float(str(value).replace(",", ""))
+
 class Text(MemoryObject):
-	value: str = ""
+	__slots__ = ()
+	value: str
 
 	def __init__(self: Self,
 			name: str|None = None,
@@ -21,30 +57,11 @@ class Text(MemoryObject):
 		Convert object value to Number
 		"""
 
-		if not all([ch in "-0123456789.," for ch in str(self.value)]) or not self.value:
-			return len(self.value)
-		
-		if str(self.value).count("-") > 1: return len(self.value)
-		
-		if not (str(self.value).startswith("-") if "-" in self.value else True):
-			return len(self.value)
-		
-		if self.value.count(".") > 1: return len(self.value)
-		return int(float(str(self.value).replace(",", "")))
+		return text_to_number(self.value)
 	
 	def to_decimal(self: Self) -> float:
 		"""
 		Convert object value to Decimal
 		"""
 
-		if not all([ch in "0123456789.," for ch in str(self.value)]) or not self.value:
-			return float(len(self.value))
-		
-		if str(self.value).count("-") > 1: return float(len(self.value))
-		
-		if not (str(self.value).startswith("-") if "-" in self.value else True):
-			return float(len(self.value))
-		
-		if self.value.count(".") > 1: return float(len(self.value))
-		return float(str(self.value).replace(",", ""))
-
+		return text_to_decimal(self.value)
@@ -2,6 +2,9 @@ from typing import Self
 from modules.components.context.memory import MemoryObject
 
 class Void(MemoryObject):
+	__slots__ = ()
+	interned: dict[None, "Void"] = {}
+
 	def __init__(self: Self,
 			name: str|None = None,
 		) -> None:
@@ -26,4 +29,14 @@ class Void(MemoryObject):
 		"""
 
 		return 0.0
+	
+	@staticmethod
+	def of() -> "Void":
+		"""
+		Gets the shared unnamed Void
+		"""
+
+		return Void.interned[None]
+
+Void.interned[None] = Void()
 
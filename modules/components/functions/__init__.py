@@ -1,6 +1,7 @@
 from typing import Self, Callable
 from modules.logger import Logger
 import modules.errors as errors
+import time
 from modules.components.context import Module, Algorithm, Structure
 from modules.components.functions.comments import Comments
 from modules.components.functions.io import IO
@@ -8,6 +9,7 @@ from modules.components.functions.variables import Variable
 from modules.components.functions.system import System
 from modules.components.functions.operations import Operations
 from modules.components.functions.maths import Maths
+from modules.components.functions.statistics import Statistics
 from modules.components.functions.loops import Loops
 from modules.components.functions.logic import Logic
 
@@ -18,6 +20,7 @@ class Modules:
 	simple_data_functions: list[Callable] = []
 	engine_functions: list[Callable] = []
 	algorithms: dict[str, Algorithm] = {}
+	load_time: int = 0
 
 	logger: Logger = None
 
@@ -30,6 +33,14 @@ class Modules:
 		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
 		if logger: self.logger = logger
 
+		self.activated_modules = []
+		self.functions = []
+		self.structure_functions = []
+		self.simple_data_functions = []
+		self.engine_functions = []
+		self.algorithms = {}
+
+		start_time = time.perf_counter_ns()
 		for module in modules:
 			self.activated_modules.append(module(logger))
 		
@@ -37,9 +48,17 @@ class Modules:
 		self.get_structure_functions()
 		self.get_algorithms()
 		self.get_structures()
+		self.load_time = time.perf_counter_ns() - start_time
 
 		return None
 	
+	def input_wait_time(self: Self) -> int:
+		"""
+		Gets time modules spent waiting for input, in nanoseconds
+		"""
+
+		return sum(module.wait_time for module in self.activated_modules)
+	
 	def get_active_functions(self: Self) -> None:
 		"""
 		Gets a list of Callables
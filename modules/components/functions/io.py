@@ -1,9 +1,12 @@
 from typing import Self
 from modules.logger import Logger
-from modules.components.context import Module, Text
+from modules.components.context import Module, Text, Binary, Void
+import sys
+import time
 
 class IO(Module):
 	logger: Logger = None
+	at_eof: bool = False
 
 	def __init__(self: Self, logger: Logger = None) -> None:
 		"""
@@ -13,7 +16,12 @@ class IO(Module):
 		super().__init__("IO", logger)
 		self.module_functions = [
 			self.out,
-			self.input
+			self.input,
+			(self.line, "line", "read-line"),
+			(self.eof, "eof", "end-of-input")
+		]
+		self.structure_functions = [
+			self.lines
 		]
 
 		return None
@@ -28,15 +36,92 @@ class IO(Module):
 
 		return None
 	
-	def input(self: Self, *args) -> None:
+	def input(self: Self, *args) -> Text|Void:
 		"""
-		Takes inputs from console
+		Takes inputs from console, Void once input has ended
 		"""
 
 		data = [arg.to_text() for arg in args]
 		self.logger.out(*data, break_line=False)
-		input_data = input()
+		self.logger.flush()
+
+		start_time = time.perf_counter_ns()
+		try:
+			input_data = input()
+		except EOFError:
+			self.at_eof = True
+			return Void.of()
+		finally:
+			self.wait_time += time.perf_counter_ns() - start_time
+		
 		return_data = Text(None, input_data)
 
 		return return_data
+	
+	def read_line(self: Self) -> str|None:
+		"""
+		Reads next line of standard input without its line break, None once input has ended
+		"""
+
+		if self.at_eof: return None
+		if sys.stdin.isatty(): self.logger.flush()
+
+		start_time = time.perf_counter_ns()
+		line = sys.stdin.readline()
+		self.wait_time += time.perf_counter_ns() - start_time
+		if not line:
+			self.at_eof = True
+			return None
+		
+		if line.endswith("\n"): line = line[:-1]
+		if line.endswith("\r"): line = line[:-1]
+
+		return line
+	
+	def line(self: Self, *args) -> Text|Void:
+		"""
+		Reads next line of standard input, Void once input has ended
+		"""
+
+		line = self.read_line()
+		if isinstance(line, type(None)): return Void.of()
 
+		return Text(None, line)
+	
+	def eof(self: Self, *args) -> Binary:
+		"""
+		Returns true once standard input has ended
+		"""
+
+		return Binary.of(self.at_eof)
+	
+	def lines(self: Self, engine, code: list, run_data: list) -> None:
+		"""
+		Runs code for every line of standard input until it ends, with the line
+		given to a variable
+		"""
+
+		args = run_data[1:]
+		eval_args = []
+		line_var = None
+		old_var_value = None
+
+		if len(args):
+			eval_args = engine.evaluate_params(run_data, no_var = True)
+			line_var = eval_args[0].to_text()
+			old_var_value = engine.load(line_var)
+		
+		try:
+			while True:
+				line = self.read_line()
+				if isinstance(line, type(None)): break
+
+				if not isinstance(line_var, type(None)):
+					engine.store(line_var, Text(line_var, line))
+				
+				engine.run(code)
+		finally:
+			if not isinstance(old_var_value, type(None)):
+				engine.store(line_var, old_var_value)
+
+		return None
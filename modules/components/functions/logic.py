@@ -40,9 +40,7 @@ class Logic(Module):
 			self.logger.error("Conditional Binary Required", errors.ARG_MISSING_ERROR)
 			return None
 		
-		args = args[0].replace(", ", ",")
-		args = args.split(",")
-		eval_args = engine.evaluate_args(args)
+		eval_args = engine.evaluate_params(run_data)
 		
 		condition_state = False
 		if len(eval_args):
@@ -58,18 +56,18 @@ class Logic(Module):
 		Returns the collective binary value of one object or more.
 		"""
 
-		if not args: return Binary(None, False)
+		if not args: return Binary.of(False)
 
-		return Binary(None, all([arg.to_binary() for arg in args]))
+		return Binary.of(all([arg.to_binary() for arg in args]))
 	
 	def logic_or(self: Self, *args) -> Binary:
 		"""
 		Returns if any object has true binary value.
 		"""
 
-		if not args: return Binary(None, False)
+		if not args: return Binary.of(False)
 
-		return Binary(None, any([arg.to_binary() for arg in args]))
+		return Binary.of(any([arg.to_binary() for arg in args]))
 	
 	def logic_equal(self: Self, *args) -> Binary|Void:
 		"""
@@ -96,7 +94,7 @@ class Logic(Module):
 			else:
 				if compare_value != arg.to_decimal(): are_equal = False; break
 		
-		return Binary(None, are_equal)
+		return Binary.of(are_equal)
 	
 	def logic_unequal(self: Self, *args) -> Binary|Void:
 		"""
@@ -108,7 +106,7 @@ class Logic(Module):
 
 		are_unequal = not logic_equal_data.to_binary()
 
-		return Binary(None, are_unequal)
+		return Binary.of(are_unequal)
 	
 	def logic_greater(self: Self, *args) -> Binary|Void:
 		"""
@@ -128,7 +126,7 @@ class Logic(Module):
 			)
 			return Void()
 		
-		return Binary(None, args[0].to_decimal() > args[1].to_decimal())
+		return Binary.of(args[0].to_decimal() > args[1].to_decimal())
 	
 	def logic_lesser(self: Self, *args) -> Binary|Void:
 		"""
@@ -148,7 +146,7 @@ class Logic(Module):
 			)
 			return Void()
 		
-		return Binary(None, args[0].to_decimal() < args[1].to_decimal())
+		return Binary.of(args[0].to_decimal() < args[1].to_decimal())
 	
 	def logic_greater_equal(self: Self, *args) -> Binary|Void:
 		"""
@@ -168,7 +166,7 @@ class Logic(Module):
 			)
 			return Void()
 		
-		return Binary(None, args[0].to_decimal() >= args[1].to_decimal())
+		return Binary.of(args[0].to_decimal() >= args[1].to_decimal())
 	
 	def logic_lesser_equal(self: Self, *args) -> Binary|Void:
 		"""
@@ -188,5 +186,5 @@ class Logic(Module):
 			)
 			return Void()
 		
-		return Binary(None, args[0].to_decimal() <= args[1].to_decimal())
+		return Binary.of(args[0].to_decimal() <= args[1].to_decimal())
 
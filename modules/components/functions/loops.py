@@ -1,10 +1,52 @@
 from typing import Self
 from modules.logger import Logger
 from modules.components.context import Module, Number
+from modules.signals import Withdraw, Return, TailCall, Halt
 import modules.errors as errors
+import multiprocessing
+import io
+import os
+import sys
+
+def run_parallel_block(engine, code: list, names: list[str], index: int, connection) -> None:
+	"""
+	Runs a block of a parallel structure in a forked process, sending its output, the
+	result variables it changed and the signal it ended with
+	"""
+
+	sys.stdout = io.StringIO()
+	engine.logger.buffer.clear()
+	engine.logger.buffered = 0
+
+	before = {name: engine.load(name) for name in names}
+	signal = None
+	try:
+		engine.run([code[index]])
+	except TailCall as tail_call:
+		signal = ("return", tail_call.alg.run(tail_call.args, engine = engine))
+	except Return as result:
+		signal = ("return", result.value)
+	except Withdraw as withdraw:
+		signal = ("withdraw", withdraw.levels)
+	except Halt:
+		signal = ("halt",)
+	except SystemExit:
+		signal = ("exit",)
+	engine.logger.flush()
+
+	changed = {}
+	for name in names:
+		value = engine.load(name)
+		if value is not before[name]: changed[name] = value
+
+	connection.send((sys.stdout.getvalue(), changed, signal))
+	connection.close()
+
+	return None
 
 class Loops(Module):
 	logger: Logger = None
+	WORKERS: int|None = None
 
 	def __init__(self: Self, logger: Logger = None) -> None:
 		"""
@@ -15,7 +57,8 @@ class Loops(Module):
 		self.structure_functions = [
 			self.withdraw,
 			self.repeat,
-			self.forever
+			self.forever,
+			self.parallel
 		]
 
 		return None
@@ -30,59 +73,53 @@ class Loops(Module):
 		exit_count = 1
 		
 		if len(args):
-			args = args[0].replace(", ", ",")
-			args = args.split(",")
-			eval_args = engine.evaluate_args(args, no_var = True)
+			eval_args = engine.evaluate_params(run_data, no_var = True)
 			exit_count = eval_args[0].to_number()
 		
 		if exit_count < 0:
 			self.logger.error("Proccess Level can not be negative", errors.OUT_OF_BOUND_ERROR)
 			return None
 		
-		if len(engine.alg_cache) - 1 < exit_count:
+		levels = len(engine.alg_cache) - 1
+		if engine.frames: levels = len(engine.alg_cache) - engine.frames[-1].level
+
+		if levels < exit_count:
 			self.logger.error("Can not exit from non existent process", errors.OUT_OF_BOUND_ERROR)
 			return None
 		
-		for exit_itr in range(exit_count + 1):
-			del engine.alg_cache[-1]
-		
-		return None
+		raise Withdraw(exit_count + 1)
 	
 	def repeat(self: Self, engine, code: list, run_data: list) -> None:
 		"""
 		A loop that repeats code given amount of times
 		"""
 
-		repeat_level = len(engine.alg_cache)
 		args = run_data[1:]
 		eval_args = []
 		
 		if not len(args):
-			while len(engine.alg_cache) >= repeat_level:
+			while True:
 				engine.run(code)
 			return None
 		
-		args = args[0].replace(", ", ",")
-		args = args.split(",")
-		eval_args = engine.evaluate_args(args, no_var = True)
+		eval_args = engine.evaluate_params(run_data, no_var = True)
 		amount = eval_args[0].to_number()
 		itr_index_var = None
 		old_var_value = None
 		
 		if len(eval_args) > 1:
 			itr_index_var = eval_args[1].to_text()
-			if itr_index_var in engine.memory:
-				old_var_value = engine.memory[itr_index_var]
-
-		for itr_index in range(amount):
-			if len(engine.alg_cache) < repeat_level: break
-			if not isinstance(itr_index_var, type(None)):
-				engine.memory[itr_index_var] = Number(itr_index_var, itr_index)
-			
-			engine.run(code)
-		
-		if not isinstance(old_var_value, type(None)):
-			engine.memory[itr_index_var] = old_var_value
+			old_var_value = engine.load(itr_index_var)
+
+		try:
+			for itr_index in range(amount):
+				if not isinstance(itr_index_var, type(None)):
+					engine.store(itr_index_var, Number(itr_index_var, itr_index))
+				
+				engine.run(code)
+		finally:
+			if not isinstance(old_var_value, type(None)):
+				engine.store(itr_index_var, old_var_value)
 
 		return None
 	
@@ -91,36 +128,101 @@ class Loops(Module):
 		A loop that repeats code forever
 		"""
 
-		repeat_level = len(engine.alg_cache)
 		args = run_data[1:]
 		eval_args = []
 		
 		if not len(args):
-			while len(engine.alg_cache) >= repeat_level:
+			while True:
 				engine.run(code)
 			return None
 		
-		args = args[0].replace(", ", ",")
-		args = args.split(",")
-		eval_args = engine.evaluate_args(args, no_var = True)
+		eval_args = engine.evaluate_params(run_data, no_var = True)
 		
 		itr_index_var = None
 		old_var_value = None
 		
 		itr_index_var = eval_args[0].to_text()
-		if itr_index_var in engine.memory:
-			old_var_value = engine.memory[itr_index_var]
+		old_var_value = engine.load(itr_index_var)
 
 		itr_index = 0
-		while len(engine.alg_cache) >= repeat_level:
-			if not isinstance(itr_index_var, type(None)):
-				engine.memory[itr_index_var] = Number(itr_index_var, itr_index)
-			
+		try:
+			while True:
+				if not isinstance(itr_index_var, type(None)):
+					engine.store(itr_index_var, Number(itr_index_var, itr_index))
+				
+				engine.run(code)
+				itr_index += 1
+		finally:
+			if not isinstance(old_var_value, type(None)):
+				engine.store(itr_index_var, old_var_value)
+
+		return None
+	
+	def parallel(self: Self, engine, code: list, run_data: list) -> None:
+		"""
+		Runs each block in its own process, then sets changed result variables in block order
+		"""
+
+		args = run_data[1:]
+		names = []
+
+		if len(args):
+			eval_args = engine.evaluate_params(run_data, no_var = True)
+			names = [arg.to_text() for arg in eval_args]
+		
+		if not code: return None
+		if "fork" not in multiprocessing.get_all_start_methods():
 			engine.run(code)
-			itr_index += 1
+			return None
 		
-		if not isinstance(old_var_value, type(None)):
-			engine.memory[itr_index_var] = old_var_value
+		context = multiprocessing.get_context("fork")
+		workers = min(len(code), self.WORKERS or os.cpu_count() or 1)
+		results = []
+		running = []
+		self.logger.flush()
+		try:
+			for index in range(len(code)):
+				if len(running) == workers: results.append(self.join_block(*running.pop(0)))
 
-		return None
+				receiver, sender = context.Pipe(duplex = False)
+				process = context.Process(
+					target = run_parallel_block,
+					args = (engine, code, names, index, sender)
+				)
+				process.start()
+				sender.close()
+				running.append((process, receiver))
+
+			while running: results.append(self.join_block(*running.pop(0)))
+		except (OSError, EOFError) as error:
+			for process, receiver in running:
+				process.terminate()
+				receiver.close()
+
+			self.logger.error(f"Parallel block failed: {error}", errors.ENGINE_ERROR)
+			return None
+
+		signal = None
+		for output, changed, block_signal in results:
+			if output: self.logger.write(output)
+			for name in names:
+				if name in changed: engine.store(name, changed[name])
+			if isinstance(signal, type(None)): signal = block_signal
+
+		if isinstance(signal, type(None)): return None
+		if signal[0] == "return": raise Return(signal[1])
+		if signal[0] == "withdraw": raise Withdraw(signal[1])
+		if signal[0] == "halt": raise Halt()
+
+		raise SystemExit()
+	
+	def join_block(self: Self, process: multiprocessing.Process, receiver) -> tuple[str, dict, tuple|None]:
+		"""
+		Gets what a block of a parallel structure sent once its process is done
+		"""
 
+		try:
+			return receiver.recv()
+		finally:
+			receiver.close()
+			process.join()
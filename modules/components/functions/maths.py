@@ -1,13 +1,26 @@
-from typing import Self
+from typing import Self, Callable
+from itertools import repeat
 from modules.logger import Logger
 from modules.components.context import (
+	MemoryObject,
 	Module,
+	Number,
 	Decimal,
+	Binary,
+	Array,
 	Void
 )
 import modules.errors as errors
+import operator
+import math
 
 class Maths(Module):
+	CONVERSIONS: dict[type, Callable] = {
+		Number: Number.to_number,
+		Binary: Binary.to_number,
+		Decimal: Decimal.to_decimal
+	}
+
 	logger: Logger = None
 
 	def __init__(self: Self, logger: Logger = None) -> None:
@@ -28,41 +41,103 @@ class Maths(Module):
 
 		return None
 	
-	def add(self: Self, *args) -> Decimal:
+	def operand(self: Self, arg: MemoryObject) -> int|float:
 		"""
-		Adds two or more objects
+		Gets the number of an object, an integer for Number and Binary, else a decimal
+		"""
+
+		conversion = self.CONVERSIONS.get(arg.type)
+		if conversion: return conversion(arg)
+
+		return arg.to_decimal()
+	
+	def operands(self: Self, args: tuple[MemoryObject]) -> list[int|float]|None:
+		"""
+		Gets the numbers of scalar objects, None if any of them is an array
 		"""
 
-		value = Decimal(None, 0)
+		values = []
 		for arg in args:
-			value.value += arg.to_decimal()
+			if arg.type is Number: values.append(arg.value); continue
+			if arg.type is Array: return None
+			values.append(self.operand(arg))
 
-		return value
+		return values
 	
-	def multiply(self: Self, *args) -> Decimal:
+	def wrap(self: Self, value: int|float) -> Number|Decimal:
 		"""
-		Multiplies two or more objects
+		Wraps an integer result as Number, and any other as Decimal
 		"""
 
-		value = Decimal(None, 1)
+		if type(value) == int: return Number.of(value)
+		return Decimal(None, value)
+	
+	def broadcast(self: Self, operation: Callable, args: tuple[MemoryObject],
+			start: int|None = None
+		) -> Array|Void|None:
+		"""
+		Applies an operation over arrays element by element, repeating other objects
+		for every element
+		"""
+
+		length = None
+		operands = [] if isinstance(start, type(None)) else [repeat(start)]
 		for arg in args:
-			value.value *= arg.to_decimal()
+			if arg.type != Array:
+				operands.append(repeat(self.operand(arg)))
+				continue
+			
+			if not isinstance(length, type(None)) and len(arg.value) != length:
+				self.logger.error("Arrays must be of the same length", errors.VALUE_ERROR)
+				return Void()
+			
+			length = len(arg.value)
+			operands.append(arg.value)
+		
+		values = operands[0]
+		for operand in operands[1:]:
+			values = map(operation, values, operand)
+		
+		if len(operands) == 1: values = map(operation, values)
 
-		return value
+		return Array(None, list(values))
 	
-	def negate(self: Self, *args) -> Decimal|Void:
+	def add(self: Self, *args) -> Number|Decimal|Array|Void:
 		"""
-		Returns the negated decimal value of an object.
+		Adds two or more objects
 		"""
 
-		if not args: return Decimal(None, 0.00)
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.add, args, 0)
+
+		return self.wrap(sum(values))
+	
+	def multiply(self: Self, *args) -> Number|Decimal|Array|Void:
+		"""
+		Multiplies two or more objects
+		"""
+
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.mul, args, 1)
+
+		return self.wrap(math.prod(values))
+	
+	def negate(self: Self, *args) -> Number|Decimal|Array|Void:
+		"""
+		Returns the negated value of an object.
+		"""
+
+		if not args: return Number(None, 0)
 		if len(args) > 1:
 			self.logger.error("Only one value can be negated", errors.ARG_OVERFLOW_ERROR)
 			return Void()
 
-		return Decimal(None, - args[0].to_decimal())
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.neg, args)
+
+		return self.wrap(- values[0])
 	
-	def subtract(self: Self, *args) -> Decimal|Void:
+	def subtract(self: Self, *args) -> Number|Decimal|Array|Void:
 		"""
 		Returns the value of object 1 - object 2.
 		"""
@@ -80,9 +155,12 @@ class Maths(Module):
 			)
 			return Void()
 		
-		return Decimal(None, args[0].to_decimal() - args[1].to_decimal())
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.sub, args)
+
+		return self.wrap(values[0] - values[1])
 	
-	def quotient(self: Self, *args) -> Decimal|Void:
+	def quotient(self: Self, *args) -> Number|Decimal|Array|Void:
 		"""
 		Returns the quotient of object 1 / object 2.
 		"""
@@ -100,9 +178,12 @@ class Maths(Module):
 			)
 			return Void()
 		
-		return Decimal(None, args[0].to_decimal() / args[1].to_decimal())
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.truediv, args)
+
+		return self.wrap(values[0] / values[1])
 	
-	def remainder(self: Self, *args) -> Decimal|Void:
+	def remainder(self: Self, *args) -> Number|Decimal|Array|Void:
 		"""
 		Returns the remainder of object 1 / object 2.
 		"""
@@ -120,9 +201,12 @@ class Maths(Module):
 			)
 			return Void()
 		
-		return Decimal(None, args[0].to_decimal() % args[1].to_decimal())
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.mod, args)
+
+		return self.wrap(values[0] % values[1])
 	
-	def power(self: Self, *args) -> Decimal|Void:
+	def power(self: Self, *args) -> Number|Decimal|Array|Void:
 		"""
 		Returns the value of object 1 raised to the power of object 2.
 		"""
@@ -140,5 +224,8 @@ class Maths(Module):
 			)
 			return Void()
 		
-		return Decimal(None, args[0].to_decimal() ** args[1].to_decimal())
+		values = self.operands(args)
+		if isinstance(values, type(None)): return self.broadcast(operator.pow, args)
+
+		return self.wrap(values[0] ** values[1])
 
@@ -6,6 +6,7 @@ from modules.components.context import (
 	Text,
 	Binary,
 	Collection,
+	Array,
 	Void,
 	MemoryObject
 )
@@ -51,19 +52,19 @@ class Operations(Module):
 			self.logger.error("Length can be used for one value only", errors.ARG_OVERFLOW_ERROR)
 			return Void()
 		
-		return Number(None, len(args[0].to_text()))
+		return Number.of(len(args[0].to_text()))
 	
 	def invert(self: Self, *args) -> Binary|Void:
 		"""
 		Returns the inverted binary value of an object.
 		"""
 
-		if not args: return Binary(None, True)
+		if not args: return Binary.of(True)
 		if len(args) > 1:
 			self.logger.error("Only one value can be inverted", errors.ARG_OVERFLOW_ERROR)
 			return Void()
 
-		return Binary(None, not args[0].to_binary())
+		return Binary.of(not args[0].to_binary())
 	
 	def reverse(self: Self, *args) -> Text|Void:
 		"""
@@ -78,6 +79,9 @@ class Operations(Module):
 		if args[0].type == Collection:
 			return Collection(None, args[0].value[::-1], args[0].index[::-1], args[0].connector)
 		
+		if args[0].type == Array:
+			return Array(None, args[0].value[::-1], args[0].connector)
+		
 		return Text(None, args[0].to_text()[::-1])
 	
 	def item(self: Self, *args) -> MemoryObject|Void:
@@ -100,11 +104,11 @@ class Operations(Module):
 		iterable: Collection = args[0]
 		index = args[1]
 
-		if index.type == Collection:
+		if index.type in (Collection, Array):
 			self.logger.error("Index can not be a collection", errors.ARG_TYPE_ERROR)
 			return Void()
 		
-		if iterable.type != Collection:
+		if iterable.type not in (Collection, Array):
 			iterable = Collection(
 				name = "--<" + iterable.name + ">-collection--" if iterable.name else None,
 				value = [Text(None, ch) for ch in iterable.to_text()],
@@ -0,0 +1,207 @@
+from typing import Self, Callable
+from itertools import repeat
+from array import array
+from modules.logger import Logger
+from modules.components.context import (
+	MemoryObject,
+	Module,
+	Number,
+	Decimal,
+	Binary,
+	Text,
+	Collection,
+	Array,
+	Void
+)
+import modules.errors as errors
+import operator
+import math
+
+class Statistics(Module):
+	COMPARISONS: dict[str, Callable] = {
+		"equal": operator.eq, "==": operator.eq,
+		"unequal": operator.ne, "!=": operator.ne,
+		"lesser": operator.lt, "<": operator.lt,
+		"greater": operator.gt, ">": operator.gt,
+		"notgreater": operator.le, "lesser-or-equal": operator.le, "<=": operator.le, "!>": operator.le,
+		"notlesser": operator.ge, "greater-or-equal": operator.ge, ">=": operator.ge, "!<": operator.ge
+	}
+
+	logger: Logger = None
+
+	def __init__(self: Self, logger: Logger = None) -> None:
+		"""
+		Statistics Module
+		"""
+
+		super().__init__("Statistics", logger)
+		self.module_functions = [
+			(self.total, "sum", "total"),
+			(self.product, "product"),
+			(self.minimum, "min", "minimum"),
+			(self.maximum, "max", "maximum"),
+			(self.mean, "mean", "average", "avg"),
+			(self.variance, "variance"),
+			(self.percentile, "percentile"),
+			(self.count_if, "count-if")
+		]
+
+		return None
+	
+	def numbers(self: Self, args: tuple[MemoryObject]) -> array|None:
+		"""
+		Packs the numbers of all objects, reusing the buffer of a single array, None
+		if any of them is not numeric
+		"""
+
+		if len(args) == 1 and args[0].type == Array: return args[0].value
+
+		for arg in args:
+			if arg.type == Array: continue
+			for item in (arg.value if arg.type == Collection else [arg]):
+				if item.type in (Number, Decimal, Binary): continue
+
+				self.logger.error(f"Number required, got {item.type.__name__}", errors.ARG_TYPE_ERROR)
+				return None
+
+		return Array.pack(Array.collect(args))
+	
+	def scalar(self: Self, values: array, value: int|float) -> Number|Decimal:
+		"""
+		Wraps a result as Number for integer arrays, else as Decimal
+		"""
+
+		if values.typecode == "q": return Number.of(value)
+		return Decimal(None, value)
+	
+	def total(self: Self, *args) -> Number|Decimal:
+		"""
+		Returns the sum of all numbers in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if values.typecode == "q": return Number.of(sum(values))
+
+		return Decimal(None, math.fsum(values))
+	
+	def product(self: Self, *args) -> Number|Decimal:
+		"""
+		Returns the product of all numbers in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+
+		return self.scalar(values, math.prod(values))
+	
+	def minimum(self: Self, *args) -> Number|Decimal|Void:
+		"""
+		Returns the smallest number in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if not values:
+			self.logger.error("Minimum of no values", errors.VALUE_ERROR)
+			return Void.of()
+
+		return self.scalar(values, min(values))
+	
+	def maximum(self: Self, *args) -> Number|Decimal|Void:
+		"""
+		Returns the largest number in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if not values:
+			self.logger.error("Maximum of no values", errors.VALUE_ERROR)
+			return Void.of()
+
+		return self.scalar(values, max(values))
+	
+	def mean(self: Self, *args) -> Decimal|Void:
+		"""
+		Returns the arithmetic mean of numbers in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if not values:
+			self.logger.error("Mean of no values", errors.VALUE_ERROR)
+			return Void.of()
+
+		return Decimal(None, math.fsum(values) / len(values))
+	
+	def variance(self: Self, *args) -> Decimal|Void:
+		"""
+		Returns the population variance of numbers in objects
+		"""
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if not values:
+			self.logger.error("Variance of no values", errors.VALUE_ERROR)
+			return Void.of()
+
+		mean = math.fsum(values) / len(values)
+		deviations = array("d", map(operator.sub, values, repeat(mean)))
+
+		return Decimal(None, math.fsum(map(operator.mul, deviations, deviations)) / len(values))
+	
+	def percentile(self: Self, *args) -> Decimal|Void:
+		"""
+		Returns the percentile(last object, 0 to 100) of numbers in other objects,
+		interpolating linearly between the closest ranks
+		"""
+
+		if len(args) < 2:
+			self.logger.error("Values and a percent required", errors.ARG_MISSING_ERROR)
+			return Void.of()
+
+		percent = args[-1].to_decimal()
+		if not 0 <= percent <= 100:
+			self.logger.error("Percent must be from 0 to 100", errors.VALUE_ERROR)
+			return Void.of()
+
+		values = self.numbers(args[:-1])
+		if isinstance(values, type(None)): return Void.of()
+
+		values = sorted(values)
+		if not values:
+			self.logger.error("Percentile of no values", errors.VALUE_ERROR)
+			return Void.of()
+		
+		rank = (len(values) - 1) * percent / 100
+		lower = math.floor(rank)
+		upper = min(lower + 1, len(values) - 1)
+
+		return Decimal(None, values[lower] + (values[upper] - values[lower]) * (rank - lower))
+	
+	def count_if(self: Self, *args) -> Number|Void:
+		"""
+		Counts numbers in objects matching a comparison, given as the last two objects
+		like `">` and `5`, or with true binary value without one
+		"""
+
+		comparison = None
+		if len(args) >= 2 and args[-2].type == Text:
+			comparison = self.COMPARISONS.get(args[-2].to_text())
+			if isinstance(comparison, type(None)):
+				self.logger.error(f"Unknown comparison: {args[-2].to_text()}", errors.VALUE_ERROR)
+				return Void.of()
+			
+			operand = args[-1]
+			args = args[:-2]
+			if operand.type not in (Number, Decimal, Binary):
+				self.logger.error("Number required to compare with", errors.ARG_TYPE_ERROR)
+				return Void.of()
+
+		values = self.numbers(args)
+		if isinstance(values, type(None)): return Void.of()
+		if isinstance(comparison, type(None)): return Number.of(len(values) - values.count(0))
+
+		operand = operand.to_number() if operand.type in (Number, Binary) else operand.to_decimal()
+
+		return Number.of(sum(map(comparison, values, repeat(operand))))
@@ -57,7 +57,7 @@ class System(Module):
 			"help": alg.help_data if hasattr(alg, "help_data") else None,
 			"value": alg.value if not(callable(alg.value)) else alg.value.__name__
 		}
-		if data["type"].lower() == "collection":
+		if data["type"].lower() in ("collection", "array"):
 			data["value"] = alg.to_text()
 
 		return Collection(
@@ -72,5 +72,6 @@ class System(Module):
 		Ends the program
 		"""
 
+		self.logger.flush()
 		sys.exit()
 
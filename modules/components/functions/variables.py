@@ -9,9 +9,12 @@ from modules.components.context import (
 	Binary,
 	Void,
 	Collection,
+	Array,
 	KVPacket,
-	Algorithm
+	Algorithm,
+	Memo
 )
+from modules.signals import Return, TailCall
 import modules.errors as errors
 
 class Variable(Module):
@@ -31,14 +34,17 @@ class Variable(Module):
 			(self.binary, "binary", "Binary", "boolean", "bool", "bin"),
 			(self.void, "void", "Void"),
 			(self.collection, "collection", "Collection"),
-			(self.kv_packet, "kv", "KV-Packet", "kvp")
+			(self.array, "array", "Array"),
+			(self.kv_packet, "kv", "KV-Packet", "kvp"),
+			(self.memo_stats, "memo-stats", "memo-info")
 		]
 		self.engine_functions = [
 			self.var
 		]
 		self.structure_functions = [
 			(self.algorithm, "alg", "algorithm", "def", "define", "func", "function"),
-			(self.result, "result", "return")
+			(self.result, "result", "return"),
+			(self.memo, "memo", "memoize")
 		]
 
 		return None
@@ -161,10 +167,17 @@ class Variable(Module):
 			values.append(arg)
 			indices.append(arg.name)
 		
+		used_indices = set()
+		for index in indices:
+			try:
+				used_indices.add(index.value)
+			except TypeError:
+				continue
+		
 		itr_index = 0
 		for arg in id_args:
 			values.append(arg)
-			while itr_index in [i.value for i in indices]:
+			while itr_index in used_indices:
 				itr_index += 1
 			
 			indices.append(Number(None, itr_index))
@@ -177,6 +190,23 @@ class Variable(Module):
 			connector = connector
 		)
 	
+	def array(self: Self, *args) -> Array:
+		"""
+		Creates an Array of numbers, unpacking collections and arrays passed to it
+		"""
+
+		objects: list[MemoryObject] = []
+		connector = ""
+
+		for arg in args:
+			if isinstance(arg, KVPacket) and arg.name.to_text() == "connector":
+				connector = arg.value
+				continue
+			
+			objects.append(arg)
+		
+		return Array(None, Array.collect(objects), connector)
+	
 	def kv_packet(self: Self, *args) -> KVPacket:
 		"""
 		Creates a Key Value Packet
@@ -206,12 +236,9 @@ class Variable(Module):
 			self.logger.error("Algorithm name required", errors.ARG_MISSING_ERROR)
 			return None
 		
-		args = args[0].replace(", ", ",")
-		args = args.split(",")
-		eval_args = engine.evaluate_args(args, no_var = True)
+		eval_args = engine.evaluate_params(run_data, no_var = True)
 		
 		alg_name = eval_args[0].to_text()
-		encoded_instructions = engine.iterator.encode(code)
 		args_collection_name = None
 
 		if len(eval_args) > 1:
@@ -219,33 +246,85 @@ class Variable(Module):
 
 		engine.memory[alg_name] = Algorithm(
 			name = alg_name,
-			code = encoded_instructions,
+			code = code,
 			args_collection_name = args_collection_name
 		)
 
 		return None
 	
-	def result(self: Self, engine, code: list, run_data: list) -> None:
+	def memo(self: Self, engine, code: list, run_data: list) -> None:
 		"""
-		Stops the current algorithm/structure process to continue
+		Memoizes algorithms defined in it, keeping results of given amount of calls
+		to each(0 keeps every result)
 		"""
 
-		args = engine.evaluate_args(code)
-		algs_data = [[n, alg] for n, alg in enumerate(engine.alg_cache) if alg[0] == 1]
+		args = run_data[1:]
+		size = Memo.SIZE
+
+		if len(args):
+			eval_args = engine.evaluate_params(run_data, no_var = True)
+			size = eval_args[0].to_number()
 
-		if len(algs_data) < 1:
+		if size < 0:
+			self.logger.error("Memo size can not be negative", errors.OUT_OF_BOUND_ERROR)
+			return None
+		
+		defined = {id(obj) for obj in engine.memory.values() if obj.type == Algorithm}
+		engine.run(code)
+
+		for alg in list(engine.memory.values()):
+			if id(alg) in defined or alg.type != Algorithm or callable(alg.code): continue
+			alg.memo = Memo(size)
+
+		return None
+	
+	def memo_stats(self: Self, *args) -> Collection|None:
+		"""
+		Gets hits, misses, kept results and size of a memoized algorithm
+		"""
+
+		if not args:
+			self.logger.error("Algorithm required to get memo stats", errors.ARG_MISSING_ERROR)
+			return None
+		
+		alg = args[0]
+		if alg.type != Algorithm or not alg.memo:
+			self.logger.error(f"{alg.to_text()} is not a memoized algorithm", errors.ARG_TYPE_ERROR)
+			return None
+		
+		stats = {
+			"hits": alg.memo.hits,
+			"misses": alg.memo.misses,
+			"kept": len(alg.memo.results),
+			"size": alg.memo.size
+		}
+
+		return Collection(
+			f"Memo Stats - {alg.name}",
+			value = [Number.of(stats[stat]) for stat in stats],
+			index = [Text(None, stat) for stat in stats],
+			connector = ", "
+		)
+	
+	def result(self: Self, engine, code: list, run_data: list) -> None:
+		"""
+		Returns a value from the current algorithm
+		"""
+
+		if not engine.frames:
 			self.logger.error("Cannot result out of an algorithm", errors.OUT_OF_BOUND_ERROR)
 			return None
 		
+		tail_alg = engine.get_tail_call(code)
+		if tail_alg: raise TailCall(tail_alg, engine.evaluate_args(code[0].args), code[0].line)
+
+		args = engine.evaluate_args(code)
+		
 		if len(args) > 1:
 			self.logger.error("You can result atmost one value only", errors.RETURN_VAR_ERROR)
 			return None
 		
-		args += [Void()]
+		args += [Void.of()]
 		
-		for exit_itr in range(len(engine.alg_cache) - algs_data[-1][0] - 1):
-			del engine.alg_cache[-1]
-		
-		engine.return_cache = args[0]
-		return None
+		raise Return(args[0])
 
@@ -62,4 +62,5 @@ ARG_MISSING_ERROR = Error("8a", "Argument Missing", "Syntax")
 ARG_TYPE_ERROR = Error("8b", "Argument Type", "Syntax")
 ARG_OVERFLOW_ERROR = Error("8c", "Argument Overflow", "Syntax")
 OUT_OF_BOUND_ERROR = Error("11x", "Bound", "Syntax")
+DEPTH_ERROR = Error("12x", "Depth", "Code")
 
@@ -1,8 +1,14 @@
-from typing import Self
+from typing import Self, Iterable, Callable
 from modules.logger import Logger
 from modules.iterator import Iterator
 from modules.runtime import Runtime
+from modules.vm import VirtualMachine
+from modules.cache import CodeCache
+from modules.profiler import Profiler, Sampler
+from modules.metrics import Metrics
+from modules.signals import Halt
 from modules.components.functions import Modules
+from collections import deque
 import modules.errors as errors
 import os
 import sys
@@ -28,23 +34,38 @@ class Esolang:
 	MODE_F: int = 1
 	MODE: int = MODE_I
 
+	BACKEND_TREE: int = 0
+	BACKEND_VM: int = 1
+	BACKEND: int = BACKEND_TREE
+
 	SOURCE_PATH: str|None = None
 	SOURCE_CODE: str|None = None
+	STREAM_SIZE: int = 1048576
+
+	METRICS: bool = False
+	METRICS_PATH: str|None = None
+	PROFILE_PATH: str|None = None
+	SAMPLE_PATH: str|None = None
 
 	FORCED_EXIT_OPTION_NO_ERROR: int = 0
 	FORCED_EXIT_OPTION_ERROR: int = 1
 	FORCED_EXIT_OPTION: int = FORCED_EXIT_OPTION_ERROR
 
-	exec_start_time: int = 0
-	exec_halt_times: dict = {}
-
 	logger: Logger = None
 	iterator: Iterator = None
 	runtime: Runtime = None
+	vm: VirtualMachine = None
+	code_cache: CodeCache = None
+	profiler: Profiler = None
+	sampler: Sampler = None
+	modules: Modules = None
+	metrics: Metrics = None
 
 	def __init__(self: Self, meta: dict = {},
 		logger: Logger = None, iterator: Iterator = None,
 		runtime: Runtime = None, modules: Modules = None,
+		vm: VirtualMachine = None, code_cache: CodeCache = None,
+		profiler: Profiler = None, sampler: Sampler = None,
 		debug: bool = False, forced_exit_option: int = None) -> None:
 		"""
 		Create an Esolang class for programming langauge
@@ -65,13 +86,31 @@ class Esolang:
 		self.logger = logger
 		self.iterator = iterator
 		self.runtime = runtime
+		self.vm = vm
+		self.code_cache = code_cache
+		self.profiler = profiler
+		self.sampler = sampler
+		self.modules = modules
+		self.metrics = Metrics(logger = logger)
 		self.runtime.version = self.META["VER_CODE"]
-		if modules: self.runtime.push_to_memory(modules.algorithms)
+		if code_cache: self.code_cache.version = self.META["VER_CODE"]
+		if modules:
+			start_time = time.perf_counter_ns()
+			self.runtime.push_to_memory(modules.algorithms)
+			self.metrics.add(Metrics.STARTUP, modules.load_time + time.perf_counter_ns() - start_time)
 		
 		self.ARGS = sys.argv[1:] if len(sys.argv) > 1 else []
 		self.CWD = os.getcwd()
 
 		self.update_mode()
+		self.update_backend()
+		self.update_depth()
+		self.update_history()
+		self.update_buffer()
+		self.update_profile()
+		self.update_sample()
+		self.update_metrics()
+		if self.code_cache and "*nocache" in self.ARGS: self.code_cache.ENABLED = False
 
 		return None
 	
@@ -81,28 +120,49 @@ class Esolang:
 		"""
 
 		try:
-			self.exec_start_time = time.time()
+			if self.SAMPLE_PATH: self.sampler.start()
 			self.start()
 		except KeyboardInterrupt:
 			self.handle_keyboard_interrupt()
 		except Exception as exception:
 			self.handle_engine_errors(exception)
-		else:
-			end_time = time.time()
-			ignore_time = 0
+		finally:
+			self.end_metrics()
+			self.end_profile()
+
+		return None
+	
+	def end_metrics(self: Self) -> None:
+		"""
+		Prints or saves time spent in each phase of the run, if asked for
+		"""
 
-			for halt in self.exec_halt_times:
-				if halt > self.exec_halt_times[halt]: continue
-				ignore_time += self.exec_halt_times[halt] - halt
-			
-			final_time = end_time - ignore_time - self.exec_start_time
-			if self.DEBUG: self.logger.debug(f"Execution Time: {final_time:.6f}s")
+		exec_time = self.metrics.times[Metrics.EXEC] / 1e9
+		if self.DEBUG: self.logger.debug(f"Execution Time: {exec_time:.6f}s")
 
-			return None
-		
-		end_time = time.time()
-		if self.DEBUG:
-			self.logger.debug(f"Execution Time: {end_time - self.exec_start_time:.6f}s")
+		if not self.METRICS: return None
+		self.METRICS = False
+
+		if self.METRICS_PATH: self.metrics.save(self.METRICS_PATH); return None
+		self.metrics.report()
+
+		return None
+	
+	def end_profile(self: Self) -> None:
+		"""
+		Prints and saves the profile of the run, and saves samples of it, if
+		profiling
+		"""
+
+		if self.SAMPLE_PATH:
+			self.sampler.save(self.SAMPLE_PATH)
+			self.SAMPLE_PATH = None
+
+		if isinstance(self.runtime.profiler, type(None)): return None
+
+		self.runtime.profiler.report()
+		self.runtime.profiler.save(self.PROFILE_PATH)
+		self.runtime.profiler = None
 
 		return None
 	
@@ -117,6 +177,7 @@ class Esolang:
 		err_file = tb.tb_frame.f_code.co_filename.split("\\")[-1]
 		err_msg = f"{exception} ({tb.tb_lineno} {err_file})"
 		self.logger.error(err_msg, errors.ENGINE_ERROR)
+		self.logger.flush()
 		
 		return None
 	
@@ -125,6 +186,7 @@ class Esolang:
 		Handle keyboard interrupt errors
 		"""
 
+		self.logger.flush()
 		if self.MODE == self.MODE_I: print(); self.logger.out("Exited."); sys.exit()
 
 		print()
@@ -148,6 +210,183 @@ class Esolang:
 
 		return None
 	
+	def update_backend(self: Self) -> None:
+		"""
+		Updates the execution backend of the engine
+		"""
+
+		if "*vm" not in self.ARGS: self.BACKEND = self.BACKEND_TREE; return None
+		if not self.vm:
+			self.logger.warning("Virtual machine missing, using runtime")
+			return None
+
+		self.BACKEND = self.BACKEND_VM
+		return None
+	
+	def update_depth(self: Self) -> None:
+		"""
+		Updates the maximum call depth from `*depth=<number>`
+		"""
+
+		for arg in self.ARGS:
+			if not str(arg).startswith("*depth="): continue
+
+			depth = str(arg).split("=", 1)[1]
+			if not depth.isdigit() or not int(depth):
+				self.logger.warning(f"Invalid depth: {depth}")
+				continue
+
+			self.runtime.MAX_DEPTH = int(depth)
+
+		return None
+	
+	def update_history(self: Self) -> None:
+		"""
+		Updates how many logs are kept in history from `*history=<number>`(0 disables it)
+		"""
+
+		for arg in self.ARGS:
+			if not str(arg).startswith("*history="): continue
+
+			size = str(arg).split("=", 1)[1]
+			if not size.isdigit():
+				self.logger.warning(f"Invalid history size: {size}")
+				continue
+
+			self.logger.history = deque(self.logger.history, maxlen = int(size))
+
+		return None
+	
+	def update_buffer(self: Self) -> None:
+		"""
+		Updates the output buffer size from `*buffer=<number>`(0 writes every output),
+		output is line buffered in interactive mode
+		"""
+
+		if self.MODE == self.MODE_I: self.logger.LINE_BUFFERED = True
+
+		for arg in self.ARGS:
+			if not str(arg).startswith("*buffer="): continue
+
+			size = str(arg).split("=", 1)[1]
+			if not size.isdigit():
+				self.logger.warning(f"Invalid buffer size: {size}")
+				continue
+
+			self.logger.BUFFER_SIZE = int(size)
+
+		return None
+	
+	def update_profile(self: Self) -> None:
+		"""
+		Enables profiling of calls from `*profile` or `*profile=<path>`, the profile is
+		saved next to the source file by default. Structures the virtual machine
+		compiles are not profiled with it
+		"""
+
+		for arg in self.ARGS:
+			if str(arg) != "*profile" and not str(arg).startswith("*profile="): continue
+			if not self.profiler:
+				self.logger.warning("Profiler missing")
+				return None
+
+			path = str(arg).split("=", 1)[1] if "=" in str(arg) else ""
+			if not path:
+				source_path = self.get_code_file_path()
+				path = f"{source_path}.profile.json" if source_path else "synt.profile.json"
+
+			self.PROFILE_PATH = path
+			self.runtime.profiler = self.profiler
+
+		return None
+	
+	def update_sample(self: Self) -> None:
+		"""
+		Enables sampling of the running algorithm stack from `*sample` or `*sample=<path>`,
+		samples are saved as collapsed stacks next to the source file by default
+		"""
+
+		for arg in self.ARGS:
+			if str(arg) != "*sample" and not str(arg).startswith("*sample="): continue
+			if not self.sampler:
+				self.logger.warning("Sampler missing")
+				return None
+
+			path = str(arg).split("=", 1)[1] if "=" in str(arg) else ""
+			if not path:
+				source_path = self.get_code_file_path()
+				path = f"{source_path}.folded" if source_path else "synt.folded"
+
+			self.SAMPLE_PATH = path
+
+		return None
+	
+	def update_metrics(self: Self) -> None:
+		"""
+		Enables phase timings from `*metrics`, which prints them, or `*metrics=<path>`,
+		which saves them as JSON
+		"""
+
+		for arg in self.ARGS:
+			if str(arg) != "*metrics" and not str(arg).startswith("*metrics="): continue
+
+			self.METRICS = True
+			self.METRICS_PATH = str(arg).split("=", 1)[1] if "=" in str(arg) else None
+
+		return None
+	
+	def execute(self: Self, iterated_code: list|Iterable = []) -> None:
+		"""
+		Executes iterated code with the selected backend, running streamed code
+		one top level chunk at a time
+		"""
+
+		run = self.runtime.run
+		if self.BACKEND == self.BACKEND_VM: run = self.vm.run
+
+		recursion_limit = sys.getrecursionlimit()
+		sys.setrecursionlimit(max(recursion_limit, self.runtime.MAX_DEPTH * self.runtime.FRAMES_PER_CALL))
+
+		try:
+			if isinstance(iterated_code, list): self.run_measured(run, iterated_code); return None
+
+			chunks = iter(iterated_code)
+			while True:
+				start_time = time.perf_counter_ns()
+				chunk = next(chunks, None)
+				self.metrics.add(Metrics.PARSE, time.perf_counter_ns() - start_time)
+
+				if isinstance(chunk, type(None)): break
+				self.run_measured(run, [chunk])
+		except Halt:
+			pass
+		except RecursionError:
+			self.logger.error("Maximum nesting depth exceeded", errors.DEPTH_ERROR)
+		finally:
+			sys.setrecursionlimit(recursion_limit)
+
+		return None
+	
+	def run_measured(self: Self, run: Callable, chunks: list = []) -> None:
+		"""
+		Runs chunks, adding time spent waiting for input to input time and the rest
+		to execution time
+		"""
+
+		wait_time = self.modules.input_wait_time() if self.modules else 0
+		start_time = time.perf_counter_ns()
+
+		try:
+			run(chunks)
+		finally:
+			elapsed = time.perf_counter_ns() - start_time
+			if self.modules: wait_time = self.modules.input_wait_time() - wait_time
+
+			self.metrics.add(Metrics.EXEC, elapsed - wait_time)
+			if wait_time: self.metrics.add(Metrics.INPUT, wait_time)
+
+		return None
+	
 	def start(self: Self) -> None:
 		"""
 		Run the engine with appropriate mode.
@@ -167,18 +406,25 @@ class Esolang:
 		code = ""
 		while running:
 			if code in ["end", "exit"]: sys.exit()
+			start_time = time.perf_counter_ns()
 			try:
 				if not code: code = input(">>>"); continue
 			except EOFError:
 				continue
+			finally:
+				self.metrics.add(Metrics.INPUT, time.perf_counter_ns() - start_time)
 
+			start_time = time.perf_counter_ns()
 			code_line = input("...")
+			self.metrics.add(Metrics.INPUT, time.perf_counter_ns() - start_time)
 			if code_line: code += f"\n{code_line}"; continue
 
+			start_time = time.perf_counter_ns()
 			iterated_code = self.iterator.iterate(code)
+			self.metrics.add(Metrics.PARSE, time.perf_counter_ns() - start_time)
 			code = ""
 
-			self.runtime.run(iterated_code)
+			self.execute(iterated_code)
 
 		return None
 	
@@ -220,13 +466,41 @@ class Esolang:
 			self.logger.error("No source file found", errors.SRC_ERROR)
 			return None
 		
+		if self.should_stream():
+			self.stream_file()
+			return None
+
+		start_time = time.perf_counter_ns()
 		self.SOURCE_CODE = self.get_code_file_data()
 		if not self.SOURCE_CODE:
 			self.logger.warning("Source file is empty")
 			return None
 		
-		iterated_code = self.iterator.iterate(self.SOURCE_CODE)
-		self.runtime.run(iterated_code)
+		iterated_code = self.code_cache.iterate(self.SOURCE_PATH, self.SOURCE_CODE)
+		self.metrics.add(Metrics.PARSE, time.perf_counter_ns() - start_time)
+		self.execute(iterated_code)
 
 		return None
+	
+	def should_stream(self: Self) -> bool:
+		"""
+		Checks if source file should be streamed instead of read whole, which is when
+		it is not cached or too large to be
+		"""
+
+		if not self.code_cache or not self.code_cache.ENABLED: return True
+		return os.path.getsize(self.SOURCE_PATH) >= self.STREAM_SIZE
+	
+	def stream_file(self: Self) -> None:
+		"""
+		Runs source file while it is read, one top level chunk at a time
+		"""
 
+		if not os.path.getsize(self.SOURCE_PATH):
+			self.logger.warning("Source file is empty")
+			return None
+		
+		with open(self.SOURCE_PATH, "r") as source_file:
+			self.execute(self.iterator.iterate_stream(source_file))
+
+		return None
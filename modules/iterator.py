@@ -1,12 +1,28 @@
-from typing import Self
+from typing import Self, Iterable, Generator
 from modules.logger import Logger
 import modules.errors as errors
+import re
+
+class Line(str):
+	number: int = 0
+
+	def __new__(cls, text: str = "", number: int = 0) -> "Line":
+		"""
+		Text of a chunk that keeps the number of the source line it was read from
+		"""
+
+		line = super().__new__(cls, text)
+		line.number = number
+
+		return line
 
 class Iterator:
 	TERMINAL_CHARS: list = ["\n"]
 	INDENT_CHARS: list = ["\t", "    "]
 
 	original_code: str = None
+	has_errors: bool = False
+	indent_scanner: re.Pattern = None
 	logger: Logger = None
 
 	def __init__(self: Self, logger: Logger = None, **rules) -> None:
@@ -29,6 +45,8 @@ class Iterator:
 		for rule in rules:
 			setattr(self, rule.upper(), rules[rule])
 		
+		self.indent_scanner = re.compile(f"(?:{re.escape(self.INDENT_CHARS[0])})*")
+		
 		return None
 	
 	def iterate(self: Self, code: str = None) -> list:
@@ -41,77 +59,92 @@ class Iterator:
 			return []
 		
 		self.original_code = code
+		self.has_errors = False
 		if not self.original_code:
 			self.logger.warning("No code")
 			return []
 		
-		chunks = self.create_chunks(code)
-		chunks = self.refactor_chunks(chunks)
+		lines = self.convert_terminal_chars(code).split(self.TERMINAL_CHARS[0])
 
-		return chunks
+		return list(self.parse_lines(lines))
 	
-	def create_chunks(self: Self, code: str = None, skip_to_line_id: int = 0) -> list:
+	def iterate_stream(self: Self, source: Iterable[str] = []) -> Generator[list|str, None, None]:
 		"""
-		Creates chunks
+		Iterates over code read piece by piece, giving each top level chunk as soon
+		as the line after it is read
 		"""
 
-		if not code: return []
+		self.original_code = None
+		self.has_errors = False
+
+		yield from self.parse_lines(self.split_lines(source))
 
-		partial_code = self.convert_terminal_chars(code)
-		terminal_lines = partial_code.split(self.TERMINAL_CHARS[0])
+		return None
+	
+	def split_lines(self: Self, source: Iterable[str] = []) -> Generator[str, None, None]:
+		"""
+		Splits code read piece by piece into lines
+		"""
+
+		partial_line = ""
+		for code in source:
+			lines = (partial_line + self.convert_terminal_chars(code)).split(self.TERMINAL_CHARS[0])
+			partial_line = lines.pop()
+
+			yield from lines
 		
-		chunks = []
-		chunk = [None, []]
+		if partial_line: yield partial_line
+
+		return None
+	
+	def parse_lines(self: Self, lines: Iterable[str] = [], line_id: int = 0) -> Generator[list|str, None, None]:
+		"""
+		Creates chunks in one pass over lines, keeping open chunks on a stack by
+		indentation and giving each top level chunk once it is closed
+		"""
 
-		for line_id, raw_line in enumerate(terminal_lines):
+		indent_char = self.INDENT_CHARS[0]
+		stack: list[tuple[int, list|None]] = [(-1, None)]
+
+		for line_number, raw_line in enumerate(lines, line_id + 1):
 			if not raw_line.strip(): continue
+
 			line = self.convert_indent_chars(raw_line)
-			if line.startswith(self.INDENT_CHARS[0]):
-				line = line.replace(self.INDENT_CHARS[0], "", 1)
-				if chunk[0]: chunk[1].append(line); continue
+			depth = len(self.indent_scanner.match(line).group()) // len(indent_char)
 
-				error_line_id = skip_to_line_id + line_id + 1
-				error_msg = f"Unexpected Indentation in Line {error_line_id}:\n{raw_line}"
+			while stack[-1][0] >= depth:
+				chunk = self.close_chunk(stack)
+				if not isinstance(chunk, type(None)): yield chunk
+			
+			parent_depth = stack[-1][0]
+			if parent_depth != depth - 1:
+				if parent_depth >= 0: raw_line = line[len(indent_char) * (parent_depth + 1):]
+				error_msg = f"Unexpected Indentation in Line {line_number}:\n{raw_line}"
+				self.has_errors = True
 				self.logger.error(error_msg, errors.INDENT_ERROR)
 				continue
 
-			if any([ln.startswith(self.INDENT_CHARS[0]) for ln in chunk[1]]):
-				arg_start_line = line_id - len(chunk[1])
-				chunk_arg = self.TERMINAL_CHARS[0].join(chunk[1])
-				chunk[1] = self.create_chunks(chunk_arg, arg_start_line)
-			
-			if chunk[0]: chunks.append(chunk)
-			chunk = [line, []]
-		else:
-			if any([ln.startswith(self.INDENT_CHARS[0]) for ln in chunk[1]]):
-				arg_start_line = skip_to_line_id + len(terminal_lines) - len(chunk[1])
-				chunk_arg = self.TERMINAL_CHARS[0].join(chunk[1])
-				chunk[1] = self.create_chunks(chunk_arg, arg_start_line)
-
-			if chunk[0]: chunks.append(chunk)
+			stack.append((depth, [Line(line[len(indent_char) * depth:], line_number), []]))
+		
+		while len(stack) > 1:
+			chunk = self.close_chunk(stack)
+			if not isinstance(chunk, type(None)): yield chunk
 
-		return chunks
+		return None
 	
-	def refactor_chunks(self: Self, chunks: list = []) -> list:
+	def close_chunk(self: Self, stack: list[tuple[int, list|None]] = []) -> list|str|None:
 		"""
-		Refactor chunks to organize for easier runtime handling
+		Closes the innermost open chunk, adding it to its parent or returning it if
+		it is top level. Chunks without arguments are closed to their line.
 		"""
 
-		if not chunks: return []
+		chunk = stack.pop()[1]
+		if not chunk[1]: chunk = chunk[0]
 
-		updated_chunks = []
-		for chunk in chunks:
-			if type(chunk) != list: updated_chunks.append(chunk); continue
-			if not chunk[1]: updated_chunks.append(chunk[0]); continue
-			
-			if not any([(type(arg) == list) for arg in chunk[1]]):
-				updated_chunks.append(chunk)
-				continue
-
-			arg_chunk = self.refactor_chunks(chunk[1])
-			updated_chunks.append([chunk[0], arg_chunk])
+		if len(stack) == 1: return chunk
+		stack[-1][1][1].append(chunk)
 
-		return updated_chunks
+		return None
 	
 	def convert_terminal_chars(self: Self, code: str = None) -> str:
 		"""
@@ -1,11 +1,34 @@
 from typing import Self
+from collections import deque
 import modules.errors as errors
 import datetime
+import weakref
+import atexit
+import time
 import sys
 import os
 
+LOGGERS: weakref.WeakSet = weakref.WeakSet()
+
+def flush_loggers() -> None:
+	"""
+	Writes data buffered by loggers still alive once the program exits
+	"""
+
+	for logger in list(LOGGERS): logger.flush()
+
+	return None
+
+atexit.register(flush_loggers)
+
 class Logger:
-	history = []
+	history: deque[tuple[float, str]] = deque()
+	HISTORY_SIZE: int|None = 1000
+
+	buffer: list[str] = []
+	buffered: int = 0
+	BUFFER_SIZE: int = 65536
+	LINE_BUFFERED: bool = False
 
 	PRODUCTION: int = 1
 	ERROR: int = 2
@@ -15,38 +38,86 @@ class Logger:
 
 	EXIT_ON_ERROR: bool = False
 
-	def __init__(self: Self, level: int = None, exit_on_error: bool = False) -> None:
+	def __init__(self: Self, level: int = None, exit_on_error: bool = False,
+		history_size: int|None = None, buffer_size: int|None = None) -> None:
 		"""
-		Initiate logger
+		Initiate logger, keeping the last `history_size` logs(none if 0) and
+		writing output once `buffer_size` characters are buffered(each write if 0)
 		"""
 
 		if level: self.level = level
 		self.EXIT_ON_ERROR = exit_on_error
+		if not isinstance(history_size, type(None)): self.HISTORY_SIZE = history_size
+		if not isinstance(buffer_size, type(None)): self.BUFFER_SIZE = buffer_size
+		self.history = deque(maxlen = self.HISTORY_SIZE)
+		self.buffer = []
+		self.buffered = 0
+
+		LOGGERS.add(self)
 
 		return None
 	
 	@staticmethod
-	def log_time() -> str:
+	def log_time(timestamp: float|None = None) -> str:
 		"""
-		Gets current date and time in logging format
+		Gets date and time(current if not given) in logging format
 		"""
 
-		time_data = f"{datetime.datetime.now():%d-%m-%Y %I:%M:%S %p %f micro-s}"
+		moment = datetime.datetime.fromtimestamp(timestamp) if timestamp else datetime.datetime.now()
+		time_data = f"{moment:%d-%m-%Y %I:%M:%S %p %f micro-s}"
 		return time_data
 	
-	def save_to_history(self: Self, data: str = None) -> None:
+	@staticmethod
+	def plain_text(data: str = "") -> str:
 		"""
-		Saves data to log history
+		Removes colors and typography from data
 		"""
 
-		if not data: return None
-		if "\x1b" not in data: self.history.append(data); return None
+		if "\x1b" not in data: return data
 
 		plain_data = ["m".join(s.split("m")[1:]) for s in data.split("\x1b")[1:]]
 		plain_data = [data.split("\x1b")[0]] + plain_data
-		plain_data = "".join(plain_data)
 
-		self.history.append(plain_data)
+		return "".join(plain_data)
+	
+	def save_to_history(self: Self, data: str = None) -> None:
+		"""
+		Saves data to log history with the time it is logged at, formatted only
+		when history is saved
+		"""
+
+		if not data or self.history.maxlen == 0: return None
+		self.history.append((time.time(), data))
+
+		return None
+
+	def write(self: Self, data: str = "") -> None:
+		"""
+		Buffers data for console, writing it once buffer is full, or at a line end
+		if line buffered
+		"""
+
+		self.buffer.append(data)
+		self.buffered += len(data)
+
+		if self.buffered >= self.BUFFER_SIZE or (self.LINE_BUFFERED and "\n" in data):
+			self.flush()
+
+		return None
+	
+	def flush(self: Self) -> None:
+		"""
+		Writes buffered data to console
+		"""
+
+		if not self.buffer: return None
+
+		data = "".join(self.buffer)
+		self.buffer.clear()
+		self.buffered = 0
+
+		sys.stdout.write(data)
+		sys.stdout.flush()
 
 		return None
 
@@ -56,8 +127,8 @@ class Logger:
 		"""
 
 		_msg = "".join([str(msg)] + list(args))
-		self.save_to_history(f"[{self.log_time()}]: {_msg}")
-		if self.level >= self.PRODUCTION: print(_msg, end= "\n" * break_line)
+		self.save_to_history(_msg)
+		if self.level >= self.PRODUCTION: self.write(_msg + "\n" * break_line)
 		return None
 	
 	def error(self: Self, msg: str = None, error_type: errors.Error = None, *_) -> None:
@@ -68,12 +139,11 @@ class Logger:
 		if not msg: return None
 		if not error_type: self.error("Error Type Invalid", errors.LOGGER_ERROR); return None
 
-		logged_error_msg = f"[{self.log_time()}]: [ERROR]: {error_type.data}: {msg}"
-		self.save_to_history(logged_error_msg)
+		self.save_to_history(f"[ERROR]: {error_type.data}: {msg}")
 
 		error_msg = f"[\033[38;2;255;0;0;6;1mERROR\033[0m]: {error_type.data}: {msg}"
-		if self.level >= self.ERROR: print(error_msg)
-		if self.EXIT_ON_ERROR: sys.exit()
+		if self.level >= self.ERROR: self.write(error_msg + "\n")
+		if self.EXIT_ON_ERROR: self.flush(); sys.exit()
 		
 		return None
 	
@@ -84,11 +154,10 @@ class Logger:
 
 		if not msg: return None
 
-		logged_warn_msg = f"[{self.log_time()}]: [WARNING]: {msg}"
-		self.save_to_history(logged_warn_msg)
+		self.save_to_history(f"[WARNING]: {msg}")
 
 		warn_msg = f"[\033[38;2;227;179;65;6;1mWARNING\033[0m]: {msg}"
-		if self.level >= self.WARNING: print(warn_msg)
+		if self.level >= self.WARNING: self.write(warn_msg + "\n")
 		
 		return None
 	
@@ -97,17 +166,14 @@ class Logger:
 		Debug messages
 		"""
 
-		if isinstance(msg, type(None)): return None
+		if isinstance(msg, type(None)) or self.level < self.DEBUG: return None
 		
 		_msg = msg
 		if isinstance(msg, (list, tuple)): _msg = "".join([str(m) for m in msg])
 		if msgs: _msg += "".join([str(m) for m in msgs])
 
-		logged_debug_msg = f"[{self.log_time()}]: [DEBUG]: {_msg}"
-		self.save_to_history(logged_debug_msg)
-
-		debug_msg = f"[\033[38;2;65;195;227;6;1mDEBUG\033[0m]: {_msg}"
-		if self.level >= self.DEBUG: print(debug_msg)
+		self.save_to_history(f"[DEBUG]: {_msg}")
+		self.write(f"[\033[38;2;65;195;227;6;1mDEBUG\033[0m]: {_msg}\n")
 		
 		return None
 	
@@ -117,7 +183,10 @@ class Logger:
 		"""
 
 		if not path: self.error("Path is required to save log history", errors.DIR_ERROR)
-		save_content = "\n".join(self.history)
+		save_content = "\n".join(
+			f"[{self.log_time(timestamp)}]: {self.plain_text(data)}"
+			for timestamp, data in self.history
+		)
 
 		if not self.history: return None
 		
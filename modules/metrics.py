@@ -0,0 +1,91 @@
+from typing import Self
+from modules.logger import Logger
+import modules.errors as errors
+import json
+import os
+
+class Metrics:
+	STARTUP: str = "startup"
+	PARSE: str = "parse"
+	EXEC: str = "exec"
+	INPUT: str = "input"
+	PHASES: tuple[str] = (STARTUP, PARSE, EXEC, INPUT)
+
+	times: dict[str, int] = {}
+	counts: dict[str, int] = {}
+
+	logger: Logger = None
+
+	def __init__(self: Self, logger: Logger = None) -> None:
+		"""
+		Time spent in each phase of a run, in nanoseconds. Execution time does not
+		include time spent waiting for input
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+
+		self.times = {phase: 0 for phase in self.PHASES}
+		self.counts = {phase: 0 for phase in self.PHASES}
+
+		return None
+	
+	def add(self: Self, phase: str = EXEC, elapsed: int = 0, count: int = 1) -> None:
+		"""
+		Adds time spent in a phase
+		"""
+
+		self.times[phase] = self.times.get(phase, 0) + elapsed
+		self.counts[phase] = self.counts.get(phase, 0) + count
+
+		return None
+	
+	def engine_time(self: Self) -> int:
+		"""
+		Gets time spent by the engine, which is every phase but input
+		"""
+
+		return sum(elapsed for phase, elapsed in self.times.items() if phase != self.INPUT)
+	
+	def to_dict(self: Self) -> dict:
+		"""
+		Gets metrics ready to be saved as JSON
+		"""
+
+		return {
+			"unit": "ns",
+			"engine": self.engine_time(),
+			"phases": {
+				phase: {"time": self.times[phase], "count": self.counts[phase]}
+				for phase in self.times
+			}
+		}
+	
+	def report(self: Self) -> None:
+		"""
+		Prints time spent in each phase
+		"""
+
+		self.logger.out(f"Metrics: engine {self.engine_time() / 1e6:.3f}ms")
+		for phase in self.times:
+			self.logger.out(f"{phase:>10} {self.times[phase] / 1e6:>12.3f}ms {self.counts[phase]:>8}")
+
+		return None
+	
+	def save(self: Self, path: str = None) -> None:
+		"""
+		Writes metrics as JSON
+		"""
+
+		if not path: self.logger.error("Path is required to save metrics", errors.DIR_ERROR); return None
+
+		try:
+			metrics_dir = os.path.dirname(os.path.abspath(path))
+			os.makedirs(metrics_dir, exist_ok=True)
+			with open(path, "w", encoding="utf-8") as metrics_file:
+				json.dump(self.to_dict(), metrics_file, indent=1)
+		except OSError as error:
+			self.logger.error(f"Cannot save metrics: {error}", errors.FILE_ERROR)
+
+		return None
@@ -0,0 +1,77 @@
+from typing import Self
+from modules.components.context import MemoryObject
+
+class Node:
+	source: str = ""
+	line: int = 0
+
+	def __init__(self: Self, source: str = "") -> None:
+		"""
+		Prepared chunk of code, with the source line it was read from(0 if unknown)
+		"""
+
+		self.source = source
+		self.line = getattr(source, "number", 0)
+
+		return None
+
+	def __repr__(self: Self) -> str:
+		return f"{type(self).__name__}({self.source!r})"
+
+class Literal(Node):
+	value: MemoryObject = None
+
+	def __init__(self: Self, source: str = "", value: MemoryObject = None) -> None:
+		"""
+		Constant value recognised once when code is prepared
+		"""
+
+		super().__init__(source)
+		self.value = value
+
+		return None
+
+class Reference(Node):
+	name: str = ""
+	text: MemoryObject = None
+	slot: int|None = None
+
+	def __init__(self: Self, source: str = "", text: MemoryObject = None) -> None:
+		"""
+		Name looked up in memory, or used as text where variables are not read
+		"""
+
+		super().__init__(source)
+		self.name = str(source)
+		self.text = text
+
+		return None
+
+class Call(Node):
+	name: str = ""
+	store: str = ""
+	args: list[Node] = []
+	deferred: bool = False
+	store_slot: int|None = None
+
+	cache_data: list = []
+	cache_alg: MemoryObject = None
+
+	def __init__(self: Self, source: str = "", args: list[Node] = [], *,
+			deferred: bool = False
+		) -> None:
+		"""
+		Algorithm or structure call with its argument chunks
+		"""
+
+		super().__init__(source)
+		parts = source.split("(")
+		self.name = parts[0]
+		self.store = parts[1].split(")")[0] if len(parts) > 1 else ""
+		self.args = args
+		self.deferred = deferred
+
+		return None
+
+	def __repr__(self: Self) -> str:
+		return f"Call({self.source!r}, {self.args!r})"
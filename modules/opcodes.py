@@ -0,0 +1,37 @@
+LOAD_CONST = 0
+LOAD_NAME = 1
+CALL = 2
+STRUCTURE = 3
+INSPECT = 4
+JUMP = 5
+JUMP_IF_FALSE = 6
+SETUP_LOOP = 7
+FOR_ITER = 8
+POP_LOOP = 9
+EXIT = 10
+MAKE_ALG = 11
+SET_RESULT = 12
+RETURN = 13
+ERROR = 14
+LOAD_FAST = 15
+CALL_BUILTIN = 16
+
+NAMES = {
+	LOAD_CONST: "LOAD_CONST",
+	LOAD_NAME: "LOAD_NAME",
+	CALL: "CALL",
+	STRUCTURE: "STRUCTURE",
+	INSPECT: "INSPECT",
+	JUMP: "JUMP",
+	JUMP_IF_FALSE: "JUMP_IF_FALSE",
+	SETUP_LOOP: "SETUP_LOOP",
+	FOR_ITER: "FOR_ITER",
+	POP_LOOP: "POP_LOOP",
+	EXIT: "EXIT",
+	MAKE_ALG: "MAKE_ALG",
+	SET_RESULT: "SET_RESULT",
+	RETURN: "RETURN",
+	ERROR: "ERROR",
+	LOAD_FAST: "LOAD_FAST",
+	CALL_BUILTIN: "CALL_BUILTIN"
+}
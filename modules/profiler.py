@@ -0,0 +1,300 @@
+from typing import Self
+from modules.logger import Logger
+import modules.errors as errors
+import json
+import time
+import os
+import signal
+import threading
+
+class Profiler:
+	BUILTIN: str = "builtin"
+	ALGORITHM: str = "algorithm"
+	STRUCTURE: str = "structure"
+
+	REPORT_SIZE: int = 30
+
+	stats: dict[tuple[str, str, int], list[int]] = {}
+	active: dict[tuple[str, str, int], int] = {}
+	stack: list[list] = []
+	start_time: int = 0
+
+	logger: Logger = None
+
+	def __init__(self: Self, logger: Logger = None) -> None:
+		"""
+		Deterministic profiler of builtin, algorithm and structure calls, kept apart
+		for each source line they are called from. The virtual
+		machine compiles `if`, `repeat`, `forever`, `withdraw`, `result` and `alg` into
+		jumps rather than calls, so with it their time counts towards the call they
+		are in and they are not listed
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+
+		self.stats = {}
+		self.active = {}
+		self.stack = []
+		self.start_time = time.perf_counter_ns()
+
+		return None
+	
+	def enter(self: Self, kind: str = BUILTIN, name: str = "", line: int = 0) -> None:
+		"""
+		Starts timing a call made from given source line
+		"""
+
+		key = (kind, name, line)
+		self.active[key] = self.active.get(key, 0) + 1
+		self.stack.append([key, time.perf_counter_ns(), 0])
+
+		return None
+	
+	def exit(self: Self) -> None:
+		"""
+		Stops timing the innermost call, adding its time to its caller. Time of
+		recursive calls is counted in total only once.
+		"""
+
+		key, start_time, children_time = self.stack.pop()
+		elapsed = time.perf_counter_ns() - start_time
+
+		stat = self.stats.get(key)
+		if not stat: stat = self.stats[key] = [0, 0, 0]
+
+		self.active[key] -= 1
+		stat[0] += 1
+		if not self.active[key]: stat[1] += elapsed
+		stat[2] += elapsed - children_time
+
+		if self.stack: self.stack[-1][2] += elapsed
+
+		return None
+	
+	def unwind(self: Self, depth: int = 0) -> None:
+		"""
+		Stops timing calls left open above given depth by an error
+		"""
+
+		while len(self.stack) > depth:
+			self.exit()
+
+		return None
+	
+	def entries(self: Self) -> list[dict]:
+		"""
+		Gets profiled calls, most self time first
+		"""
+
+		entries = [
+			{
+				"kind": key[0],
+				"name": key[1],
+				"line": key[2],
+				"calls": stat[0],
+				"total_ns": stat[1],
+				"self_ns": stat[2]
+			}
+			for key, stat in self.stats.items()
+		]
+		entries.sort(key = lambda entry: entry["self_ns"], reverse = True)
+
+		return entries
+	
+	def report(self: Self) -> None:
+		"""
+		Prints the most expensive calls
+		"""
+
+		self.unwind()
+		entries = self.entries()
+		wall_time = time.perf_counter_ns() - self.start_time
+
+		self.logger.out(f"Profile: {len(entries)} callables, {wall_time / 1e6:.3f}ms")
+		self.logger.out(f"{'calls':>10} {'total ms':>12} {'self ms':>12} {'self us/call':>13}  kind        line  name")
+
+		for entry in entries[:self.REPORT_SIZE]:
+			self.logger.out(
+				f"{entry['calls']:>10} {entry['total_ns'] / 1e6:>12.3f} {entry['self_ns'] / 1e6:>12.3f}",
+				f" {entry['self_ns'] / entry['calls'] / 1e3:>13.3f}  {entry['kind']:<10} {entry['line']:>5}  {entry['name']}"
+			)
+
+		return None
+	
+	def save(self: Self, path: str = None) -> None:
+		"""
+		Writes the profile as JSON
+		"""
+
+		if not path: self.logger.error("Path is required to save profile", errors.DIR_ERROR); return None
+
+		self.unwind()
+		profile = {
+			"unit": "ns",
+			"wall_ns": time.perf_counter_ns() - self.start_time,
+			"entries": self.entries()
+		}
+
+		try:
+			profile_dir = os.path.dirname(os.path.abspath(path))
+			os.makedirs(profile_dir, exist_ok=True)
+			with open(path, "w", encoding="utf-8") as profile_file:
+				json.dump(profile, profile_file, indent=1)
+		except OSError as error:
+			self.logger.error(f"Cannot save profile: {error}", errors.FILE_ERROR)
+
+		return None
+
+class Sampler:
+	INTERVAL: float = 0.001
+	ROOT: str = "synt"
+	BLOCK_NAME: str = "--block--"
+
+	samples: dict[str, int] = {}
+	thread: threading.Thread|None = None
+	running: bool = False
+
+	logger: Logger = None
+	runtime: any = None
+
+	def __init__(self: Self, logger: Logger = None, runtime: any = None) -> None:
+		"""
+		Sampling profiler of the running algorithm stack, naming each call with the
+		source line it was made from
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if not runtime: self.logger.error("Runtime missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+
+		self.runtime = runtime
+		self.samples = {}
+
+		return None
+	
+	def start(self: Self) -> None:
+		"""
+		Starts sampling, from a CPU time timer signal where possible and from a
+		background thread otherwise
+		"""
+
+		if self.running: return None
+		self.running = True
+
+		if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+			signal.signal(signal.SIGPROF, self.handle_signal)
+			signal.setitimer(signal.ITIMER_PROF, self.INTERVAL, self.INTERVAL)
+			return None
+
+		self.thread = threading.Thread(target=self.sample_loop, daemon=True)
+		self.thread.start()
+
+		return None
+	
+	def stop(self: Self) -> None:
+		"""
+		Stops sampling
+		"""
+
+		if not self.running: return None
+		self.running = False
+
+		if isinstance(self.thread, type(None)):
+			signal.setitimer(signal.ITIMER_PROF, 0, 0)
+			signal.signal(signal.SIGPROF, signal.SIG_DFL)
+			return None
+
+		self.thread.join()
+		self.thread = None
+
+		return None
+	
+	def handle_signal(self: Self, signum: int, frame: any) -> None:
+		"""
+		Samples the stack when the timer fires
+		"""
+
+		self.sample()
+
+		return None
+	
+	def sample_loop(self: Self) -> None:
+		"""
+		Samples the stack until stopped
+		"""
+
+		while self.running:
+			time.sleep(self.INTERVAL)
+			self.sample()
+
+		return None
+	
+	def sample(self: Self) -> None:
+		"""
+		Records the current algorithm stack
+		"""
+
+		stack = ";".join(self.stack_names())
+		self.samples[stack] = self.samples.get(stack, 0) + 1
+
+		return None
+	
+	def stack_names(self: Self) -> list[str]:
+		"""
+		Gets names of running algorithms and structures, outermost first. Calls the
+		virtual machine makes only open frames, so frames are placed at the level of
+		`alg_cache` they were opened at
+		"""
+
+		alg_cache = list(self.runtime.alg_cache)
+		call_lines = list(self.runtime.call_lines)
+		frames = list(self.runtime.frames)
+
+		names = [self.ROOT]
+		frame_index = 0
+		for level in range(len(alg_cache) + 1):
+			while frame_index < len(frames) and frames[frame_index].level <= level:
+				frame = frames[frame_index]
+				frame_index += 1
+
+				called = 0 < frame.level <= len(alg_cache) and alg_cache[frame.level - 1][0] == 1
+				if not called and frame.alg: names.append(self.get_location(frame.alg.name, frame.line))
+
+			if level == len(alg_cache): break
+
+			alg_data = alg_cache[level]
+			if alg_data[1] == self.BLOCK_NAME: continue
+			line = call_lines[level] if level < len(call_lines) else 0
+			names.append(self.get_location(alg_data[1], line))
+
+		return names
+	
+	def get_location(self: Self, name: str = "", line: int = 0) -> str:
+		"""
+		Names a call by the source line it was made from, if known
+		"""
+
+		if not line: return str(name)
+		return f"{name}:{line}"
+	
+	def save(self: Self, path: str = None) -> None:
+		"""
+		Writes samples as collapsed stacks, one `stack count` line each
+		"""
+
+		if not path: self.logger.error("Path is required to save samples", errors.DIR_ERROR); return None
+
+		self.stop()
+		try:
+			sample_dir = os.path.dirname(os.path.abspath(path))
+			os.makedirs(sample_dir, exist_ok=True)
+			with open(path, "w", encoding="utf-8") as sample_file:
+				for stack, count in sorted(self.samples.items()):
+					sample_file.write(f"{stack} {count}\n")
+		except OSError as error:
+			self.logger.error(f"Cannot save samples: {error}", errors.FILE_ERROR)
+
+		return None
@@ -1,6 +1,10 @@
 from typing import Self
 from modules.logger import Logger
 from modules.iterator import Iterator
+from modules.nodes import Node, Literal, Reference, Call
+from modules.scope import Scope, Frame
+from modules.signals import Withdraw, Halt
+from modules.profiler import Profiler
 from modules.components.context import (
 	MemoryObject,
 	Algorithm,
@@ -14,17 +18,32 @@ from modules.components.context import (
 import modules.errors as errors
 
 class Runtime:
+	BINDING_PARAMS: dict[str, int] = {
+		"Loops.repeat": 1,
+		"Loops.forever": 0,
+		"IO.lines": 0
+	}
+	DEFINITIONS: list[str] = ["Variable.algorithm"]
+	MAX_DEPTH: int = 1000
+	FRAMES_PER_CALL: int = 50
+
 	version: dict = {}
 
 	logger: Logger = None
 	iterator: Iterator = None
+	profiler: Profiler|None = None
 	
 	memory: dict[str, any] = {}
 	alg_cache: list = []
+	call_lines: list[int] = []
+	frames: list[Frame] = []
+	params_cache: dict[str, list[Node]] = {}
 
-	def __init__(self: Self, logger: Logger = None, iterator: Iterator = None) -> None:
+	def __init__(self: Self, logger: Logger = None, iterator: Iterator = None,
+			max_depth: int|None = None
+		) -> None:
 		"""
-		Runtime for Esolang
+		Runtime for Esolang, allowing at most `max_depth` nested algorithm calls
 		"""
 
 		self.logger = Logger(exit_on_error=False)
@@ -33,6 +52,13 @@ class Runtime:
 		if logger: self.logger = logger
 		if iterator: self.iterator = iterator
 
+		self.MAX_DEPTH = Runtime.MAX_DEPTH if isinstance(max_depth, type(None)) else max_depth
+		self.memory = {}
+		self.alg_cache = []
+		self.call_lines = []
+		self.frames = []
+		self.params_cache = {}
+
 		return None
 	
 	def push_to_memory(self: Self, data: dict = {}) -> None:
@@ -40,24 +66,209 @@ class Runtime:
 		Pushes algs into runtime memory
 		"""
 
+		for obj in data.values():
+			if isinstance(obj, (Algorithm, Structure)): obj.compile(self)
+
 		self.memory.update(data)
 		return None
 	
+	def prepare(self: Self, chunks: list = []) -> list[Node]:
+		"""
+		Prepares iterated chunks into nodes, recognising literals once
+		"""
+
+		if not chunks: return []
+		if isinstance(chunks[0], Node): return chunks
+
+		nodes = []
+		pending = [(chunks, nodes)]
+
+		while pending:
+			level_chunks, level_nodes = pending.pop()
+			for chunk in level_chunks:
+				if type(chunk) != list: level_nodes.append(self.prepare_chunk(chunk)); continue
+
+				args = []
+				level_nodes.append(Call(chunk[0], args))
+				if chunk[1] and isinstance(chunk[1][0], Node): args.extend(chunk[1])
+				elif chunk[1]: pending.append((chunk[1], args))
+
+		return nodes
+	
+	def prepare_chunk(self: Self, chunk: any = None) -> Node:
+		"""
+		Prepares one iterated chunk into a node
+		"""
+
+		if isinstance(chunk, Node): return chunk
+		if type(chunk) == list: return Call(chunk[0], self.prepare(chunk[1]))
+
+		arg_object = self.parse_arg(chunk)
+		if not isinstance(arg_object, type(None)): return Literal(chunk, arg_object)
+		if "(" in chunk: return Call(chunk, [], deferred = True)
+
+		return Reference(chunk, self.parse_arg(f"\"{chunk}"))
+	
+	def get_params(self: Self, params: str = "") -> list[Node]:
+		"""
+		Gets prepared structure parameters from their text
+		"""
+
+		if params in self.params_cache: return self.params_cache[params]
+
+		param_chunks = params.replace(", ", ",").split(",") if params else []
+		self.params_cache[params] = self.prepare(param_chunks)
+
+		return self.params_cache[params]
+	
+	def evaluate_params(self: Self, run_data: list = [], *,
+			no_var = False
+		) -> list:
+		"""
+		Evaluates the parameters a structure was given
+		"""
+
+		if len(run_data) < 2: return []
+		return self.evaluate_args(self.get_params(run_data[1]), no_var = no_var)
+	
+	def get_structure_task(self: Self, name: str = "") -> str|None:
+		"""
+		Gets the task name of the structure bound to a name
+		"""
+
+		obj = self.memory.get(name)
+		if not isinstance(obj, MemoryObject) or obj.type != Structure: return None
+
+		return getattr(obj.task, "__qualname__", "")
+	
+	def create_scope(self: Self, nodes: list[Node] = [], args_name: str|None = None) -> Scope:
+		"""
+		Resolves the local names of an algorithm body to slot indexes
+		"""
+
+		names = [args_name] if args_name else []
+		self.collect_locals(nodes, names)
+		scope = Scope(names)
+		self.bind_slots(nodes, scope)
+
+		return scope
+	
+	def collect_locals(self: Self, nodes: list[Node] = [], names: list[str] = []) -> None:
+		"""
+		Collects names bound by stores and loop variables, skipping nested definitions
+		"""
+
+		pending = [nodes]
+		while pending:
+			for node in pending.pop():
+				if type(node) != Call: continue
+
+				task_name = self.get_structure_task(node.name)
+				if isinstance(task_name, type(None)):
+					if node.store: names.append(node.store)
+					pending.append(node.args)
+					continue
+
+				if task_name in self.DEFINITIONS: continue
+
+				if task_name in self.BINDING_PARAMS:
+					index = self.BINDING_PARAMS[task_name]
+					params = self.get_params(node.store)
+					if len(params) > index and type(params[index]) != Call:
+						names.append(self.evaluate_args([params[index]], no_var = True)[0].to_text())
+
+				pending.append(node.args)
+
+		return None
+	
+	def bind_slots(self: Self, nodes: list[Node] = [], scope: Scope = None) -> None:
+		"""
+		Binds references and stores of an algorithm body to their slots
+		"""
+
+		pending = [nodes]
+		while pending:
+			for node in pending.pop():
+				if type(node) == Reference: node.slot = scope.slot(node.name); continue
+				if type(node) != Call: continue
+
+				task_name = self.get_structure_task(node.name)
+				if task_name in self.DEFINITIONS: continue
+				if isinstance(task_name, type(None)) and node.store:
+					node.store_slot = scope.slot(node.store)
+
+				pending.append(node.args)
+
+		return None
+	
+	def push_frame(self: Self, alg: Algorithm = None, line: int = 0) -> Frame:
+		"""
+		Opens the frame of an algorithm call made from given source line
+		"""
+
+		if len(self.frames) >= self.MAX_DEPTH:
+			self.logger.error(f"Maximum depth of {self.MAX_DEPTH} calls exceeded", errors.DEPTH_ERROR)
+			raise Halt()
+
+		frame = Frame(alg.scope, alg, len(self.alg_cache), line)
+		self.frames.append(frame)
+
+		return frame
+	
+	def pop_frame(self: Self) -> Frame|None:
+		"""
+		Closes the frame of the current algorithm call
+		"""
+
+		if not self.frames: return None
+		return self.frames.pop()
+	
+	def load(self: Self, name: str = "") -> MemoryObject|None:
+		"""
+		Gets a value by name from the current frame, falling back to memory
+		"""
+
+		if self.frames:
+			frame = self.frames[-1]
+			slot = frame.scope.names.get(name)
+			if not isinstance(slot, type(None)) and not isinstance(frame.slots[slot], type(None)):
+				return frame.slots[slot]
+
+		return self.memory.get(name)
+	
+	def store(self: Self, name: str = "", value: MemoryObject = None,
+			slot: int|None = None
+		) -> None:
+		"""
+		Binds a value to a name in the current frame, or in memory if it is not local
+		or is a global the frame has not bound yet
+		"""
+
+		if self.frames:
+			frame = self.frames[-1]
+			if isinstance(slot, type(None)): slot = frame.scope.names.get(name)
+			if not isinstance(slot, type(None)) and (
+				not isinstance(frame.slots[slot], type(None)) or name not in self.memory
+			):
+				frame.slots[slot] = value
+				return None
+
+		self.memory[name] = value
+		return None
+	
 	def run(self: Self, chunks: list = []) -> None:
 		"""
 		Executes code chunks
 		"""
 
 		if not chunks: return None
-		current_cache = len(self.alg_cache)
+		if not isinstance(chunks[0], Node): chunks = self.prepare(chunks)
 
 		for chunk in chunks:
-			if len(self.alg_cache) < current_cache: break
-			if type(chunk) == list: self.run_chunk(chunk); continue
-			if "(" in chunk: self.run_chunk([chunk, []]); continue
+			if type(chunk) == Call: self.run_chunk(chunk); continue
 
-			if chunk in self.memory:
-				chunk_object = self.memory[chunk]
+			chunk_object = self.load(chunk.source)
+			if not isinstance(chunk_object, type(None)):
 				formatted_object = f"--- {chunk_object.name} ---\n"
 				formatted_object += f"TYPE: {chunk_object.type.__name__}\n"
 				
@@ -68,29 +279,59 @@ class Runtime:
 				
 				continue
 			
-			error_msg = f"Unknown object/algorithm: {chunk}"
+			error_msg = f"Unknown object/algorithm: {chunk.source}"
 			self.logger.error(error_msg, errors.UNDEF_ANY_ERROR)
 
 		return None
 	
-	def run_chunk(self: Self, chunk: list = []) -> None:
+	def resolve(self: Self, chunk: Call) -> list:
+		"""
+		Gets primary data of a call node, cached while its name stays bound to the same object
+		"""
+
+		cache_alg = chunk.cache_alg
+		if not isinstance(cache_alg, type(None)) and self.memory.get(chunk.name) is cache_alg:
+			return chunk.cache_data
+
+		chunk_data = self.get_primary_data(chunk.source)
+		if not chunk_data[0]: return chunk_data
+
+		chunk.cache_data = chunk_data
+		chunk.cache_alg = self.memory[chunk_data[1]]
+
+		return chunk_data
+	
+	def run_chunk(self: Self, chunk: Call|list = None) -> None:
 		"""
 		Executes one chunk of code
 		"""
 
 		if not chunk: return None
+		if not isinstance(chunk, Call): chunk = self.prepare_chunk(chunk)
 
-		chunk_primary_data, chunk_args = chunk
-		chunk_data = self.get_primary_data(chunk_primary_data)
+		chunk_data = self.resolve(chunk)
 
 		if not chunk_data[0]: return None
 
-		save_data = self.run_algorithm(chunk_data, chunk_args)
+		save_data = self.run_algorithm(chunk_data, chunk.args, chunk.cache_alg, chunk.line)
 		if len(chunk_data) > 2 and not save_data.name == "--structure-void--":
-			self.memory[chunk_data[2]] = save_data
+			if isinstance(chunk.store_slot, type(None)): self.memory[chunk_data[2]] = save_data
+			else: self.store(chunk_data[2], save_data, chunk.store_slot)
 
 		return save_data
 	
+	def get_tail_call(self: Self, chunks: list = []) -> Algorithm|None:
+		"""
+		Gets the user algorithm a result is made of alone, which can reuse the frame
+		"""
+
+		if len(chunks) != 1 or type(chunks[0]) != Call or chunks[0].deferred: return None
+
+		alg = self.memory.get(chunks[0].name)
+		if not isinstance(alg, Algorithm) or callable(alg.code) or not alg.code: return None
+
+		return alg
+	
 	def parse_arg(self: Self, arg: any = None) -> None|MemoryObject:
 		"""
 		Parse Argument Type
@@ -109,12 +350,14 @@ class Runtime:
 		if all([ch in "-0123456789.," for ch in str(arg)]):
 			if str(arg).count("-") <= 1:
 				if (str(arg).startswith("-") if "-" in arg else True):
+					sign = "-" if str(arg).startswith("-") else ""
+					digits = str(arg).replace(",", "").replace("-", "")
 					if all([ch in "-0123456789," for ch in str(arg)]):
-						arg_object = Number(None, int("0" + str(arg).replace(",", "")))
+						arg_object = Number(None, int(sign + "0" + digits))
 						return arg_object
 
 					if str(arg).count(".") == 1:
-						arg_object = Decimal(None, float("0" + str(arg).replace(",", "")))
+						arg_object = Decimal(None, float(sign + "0" + digits))
 						return arg_object
 
 		if str(arg).upper() in ["TRUE", "FALSE", "ON", "OFF"]:
@@ -137,35 +380,43 @@ class Runtime:
 		if not args: return []
 		evaluated_args = []
 		for arg in args:
-			if type(arg) == list:
-				alg_data = self.get_primary_data(arg[0])
-				if alg_data[0] and alg_data[1] in self.memory:
-					data = self.run_chunk(arg)
-					evaluated_args.append(data)
-					continue
+			arg_type = type(arg)
+			if not isinstance(arg, Node):
+				arg = self.prepare_chunk(arg)
+				arg_type = type(arg)
 
-				self.logger.error(f"Undefined algorithm: {alg_data[1]}", errors.UNDEF_ALG_ERROR)
+			if arg_type == Literal: evaluated_args.append(arg.value); continue
+
+			if arg_type == Reference:
+				if no_var: evaluated_args.append(arg.text); continue
+				if isinstance(arg.slot, type(None)):
+					value = self.load(arg.name)
+				else:
+					value = self.frames[-1].slots[arg.slot]
+					if isinstance(value, type(None)): value = self.memory.get(arg.name)
+
+				if not isinstance(value, type(None)): evaluated_args.append(value); continue
+
+				self.logger.error(f"Undefined value: {arg.source}", errors.UNDEF_ANY_ERROR)
 				continue
-			
-			if not no_var and (arg in self.memory): evaluated_args.append(self.memory[arg]); continue
-			
-			arg_object = self.parse_arg(arg)
-			if not isinstance(arg_object, type(None)):
-				evaluated_args.append(arg_object)
+
+			alg_data = self.resolve(arg)
+			if alg_data[0]:
+				if arg.deferred: evaluated_args.append(arg); continue
+
+				data = self.run_chunk(arg)
+				evaluated_args.append(data)
 				continue
 
-			if "(" in str(arg):
-				alg_data = self.get_primary_data(arg)
-				if alg_data[0] and alg_data[1] in self.memory:
-					evaluated_args.append([arg, []])
-					continue
+			if not arg.deferred:
+				self.logger.error(f"Undefined algorithm: {alg_data[1]}", errors.UNDEF_ALG_ERROR)
+				continue
 
 			if not no_var:
-				self.logger.error(f"Undefined value: {arg}", errors.UNDEF_ANY_ERROR)
+				self.logger.error(f"Undefined value: {arg.source}", errors.UNDEF_ANY_ERROR)
 				continue
 			
-			arg_object = self.parse_arg(f"\"{arg}")
-			evaluated_args.append(arg_object)
+			evaluated_args.append(self.parse_arg(f"\"{arg.source}"))
 
 		return evaluated_args
 	
@@ -213,27 +464,46 @@ class Runtime:
 	def run_algorithm(self: Self,
 			alg_data: list = [],
 			raw_args: list[any] = [],
+			alg: Algorithm|Structure|None = None,
+			line: int = 0
 		) -> any:
 		"""
-		Runs a function
+		Runs a function called from given source line
 		"""
 
-		alg_name = alg_data[1]
-		if not self.check_alg_exists(alg_name): return None
+		if isinstance(alg, type(None)):
+			alg_name = alg_data[1]
+			if not self.check_alg_exists(alg_name): return None
+			alg = self.memory[alg_name]
 		
+		profiler = self.profiler
+		if not isinstance(profiler, type(None)):
+			kind = Profiler.STRUCTURE
+			if alg.type == Algorithm: kind = Profiler.BUILTIN if callable(alg.code) else Profiler.ALGORITHM
+			profiler.enter(kind, alg_data[1], line)
+
 		self.alg_cache.append(alg_data)
-		alg: Algorithm|Structure = self.memory[alg_name]
+		self.call_lines.append(line)
 
 		if alg.type == Algorithm:
-			evaluated_args = self.evaluate_args(raw_args)
-			return_object = alg.run(evaluated_args, engine=self)
-			del self.alg_cache[-1]
-
-			return return_object
+			try:
+				evaluated_args = self.evaluate_args(raw_args)
+				return alg.run(evaluated_args, engine=self)
+			finally:
+				del self.alg_cache[-1]
+				del self.call_lines[-1]
+				if not isinstance(profiler, type(None)): profiler.exit()
 		
-		prev_cache_length = len(self.alg_cache)
-		alg.run(self, raw_args, alg_data[1:])
-		if prev_cache_length == len(self.alg_cache): del self.alg_cache[-1]
+		try:
+			alg.run(self, raw_args, alg_data[1:])
+		except Withdraw as signal:
+			if signal.levels > 1:
+				signal.levels -= 1
+				raise
+		finally:
+			del self.alg_cache[-1]
+			del self.call_lines[-1]
+			if not isinstance(profiler, type(None)): profiler.exit()
 
 		return Void("--structure-void--")
 
@@ -0,0 +1,51 @@
+from typing import Self
+from modules.components.context import MemoryObject
+
+class Scope:
+	names: dict[str, int] = {}
+	size: int = 0
+
+	def __init__(self: Self, names: list[str] = []) -> None:
+		"""
+		Local names of an algorithm mapped to slot indexes
+		"""
+
+		self.names = {}
+		for name in names:
+			if name not in self.names: self.names[name] = len(self.names)
+
+		self.size = len(self.names)
+
+		return None
+
+	def slot(self: Self, name: str = "") -> int|None:
+		"""
+		Gets the slot index of a local name
+		"""
+
+		return self.names.get(name)
+
+class Frame:
+	scope: Scope = None
+	slots: list[MemoryObject|None] = []
+	result: MemoryObject|None = None
+	alg: MemoryObject = None
+	level: int = 0
+	line: int = 0
+	memos: list[tuple]|None = None
+
+	def __init__(self: Self, scope: Scope = None, alg: MemoryObject = None,
+			level: int = 0, line: int = 0
+		) -> None:
+		"""
+		Locals of one algorithm call made from given source line
+		"""
+
+		self.scope = scope if scope else Scope()
+		self.slots = [None] * self.scope.size
+		self.result = None
+		self.alg = alg
+		self.level = level
+		self.line = line
+
+		return None
@@ -0,0 +1,65 @@
+from typing import Self
+
+class Signal(Exception):
+	def __init__(self: Self) -> None:
+		"""
+		Control flow signal that unwinds running structures
+		"""
+
+		super().__init__()
+
+		return None
+
+class Withdraw(Signal):
+	levels: int = 1
+
+	def __init__(self: Self, levels: int = 1) -> None:
+		"""
+		Exits given amount of levels, counting the level that raised it
+		"""
+
+		super().__init__()
+		self.levels = levels
+
+		return None
+
+class Return(Signal):
+	value: any = None
+
+	def __init__(self: Self, value: any = None) -> None:
+		"""
+		Exits the current algorithm with a value
+		"""
+
+		super().__init__()
+		self.value = value
+
+		return None
+
+class TailCall(Signal):
+	alg: any = None
+	args: list = []
+	line: int = 0
+
+	def __init__(self: Self, alg: any = None, args: list = [], line: int = 0) -> None:
+		"""
+		Replaces the current algorithm call with a call to given algorithm, made from
+		given source line
+		"""
+
+		super().__init__()
+		self.alg = alg
+		self.args = args
+		self.line = line
+
+		return None
+
+class Halt(Signal):
+	def __init__(self: Self) -> None:
+		"""
+		Stops the running program after an error it can not recover from
+		"""
+
+		super().__init__()
+
+		return None
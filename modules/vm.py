@@ -0,0 +1,442 @@
+from typing import Self
+from modules.logger import Logger
+from modules.runtime import Runtime
+from modules.compiler import Compiler, Code
+from modules.components.context import (
+	MemoryObject,
+	Algorithm,
+	Structure,
+	Collection,
+	Number,
+	Void
+)
+from modules.signals import Withdraw, Return
+import modules.opcodes as opcodes
+import modules.errors as errors
+
+class VirtualMachine:
+	MISSING: MemoryObject = MemoryObject("--missing--")
+	BLOCK: list = [2, "--block--"]
+
+	logger: Logger = None
+	runtime: Runtime = None
+	compiler: Compiler = None
+
+	def __init__(self: Self, logger: Logger = None, runtime: Runtime = None,
+			compiler: Compiler = None
+		) -> None:
+		"""
+		Stack based virtual machine for compiled code
+		"""
+
+		self.logger = Logger(exit_on_error=False)
+		if not logger: self.logger.error("Logger missing", errors.ENGINE_ERROR)
+		if not runtime: self.logger.error("Runtime missing", errors.ENGINE_ERROR)
+		if not compiler: self.logger.error("Compiler missing", errors.ENGINE_ERROR)
+		if logger: self.logger = logger
+		if runtime: self.runtime = runtime
+		if compiler: self.compiler = compiler
+
+		return None
+
+	def run(self: Self, chunks: list|Code = []) -> None:
+		"""
+		Compiles and executes code chunks
+		"""
+
+		if not chunks: return None
+		code = chunks if isinstance(chunks, Code) else self.compiler.compile(chunks)
+		depth = len(self.runtime.frames)
+		profiler = self.runtime.profiler
+		profiler_depth = len(profiler.stack) if profiler else 0
+
+		try:
+			self.execute(code)
+		finally:
+			del self.runtime.frames[depth:]
+			if profiler: profiler.unwind(profiler_depth)
+
+		return None
+
+	def get_bytecode(self: Self, alg: Algorithm) -> Code:
+		"""
+		Gets compiled body of a user algorithm, compiling it once if needed
+		"""
+
+		if isinstance(alg.bytecode, type(None)):
+			if not alg.compiled: alg.compile(self.runtime)
+			alg.bytecode = self.compiler.compile(alg.code, alg.name, scope = alg.scope)
+
+		return alg.bytecode
+
+	def fail_call(self: Self, name: str, fail_msg: str|None) -> None:
+		"""
+		Reports a call to something that is not an algorithm
+		"""
+
+		self.runtime.check_alg_exists(name)
+		if fail_msg: self.logger.error(fail_msg, errors.UNDEF_ALG_ERROR)
+
+		return None
+
+	def execute(self: Self, code: Code) -> None:
+		"""
+		Dispatch loop
+		"""
+
+		runtime = self.runtime
+		memory = runtime.memory
+		alg_cache = runtime.alg_cache
+		call_lines = runtime.call_lines
+		profiler = runtime.profiler
+		MISSING = self.MISSING
+		DEFERRED = self.compiler.DEFERRED
+		BLOCK = self.BLOCK
+
+		CALL = opcodes.CALL
+		CALL_BUILTIN = opcodes.CALL_BUILTIN
+		LOAD_CONST = opcodes.LOAD_CONST
+		LOAD_NAME = opcodes.LOAD_NAME
+		LOAD_FAST = opcodes.LOAD_FAST
+		JUMP = opcodes.JUMP
+		FOR_ITER = opcodes.FOR_ITER
+		JUMP_IF_FALSE = opcodes.JUMP_IF_FALSE
+		SETUP_LOOP = opcodes.SETUP_LOOP
+		POP_LOOP = opcodes.POP_LOOP
+		EXIT = opcodes.EXIT
+		SET_RESULT = opcodes.SET_RESULT
+		RETURN = opcodes.RETURN
+		STRUCTURE = opcodes.STRUCTURE
+		INSPECT = opcodes.INSPECT
+		MAKE_ALG = opcodes.MAKE_ALG
+		ERROR = opcodes.ERROR
+
+		instructions = code.instructions
+		pc = 0
+		stack = []
+		loops = []
+		frames = []
+		frame = None
+		slots = None
+		base = 0
+		missing = 0
+
+		while True:
+			op, arg = instructions[pc]
+			pc += 1
+
+			if op == LOAD_FAST:
+				value = slots[arg[0]]
+				if value is None:
+					value = memory.get(arg[1])
+					if value is None:
+						self.logger.error(f"Undefined value: {arg[1]}", errors.UNDEF_ANY_ERROR)
+						value = MISSING
+						missing += 1
+
+				stack.append(value)
+				continue
+
+			if op == LOAD_NAME:
+				value = memory.get(arg)
+				if value is None:
+					self.logger.error(f"Undefined value: {arg}", errors.UNDEF_ANY_ERROR)
+					value = MISSING
+					missing += 1
+
+				stack.append(value)
+				continue
+
+			if op == LOAD_CONST:
+				stack.append(arg)
+				continue
+
+			if op == CALL_BUILTIN:
+				name, store, push, operands, site, store_slot, call = arg
+				builtin = site[1]
+				if builtin is None or profiler is not None or memory.get(name) is not site[0]:
+					op, arg = CALL, call
+				else:
+					values = []
+					for operand, slot, constant in operands:
+						if operand is None: values.append(constant); continue
+
+						value = None if slot is None else slots[slot]
+						if value is None: value = memory.get(operand)
+						if value is None:
+							self.logger.error(f"Undefined value: {operand}", errors.UNDEF_ANY_ERROR)
+							continue
+
+						values.append(value)
+
+					result = builtin(*values)
+					if result is None: result = Void.of()
+					if store_slot is not None and (slots[store_slot] is not None or store not in memory):
+						slots[store_slot] = result
+					elif store: memory[store] = result
+					if push: stack.append(result)
+					continue
+
+			if op == CALL:
+				(
+					name, store, argc, push, deferred, chunk_args, fail_msg, operands, site,
+					store_slot, tail, line
+				) = arg
+
+				if not isinstance(operands, type(None)):
+					values = []
+					for operand, slot, constant in operands:
+						if operand is None: values.append(constant); continue
+
+						value = None if slot is None else slots[slot]
+						if value is None: value = memory.get(operand)
+						if value is None:
+							self.logger.error(f"Undefined value: {operand}", errors.UNDEF_ANY_ERROR)
+							continue
+
+						values.append(value)
+				else:
+					if deferred:
+						resolved = stack[-deferred:]
+						del stack[-deferred:]
+						resolved.reverse()
+					if argc:
+						values = stack[-argc:]
+						del stack[-argc:]
+					else:
+						values = []
+					if deferred:
+						values = [resolved.pop() if v is DEFERRED else v for v in values]
+					if missing:
+						count = len(values)
+						values = [v for v in values if v is not MISSING]
+						missing -= count - len(values)
+
+				alg = memory.get(name)
+				if alg is None or alg is not site[0]:
+					if alg is None or alg.type is not Algorithm:
+						if alg is not None and alg.type is Structure:
+							alg_data = [2, name, store] if store else [2, name]
+							try:
+								result = runtime.run_algorithm(alg_data, chunk_args, line = line)
+							except (Withdraw, Return) as signal:
+								if missing: missing -= len([v for v in stack[base:] if v is MISSING])
+								del stack[base:]
+								if type(signal) is Return: frame.result = signal.value
+								pc = len(instructions) - 1
+								continue
+
+							if push: stack.append(result)
+							continue
+
+						self.fail_call(name, fail_msg)
+						if push: stack.append(MISSING); missing += 1
+						continue
+
+					site[0] = alg
+					site[1] = None
+					if callable(alg.code) and alg.rich_data and not alg.need_engine:
+						site[1] = alg.code
+
+				alg_code = alg.code
+				if callable(alg_code):
+					if profiler is not None: profiler.enter(profiler.BUILTIN, name, line)
+					try:
+						if alg.need_engine:
+							alg_cache.append([1, name, store] if store else [1, name])
+							call_lines.append(line)
+							result = alg_code(*values, runtime)
+							del alg_cache[-1]
+							del call_lines[-1]
+						elif alg.rich_data:
+							result = alg_code(*values)
+						else:
+							result = MemoryObject(value = alg_code(*[v.value for v in values]))
+					finally:
+						if profiler is not None: profiler.exit()
+
+					if result is None: result = Void.of()
+					if store_slot is not None and (slots[store_slot] is not None or store not in memory):
+						slots[store_slot] = result
+					elif store: memory[store] = result
+					if push: stack.append(result)
+					continue
+
+				if not alg_code:
+					if push: stack.append(MISSING); missing += 1
+					continue
+
+				memo = alg.memo
+				memo_key = None
+				if memo is not None:
+					memo_key = memo.key(values)
+					if memo_key is not None:
+						result = memo.get(memo_key)
+						if result is not None:
+							if store_slot is not None and (slots[store_slot] is not None or store not in memory):
+								slots[store_slot] = result
+							elif store: memory[store] = result
+							if push: stack.append(result)
+							continue
+
+				if profiler is not None:
+					if tail: profiler.exit()
+					profiler.enter(profiler.ALGORITHM, name, line)
+
+				memos = None
+				if tail:
+					memos = frame.memos
+					runtime.pop_frame()
+				else: frames.append((instructions, pc, loops, frame, slots, base, store, store_slot, push))
+				instructions = self.get_bytecode(alg).instructions
+				pc = 0
+				loops = []
+				base = len(stack)
+
+				frame = runtime.push_frame(alg, line)
+				slots = frame.slots
+				if memo_key is not None:
+					if memos is None: memos = []
+					memos.append((memo, memo_key))
+				frame.memos = memos
+				args_name = alg.args_collection_name
+				if args_name:
+					slots[frame.scope.slot(args_name)] = Collection(
+						name = f"--args--{alg.name}",
+						value = values
+					)
+				continue
+
+			if op == FOR_ITER:
+				loop = loops[-1]
+				index = loop[0]
+				if index == loop[1]:
+					pc = arg
+					continue
+
+				loop[0] = index + 1
+				if loop[4] is not None: slots[loop[4]] = Number(loop[2], index)
+				elif loop[2] is not None: memory[loop[2]] = Number(loop[2], index)
+				continue
+
+			if op == JUMP_IF_FALSE:
+				argc, target = arg
+				if argc == 1 and not missing:
+					if not stack.pop().to_binary(): pc = target
+					continue
+
+				values = stack[-argc:]
+				del stack[-argc:]
+				if missing:
+					values = [v for v in values if v is not MISSING]
+					missing -= argc - len(values)
+
+				if not (values and all(v.to_binary() for v in values)): pc = target
+				continue
+
+			if op == JUMP:
+				pc = arg
+				continue
+
+			if op == SETUP_LOOP:
+				amount, var, slot = arg
+				if amount is not None: amount = max(amount, 0)
+				if slot is not None and slots[slot] is None and var in memory: slot = None
+				old_value = None if slot is None else slots[slot]
+				if old_value is None and var is not None: old_value = memory.get(var)
+				loops.append([0, amount, var, old_value, slot])
+				continue
+
+			if op == POP_LOOP or op == EXIT:
+				loop_count = 1 if op == POP_LOOP else arg[0]
+				for _ in range(loop_count):
+					_, _, var, old_value, slot = loops.pop()
+					if old_value is None: continue
+					if slot is not None: slots[slot] = old_value
+					else: memory[var] = old_value
+
+				if op == EXIT: pc = arg[1]
+				continue
+
+			if op == SET_RESULT:
+				argc = arg
+				values = stack[-argc:] if argc else []
+				if argc: del stack[-argc:]
+				if missing:
+					values = [v for v in values if v is not MISSING]
+					missing -= argc - len(values)
+
+				if len(values) > 1:
+					self.logger.error("You can result atmost one value only", errors.RETURN_VAR_ERROR)
+					pc += 1
+					continue
+
+				frame.result = values[0] if values else Void.of()
+				continue
+
+			if op == RETURN:
+				if not frames: break
+
+				result = frame.result
+				if result is None: result = Void.of()
+				if frame.memos is not None:
+					for memo, memo_key in frame.memos: memo.put(memo_key, result)
+				runtime.pop_frame()
+				if profiler is not None: profiler.exit()
+
+				instructions, pc, loops, frame, slots, base, store, store_slot, push = frames.pop()
+				if store_slot is not None and (slots[store_slot] is not None or store not in memory):
+					slots[store_slot] = result
+				elif store: memory[store] = result
+				if push: stack.append(result)
+				continue
+
+			if op == STRUCTURE:
+				name, store, chunk_args, push, exits, depth, line = arg
+				alg_data = [2, name, store] if store else [2, name]
+				alg_cache.extend([BLOCK] * depth)
+				call_lines.extend([line] * depth)
+				try:
+					result = runtime.run_algorithm(alg_data, chunk_args, line = line)
+				except (Withdraw, Return) as signal:
+					if missing: missing -= len([v for v in stack[base:] if v is MISSING])
+					del stack[base:]
+					if type(signal) is Return:
+						frame.result = signal.value
+					elif exits is not None and signal.levels <= depth:
+						pc = exits + signal.levels - 1
+						continue
+
+					pc = len(instructions) - 1
+					continue
+				finally:
+					del alg_cache[len(alg_cache) - depth:]
+					del call_lines[len(call_lines) - depth:]
+
+				if push: stack.append(result)
+				continue
+
+			if op == INSPECT:
+				name, slot = arg
+				if (slot is None or slots[slot] is None) and name not in memory:
+					self.logger.error(f"Unknown object/algorithm: {name}", errors.UNDEF_ANY_ERROR)
+				continue
+
+			if op == MAKE_ALG:
+				alg_name, args_collection_name, chunk_args, body, scope = arg
+				alg = Algorithm(
+					name = alg_name,
+					code = chunk_args,
+					args_collection_name = args_collection_name
+				)
+				alg.scope = scope
+				alg.bytecode = body
+				alg.compiled = True
+				memory[alg_name] = alg
+				continue
+
+			if op == ERROR:
+				self.logger.error(*arg)
+				continue
+
+		return None
@@ -0,0 +1,129 @@
+import textwrap
+import sys
+import os
+import io
+import re
+import pytest
+
+ENGINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+BACKEND_ARGS = {
+	"tree": [],
+	"vm": ["*vm"]
+}
+ANSI_CODES = re.compile(r"\x1b\[[0-9;]*m")
+
+sys.path.insert(0, os.path.dirname(ENGINE_PATH))
+
+from modules import (
+	Esolang,
+	Logger,
+	Iterator,
+	Runtime,
+	Compiler,
+	VirtualMachine,
+	CodeCache,
+	Profiler,
+	Sampler
+)
+from modules.components.functions import (
+	Modules,
+	Comments,
+	IO,
+	Variable,
+	System,
+	Operations,
+	Maths,
+	Statistics,
+	Loops,
+	Logic
+)
+
+MODULES = [Comments, IO, Variable, System, Operations, Maths, Statistics, Loops, Logic]
+
+class Result:
+	def __init__(self, out: str = "", err: str = "", returncode: int = 0, engine: Esolang = None) -> None:
+		"""
+		Output of a Synt run, with colors removed
+		"""
+
+		self.returncode = returncode
+		self.out = ANSI_CODES.sub("", out)
+		self.err = ANSI_CODES.sub("", err)
+		self.lines = self.out.splitlines()
+		self.engine = engine
+
+		return None
+
+def write_source(path, source: str) -> str:
+	"""
+	Writes dedented Synt source, indented with tabs, to a file
+	"""
+
+	path.write_text(textwrap.dedent(source).lstrip("\n"), encoding="utf-8")
+	return str(path)
+
+def create_engine() -> Esolang:
+	"""
+	Creates an engine with state of its own, wired like main.py, reading flags
+	from sys.argv
+	"""
+
+	logger = Logger(level = Logger.DEBUG, exit_on_error = False)
+	iterator = Iterator(logger = logger)
+	runtime = Runtime(logger = logger, iterator = iterator)
+	compiler = Compiler(logger = logger, runtime = runtime)
+
+	return Esolang(
+		{"NAME": "Synt"},
+		logger = logger,
+		iterator = iterator,
+		runtime = runtime,
+		vm = VirtualMachine(logger = logger, runtime = runtime, compiler = compiler),
+		code_cache = CodeCache(logger = logger, iterator = iterator),
+		profiler = Profiler(logger = logger),
+		sampler = Sampler(logger = logger, runtime = runtime),
+		modules = Modules(modules = MODULES, logger = logger)
+	)
+
+@pytest.fixture(params = list(BACKEND_ARGS))
+def backend(request) -> str:
+	return request.param
+
+@pytest.fixture
+def synt(tmp_path, monkeypatch, capsys):
+	"""
+	Runs Synt source in this interpreter with a new engine, from the test directory
+	"""
+
+	monkeypatch.chdir(tmp_path)
+
+	def run_source(source: str, *args: str, stdin: str|io.TextIOBase = "", name: str = "main.synt") -> Result:
+		path = write_source(tmp_path / name, source)
+		monkeypatch.setattr(sys, "argv", [ENGINE_PATH, path, *args])
+		monkeypatch.setattr(sys, "stdin", io.StringIO(stdin) if isinstance(stdin, str) else stdin)
+		capsys.readouterr()
+
+		engine = create_engine()
+		returncode = 0
+		try:
+			engine.main()
+		except SystemExit as exit:
+			returncode = exit.code or 0
+		finally:
+			engine.logger.flush()
+
+		captured = capsys.readouterr()
+		return Result(captured.out, captured.err, returncode, engine)
+
+	return run_source
+
+@pytest.fixture
+def run(synt, backend):
+	"""
+	Runs Synt source on the backend of the test
+	"""
+
+	def run_source(source: str, *args: str, **options) -> Result:
+		return synt(source, *BACKEND_ARGS[backend], *args, **options)
+
+	return run_source
@@ -0,0 +1,46 @@
+from modules.components.context import Algorithm
+
+def test_algorithm_runs_on_every_call(run):
+	result = run("""
+		alg(twice, args)
+			result
+				multiply
+					item
+						args
+						0
+					2
+		repeat(3, i)
+			twice(value)
+				i
+			out
+				value
+	""")
+
+	assert result.lines == ["0", "2", "4"]
+
+def test_algorithm_defined_from_text_body(run):
+	result = run("""
+		alg(greet)
+			out
+				"hi
+		greet(x)
+		greet(x)
+	""")
+
+	assert result.lines == ["hi", "hi"]
+
+def test_body_is_compiled_once(synt, monkeypatch):
+	compiled = []
+	compile_body = Algorithm.compile
+	monkeypatch.setattr(Algorithm, "compile", lambda alg, engine = None: compiled.append(alg.name) or compile_body(alg, engine))
+
+	result = synt("""
+		alg(noop)
+			out
+				"x
+		repeat(5, i)
+			noop(value)
+	""")
+
+	assert result.lines == ["x"] * 5
+	assert compiled.count("noop") == 1
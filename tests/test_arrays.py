@@ -0,0 +1,77 @@
+from modules.logger import Logger
+from modules.components.functions import Maths
+from modules.components.context import Number, Decimal, Binary, Array
+import pytest
+
+ARRAY = """
+		array(a)
+			1
+			2
+			3
+"""
+
+def test_scalar_broadcast(run):
+	result = run(ARRAY + """
+		+(b)
+			a
+			10
+		out
+			b
+	""")
+
+	assert result.lines == ["111213"]
+
+def test_elementwise_product(run):
+	result = run(ARRAY + """
+		*(c)
+			a
+			a
+			2
+		@(e)
+			c
+			2
+		out
+			e
+	""")
+
+	assert result.lines == ["18"]
+
+def test_decimal_elements(run):
+	result = run(ARRAY + """
+		collection(g)
+			1
+			"2.5
+		array(h)
+			g
+			a
+		out
+			h
+	""")
+
+	assert result.lines == ["1.02.51.02.03.0"]
+
+def test_length_mismatch_is_an_error(run):
+	result = run(ARRAY + """
+		array(k)
+			1
+			2
+		+(z)
+			a
+			k
+	""")
+
+	assert "Arrays must be of the same length" in result.out
+
+def test_scalar_arguments_skip_broadcasting(monkeypatch):
+	maths = Maths(Logger(buffer_size = 0))
+	monkeypatch.setattr(maths, "broadcast", lambda *args: pytest.fail("broadcast over scalars"))
+
+	assert maths.add(Number(None, 2), Decimal(None, 0.5), Binary(None, True)).value == 3.5
+	assert maths.operands((Number(None, 2), Binary(None, True))) == [2, 1]
+
+def test_array_argument_is_broadcast():
+	maths = Maths(Logger(buffer_size = 0))
+	array = Array(None, [1, 2, 3])
+
+	assert maths.operands((Number(None, 1), array)) is None
+	assert list(maths.multiply(array, Number(None, 2)).value) == [2, 4, 6]
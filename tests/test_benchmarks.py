@@ -0,0 +1,44 @@
+from conftest import BACKEND_ARGS
+from benchmarks.harness import Harness
+from benchmarks.workloads import WORKLOADS
+from benchmarks.__main__ import parser
+import pytest
+
+PROGRAMS = [workload for workload in WORKLOADS if not workload.parse_only]
+
+def results(**medians: int) -> dict:
+	return {"results": {name: {"median": median} for name, median in medians.items()}}
+
+def test_compare_flags_slowdowns_over_threshold():
+	rows = Harness.compare(results(fast = 100, slow = 100), results(fast = 104, slow = 120), 0.05)
+
+	assert [(row["name"], row["regression"]) for row in rows] == [("fast", False), ("slow", True)]
+	assert rows[1]["change"] == pytest.approx(0.2)
+
+def test_compare_skips_missing_benchmarks():
+	assert Harness.compare(results(old = 100), results(new = 100)) == []
+
+def test_measure_repeats_runs():
+	calls = []
+	harness = Harness(warmup = 2, repeat = 3)
+	result = harness.measure(lambda: calls.append(1) or len(calls))
+
+	assert len(calls) == 5
+	assert result["runs"] == [3, 4, 5]
+	assert result["median"] == 4
+
+def test_compare_command_fails_on_regression(tmp_path, capsys):
+	base, new = tmp_path / "base.json", tmp_path / "new.json"
+	Harness.save(results(fib = 100), str(base))
+	Harness.save(results(fib = 200), str(new))
+	arguments = parser.parse_args(["compare", str(base), str(new)])
+
+	assert arguments.handler(arguments) == 1
+	assert "REGRESSION" in capsys.readouterr().out
+
+@pytest.mark.parametrize("workload", PROGRAMS, ids = [workload.name for workload in PROGRAMS])
+def test_workloads_run_cleanly(workload, backend, synt):
+	result = synt(workload.source(), *BACKEND_ARGS[backend], name = f"{workload.name}.synt")
+
+	assert result.returncode == 0
+	assert "ERROR" not in result.out
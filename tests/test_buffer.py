@@ -0,0 +1,47 @@
+from modules.logger import Logger
+
+def test_output_waits_for_full_buffer(capsys):
+	logger = Logger(buffer_size = 8)
+	logger.out("abc")
+
+	assert capsys.readouterr().out == ""
+
+	logger.out("defgh")
+	assert capsys.readouterr().out == "abc\ndefgh\n"
+
+def test_flush_writes_buffer(capsys):
+	logger = Logger(buffer_size = 1024)
+	logger.out("data")
+	logger.flush()
+
+	assert capsys.readouterr().out == "data\n"
+
+def test_unbuffered_writes_immediately(capsys):
+	logger = Logger(buffer_size = 0)
+	logger.out("data")
+
+	assert capsys.readouterr().out == "data\n"
+
+def test_errors_keep_their_place_in_output(run):
+	result = run("""
+		out
+			"before
+		missing(value)
+		out
+			"after
+	""")
+
+	assert result.lines[0] == "before"
+	assert "Undefined algorithm: missing" in result.lines[1]
+	assert result.lines[2] == "after"
+
+def test_output_is_written_at_exit(run):
+	result = run("""
+		repeat(3, i)
+			out
+				i
+		out
+			"done
+	""", "*buffer=1048576")
+
+	assert result.lines == ["0", "1", "2", "done"]
@@ -0,0 +1,47 @@
+from modules.logger import Logger
+from modules.iterator import Iterator
+from modules.cache import CodeCache
+import json
+
+SOURCE = """
+	repeat(3, i)
+		out
+			i
+"""
+
+def cache_file(tmp_path):
+	return tmp_path / "__syntcache__" / "main.synt.json"
+
+def test_run_writes_cache(run, tmp_path):
+	assert run(SOURCE).lines == ["0", "1", "2"]
+	assert "chunks" in json.loads(cache_file(tmp_path).read_text(encoding="utf-8"))
+
+def test_cached_run_gives_same_output(run):
+	first = run(SOURCE)
+	assert run(SOURCE).out == first.out
+
+def test_corrupt_cache_is_rewritten(run, tmp_path):
+	run(SOURCE)
+	cache_file(tmp_path).write_text("{not json", encoding="utf-8")
+
+	assert run(SOURCE).lines == ["0", "1", "2"]
+	assert "chunks" in json.loads(cache_file(tmp_path).read_text(encoding="utf-8"))
+
+def test_changed_source_is_not_read_from_cache(run):
+	run(SOURCE)
+	assert run(SOURCE.replace("3", "2")).lines == ["0", "1"]
+
+def test_nocache_writes_no_cache(run, tmp_path):
+	assert run(SOURCE, "*nocache").lines == ["0", "1", "2"]
+	assert not cache_file(tmp_path).exists()
+
+def test_cached_chunks_keep_line_numbers(tmp_path):
+	logger = Logger(buffer_size = 0)
+	cache = CodeCache(logger, Iterator(logger = logger))
+	path = str(tmp_path / "main.synt")
+	source = "out\n\n\t1\nout\n"
+	cache.iterate(path, source)
+	chunks = cache.load(path, source)
+
+	assert chunks == [["out", ["1"]], "out"]
+	assert [chunks[0][0].number, chunks[0][1][0].number, chunks[1].number] == [1, 3, 4]
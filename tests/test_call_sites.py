@@ -0,0 +1,37 @@
+def test_redefined_algorithm_is_called(run):
+	result = run("""
+		alg(pick)
+			result
+				"first
+		repeat(2, i)
+			pick(value)
+			out
+				value
+			alg(pick)
+				result
+					"second
+	""")
+
+	assert result.lines == ["first", "second"]
+
+def test_undefined_algorithm_is_reported_every_call(run):
+	result = run("""
+		repeat(2, i)
+			missing(value)
+	""")
+
+	assert result.out.count("Undefined algorithm: missing") == 2
+
+def test_algorithm_rebound_to_a_value_is_not_called(run):
+	result = run("""
+		alg(pick)
+			result
+				"first
+		repeat(2, i)
+			pick(value)
+			add(pick)
+				1
+	""")
+
+	assert result.out.count("pick is not an algorithm, but Number") == 1
+	assert type(result.engine.runtime.memory) is dict
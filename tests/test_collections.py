@@ -0,0 +1,68 @@
+COLLECTION = """
+		kv(k)
+			"x
+			5
+		collection(c)
+			10
+			k
+			20
+			30
+"""
+
+def test_lookup_by_index_and_key(run):
+	result = run(COLLECTION + """
+		@(a)
+			c
+			2
+		out
+			a
+		@(b)
+			c
+			"x
+		out
+			b
+	""")
+
+	assert result.lines == ["30", "5"]
+
+def test_auto_index_skips_used_keys(run):
+	result = run("""
+		kv(k)
+			0
+			"zero
+		collection(c)
+			k
+			"first
+			"second
+		@(a)
+			c
+			0
+		out
+			a
+		@(b)
+			c
+			1
+		out
+			b
+		@(d)
+			c
+			2
+		out
+			d
+	""")
+
+	assert result.lines == ["zero", "first", "second"]
+
+def test_algorithm_arguments_are_not_shared(run):
+	result = run("""
+		alg(f, args)
+			out
+				args
+		f(z)
+			1
+			2
+		f(z)
+			3
+	""")
+
+	assert result.lines == ["12", "3"]
@@ -0,0 +1,77 @@
+from modules.logger import Logger
+from modules.iterator import Iterator
+from modules.runtime import Runtime
+import sys
+
+DEEP = """
+	alg(deep, args)
+		var(n)
+			number
+			item
+				args
+				0
+		if(n)
+			deep(value)
+				subtract
+					n
+					1
+			result
+				value
+		result
+			"bottom
+	deep(value)
+		{depth}
+	out
+		value
+"""
+
+def test_calls_up_to_limit_run(run):
+	limit = sys.getrecursionlimit()
+
+	assert run(DEEP.format(depth = Runtime.MAX_DEPTH - 10)).lines == ["bottom"]
+	assert sys.getrecursionlimit() == limit
+
+def test_calls_past_limit_are_reported(run):
+	result = run(DEEP.format(depth = Runtime.MAX_DEPTH + 500))
+
+	assert "Maximum depth of 1000 calls exceeded" in result.out
+	assert "Maximum nesting depth exceeded" not in result.out
+
+def test_depth_limit_is_reported(run):
+	result = run(DEEP.format(depth = 50), "*depth=10")
+	assert "Maximum depth of 10 calls exceeded" in result.out
+
+def nested_blocks(depth):
+	lines = ["var(flag)", "\tbinary", "\tTRUE"]
+	lines += ["\t" * level + "if(flag)" for level in range(depth)]
+	lines += ["\t" * depth + "out", "\t" * (depth + 1) + "\"deep"]
+
+	return "\n".join(lines)
+
+def test_nested_structures(run):
+	assert run(nested_blocks(40)).lines == ["deep"]
+
+def test_deeply_nested_structures(run):
+	assert run(nested_blocks(2000)).lines == ["deep"]
+
+def test_too_deep_structures_are_a_synt_error(synt):
+	result = synt(nested_blocks(20000))
+
+	assert "Maximum nesting depth exceeded" in result.out
+
+def test_vm_runs_deeply_nested_arguments(synt):
+	depth = 2000
+	lines = ["out"]
+	lines += ["\t" * (level + 1) + "add" for level in range(depth)]
+	lines += ["\t" * (depth + 1) + "1"]
+	lines += ["\t" * (level + 2) + "1" for level in range(depth - 1, -1, -1)]
+
+	assert synt("\n".join(lines), "*vm").lines == [str(depth + 1)]
+
+def test_depth_is_kept_per_runtime():
+	logger = Logger()
+	limited = Runtime(logger, Iterator(logger = logger), max_depth = 5)
+	default = Runtime(logger, Iterator(logger = logger))
+
+	assert (limited.MAX_DEPTH, default.MAX_DEPTH) == (5, 1000)
+	assert limited.memory is not default.memory
@@ -0,0 +1,44 @@
+def test_literal_types(run):
+	result = run("""
+		info(n)
+			12
+		info(d)
+			1.5
+		info(t)
+			"word
+		info(b)
+			TRUE
+		out
+			item
+				n
+				"type
+		out
+			item
+				d
+				"type
+		out
+			item
+				t
+				"type
+		out
+			item
+				b
+				"type
+	""")
+
+	assert result.lines == ["Number", "Decimal", "Text", "Binary"]
+
+def test_literals_in_loop_are_constant(run):
+	result = run("""
+		var(total)
+			number
+			0
+		repeat(4, i)
+			add(total)
+				total
+				10
+		out
+			total
+	""")
+
+	assert result.lines == ["40"]
@@ -0,0 +1,39 @@
+from modules.logger import Logger
+
+def test_history_is_bounded_by_default():
+	logger = Logger(buffer_size = 0)
+	for index in range(2000): logger.save_to_history(str(index))
+
+	assert len(logger.history) == Logger.HISTORY_SIZE
+	assert logger.history[-1][1] == "1999"
+
+def test_history_keeps_last_entries():
+	logger = Logger(history_size = 3, buffer_size = 0)
+	for index in range(5): logger.save_to_history(str(index))
+
+	assert [data for _, data in logger.history] == ["2", "3", "4"]
+
+def test_history_can_be_disabled():
+	logger = Logger(history_size = 0, buffer_size = 0)
+	logger.save_to_history("data")
+
+	assert not logger.history
+
+def test_filtered_debug_is_not_formatted(capsys):
+	class Message:
+		def __str__(self):
+			raise AssertionError("formatted")
+
+	logger = Logger(level = Logger.WARNING, buffer_size = 0)
+	logger.debug("hidden ", Message())
+
+	assert capsys.readouterr().out == ""
+	assert not logger.history
+
+def test_saved_history_is_plain_text(tmp_path):
+	logger = Logger(level = Logger.DEBUG, buffer_size = 0)
+	logger.warning("careful")
+	path = tmp_path / "logs" / "history.log"
+	logger.save_history(str(path))
+
+	assert path.read_text().endswith("[WARNING]: careful")
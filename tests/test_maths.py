@@ -0,0 +1,60 @@
+def test_integer_power_is_exact(run):
+	result = run("""
+		power(p)
+			2
+			100
+		out
+			p
+	""")
+
+	assert result.lines == [str(2 ** 100)]
+
+def test_integer_results_stay_numbers(run):
+	result = run("""
+		var(total)
+			number
+			0
+		repeat(3, i)
+			add(total)
+				total
+				i
+		out
+			total
+		multiply(m)
+			total
+			3
+		out
+			m
+	""")
+
+	assert result.lines == ["3", "9"]
+
+def test_decimal_operand_promotes(run):
+	result = run("""
+		add(s)
+			1
+			0.5
+		out
+			s
+		divide(q)
+			4
+			2
+		out
+			q
+	""")
+
+	assert result.lines == ["1.5", "2.0"]
+
+def test_integer_arrays_stay_integers(run):
+	result = run("""
+		array(a)
+			1
+			2
+		*(b)
+			a
+			3
+		out
+			b
+	""")
+
+	assert result.lines == ["36"]
@@ -0,0 +1,139 @@
+from conftest import BACKEND_ARGS
+from modules.components.context import Memo, Number, Text, Collection
+
+FIB = """
+		memo
+			alg(fib, args)
+				lesser(small)
+					item
+						args
+						0
+					2
+				if(small)
+					result
+						item
+							args
+							0
+				result
+					add
+						fib
+							subtract
+								item
+									args
+									0
+								1
+						fib
+							subtract
+								item
+									args
+									0
+								2
+"""
+
+def test_memoized_recursion(run):
+	result = run(FIB + """
+		fib(value)
+			60
+		out
+			value
+		memo-stats(stats)
+			fib
+		out
+			stats
+	""")
+
+	assert result.lines == ["1548008755920", "58, 61, 61, 1024"]
+
+def test_memo_size_evicts_results(run):
+	result = run("""
+		memo(2)
+			alg(echo, args)
+				out
+					"run
+				result
+					item
+						args
+						0
+		echo(a)
+			1
+		echo(a)
+			2
+		echo(a)
+			1
+		echo(a)
+			3
+		echo(a)
+			2
+		memo-stats(stats)
+			echo
+		out
+			stats
+	""")
+
+	assert result.lines == ["run", "run", "run", "run", "1, 4, 2, 2"]
+
+def test_unmemoized_algorithm_has_no_stats(run):
+	result = run("""
+		alg(plain)
+			result
+				1
+		memo-stats(stats)
+			plain
+	""")
+
+	assert "plain is not a memoized algorithm" in result.out
+
+def test_least_recently_used_is_evicted():
+	memo = Memo(2)
+	memo.put(("a",), Number(None, 1))
+	memo.put(("b",), Number(None, 2))
+	memo.get(("a",))
+	memo.put(("c",), Number(None, 3))
+
+	assert list(memo.results) == [("a",), ("c",)]
+	assert (memo.hits, memo.misses) == (1, 0)
+
+def test_only_values_are_keys():
+	memo = Memo()
+
+	assert memo.key([Number(None, 1), Text(None, "x")]) == ((Number, 1), (Text, "x"))
+	assert memo.key([Collection(None, value = [Number(None, 1)])]) is None
+
+def test_tail_call_keeps_caller_entry_on_both_backends(synt):
+	source = """
+		memo
+			alg(next, args)
+				result
+					add
+						item
+							args
+							0
+						1
+			alg(forward, args)
+				result
+					next
+						item
+							args
+							0
+		forward(a)
+			1
+		forward(b)
+			1
+		next(c)
+			1
+		next(d)
+			2
+		memo-stats(stats)
+			forward
+		out
+			stats
+		memo-stats(stats)
+			next
+		out
+			stats
+	"""
+
+	outputs = [synt(source, *BACKEND_ARGS[backend]).lines for backend in BACKEND_ARGS]
+
+	assert outputs[0] == ["1, 1, 1, 1024", "1, 2, 2, 1024"]
+	assert outputs[0] == outputs[1]
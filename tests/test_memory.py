@@ -0,0 +1,29 @@
+from modules.components.context import Number, Decimal, Binary, Text, Void
+
+def test_small_numbers_are_shared():
+	assert Number.of(7) is Number.of(7)
+	assert Number.of(1000) is not Number.of(1000)
+	assert Binary.of(True) is Binary.of(True)
+	assert Void.of() is Void.of()
+
+def test_scalars_have_no_dict():
+	assert not any(hasattr(value, "__dict__") for value in (Number(None, 1), Decimal(None, 1.0), Text(None, "a")))
+
+def test_named_values_are_not_shared(run):
+	result = run("""
+		var(a)
+			number
+			5
+		var(b)
+			number
+			5
+		add(a)
+			a
+			1
+		out
+			a
+		out
+			b
+	""")
+
+	assert result.lines == ["6", "5"]
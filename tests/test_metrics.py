@@ -0,0 +1,47 @@
+from modules.metrics import Metrics
+from modules.logger import Logger
+import json
+import time
+import io
+
+class SlowInput(io.StringIO):
+	def readline(self, *args) -> str:
+		time.sleep(0.5)
+		return super().readline(*args)
+
+def test_metrics_are_saved_by_phase(run, tmp_path):
+	result = run("""
+		repeat(3, i)
+			out
+				i
+	""", "*metrics=metrics.json")
+	metrics = json.loads((tmp_path / "metrics.json").read_text())
+	phases = metrics["phases"]
+
+	assert result.lines == ["0", "1", "2"]
+	assert set(phases) == set(Metrics.PHASES)
+	assert phases["exec"]["count"] >= 1
+	assert metrics["engine"] == sum(phases[phase]["time"] for phase in phases if phase != "input")
+
+def test_metrics_are_printed(run):
+	result = run("out\n\t1\n", "*metrics")
+
+	assert result.lines[0] == "1"
+	assert result.lines[1].startswith("Metrics: engine")
+
+def test_input_wait_is_not_execution(run, tmp_path):
+	result = run("input(name)\nout\n\tname\n", "*metrics=metrics.json", stdin = SlowInput("synt\n"))
+	phases = json.loads((tmp_path / "metrics.json").read_text())["phases"]
+
+	assert result.lines == ["synt"]
+	assert phases["input"]["time"] >= 0.3e9
+	assert phases["exec"]["time"] < 0.3e9
+
+def test_engine_time_leaves_out_input():
+	metrics = Metrics(logger = Logger(buffer_size = 0))
+	metrics.add(Metrics.EXEC, 10)
+	metrics.add(Metrics.PARSE, 5, 2)
+	metrics.add(Metrics.INPUT, 100)
+
+	assert metrics.engine_time() == 15
+	assert metrics.to_dict()["phases"]["parse"] == {"time": 5, "count": 2}
@@ -0,0 +1,151 @@
+import multiprocessing
+
+def test_blocks_set_result_variables_in_order(run):
+	result = run("""
+		var(a)
+			number
+			0
+		var(b)
+			number
+			0
+		var(c)
+			text
+			"keep
+		parallel(a, b)
+			add(a)
+				a
+				1
+			add(b)
+				b
+				2
+			var(c)
+				text
+				"changed
+		out
+			a
+			b
+			c
+	""")
+
+	assert result.lines == ["12keep"]
+
+def test_blocks_start_from_the_same_memory(run):
+	result = run("""
+		var(x)
+			number
+			1
+		parallel(x)
+			add(x)
+				x
+				10
+			add(x)
+				x
+				100
+		out
+			x
+	""")
+
+	assert result.lines == ["101"]
+
+def test_output_is_kept_in_block_order(run):
+	result = run("""
+		parallel
+			repeat(20000, i)
+				var(z)
+					number
+					i
+			out
+				"first
+			out
+				"second
+	""")
+
+	assert result.lines == ["first", "second"]
+
+def test_nested_parallel(run):
+	result = run("""
+		alg(inner)
+			var(y)
+				number
+				0
+			parallel(y)
+				add(y)
+					y
+					5
+			result
+				y
+		var(z)
+			number
+			0
+		parallel(z)
+			inner(z)
+			out
+				"second
+		out
+			z
+	""")
+
+	assert result.lines == ["second", "5"]
+
+def test_result_from_block_returns_after_blocks(run):
+	result = run("""
+		alg(early)
+			parallel
+				out
+					"a
+				result
+					"from-block
+			out
+				"never
+		early(e)
+		out
+			e
+	""")
+
+	assert result.lines == ["a", "from-block"]
+
+def test_withdraw_from_block_leaves_loops(run):
+	result = run("""
+		repeat(3, i)
+			parallel
+				if(TRUE)
+					out
+						i
+					withdraw(3)
+			out
+				"never
+		out
+			"after
+	""")
+
+	assert result.lines == ["0", "after"]
+
+def test_end_in_block_ends_program_after_blocks(run):
+	result = run("""
+		parallel
+			end(x)
+			out
+				"second
+		out
+			"never
+	""")
+
+	assert result.lines == ["second"]
+
+def test_blocks_run_in_order_without_fork(run, monkeypatch):
+	monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+	result = run("""
+		var(x)
+			number
+			1
+		parallel(x)
+			add(x)
+				x
+				10
+			out
+				x
+		out
+			x
+	""")
+
+	assert result.lines == ["11", "11"]
@@ -0,0 +1,33 @@
+from modules.logger import Logger
+from modules.iterator import Iterator
+import pytest
+
+@pytest.fixture
+def iterator():
+	return Iterator(logger = Logger(buffer_size = 0))
+
+def test_nested_chunks(iterator):
+	code = "alg(f)\n\tout\n\t\t1\n\t\t2\n\tout\nout\n"
+
+	assert iterator.iterate(code) == [["alg(f)", [["out", ["1", "2"]], "out"]], "out"]
+
+def test_space_indentation(iterator):
+	assert iterator.iterate("out\n    1\n") == [["out", ["1"]]]
+
+def test_blank_lines_are_skipped(iterator):
+	assert iterator.iterate("out\n\n\t1\n\n") == [["out", ["1"]]]
+
+def test_unexpected_indentation(iterator, capsys):
+	chunks = iterator.iterate("out\n\t1\n\t\t\t2\nout\n")
+
+	assert chunks == [["out", ["1"]], "out"]
+	assert iterator.has_errors
+	assert "Unexpected Indentation in Line 3" in capsys.readouterr().out
+
+def test_deep_nesting(iterator):
+	depth = 5000
+	code = "\n".join("\t" * level + "out" for level in range(depth))
+	chunk = iterator.iterate(code)[0]
+
+	for _ in range(depth - 2): chunk = chunk[1][0]
+	assert chunk == ["out", ["out"]]
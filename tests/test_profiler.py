@@ -0,0 +1,77 @@
+from modules.logger import Logger
+from modules.profiler import Profiler
+import json
+import time
+
+FIB = """
+	alg(fib, args)
+		lesser(small)
+			item
+				args
+				0
+			2
+		if(small)
+			result
+				item
+					args
+					0
+		result
+			add
+				fib
+					subtract
+						item
+							args
+							0
+						1
+				fib
+					subtract
+						item
+							args
+							0
+						2
+	fib(value)
+		10
+	out
+		value
+"""
+
+def test_profile_counts_algorithm_calls(run, tmp_path):
+	result = run(FIB, "*profile=profile.json")
+	profile = json.loads((tmp_path / "profile.json").read_text())
+	calls = {}
+	for entry in profile["entries"]:
+		calls.setdefault((entry["kind"], entry["name"]), {})[entry["line"]] = entry["calls"]
+
+	assert result.lines[0] == "55"
+	assert profile["unit"] == "ns"
+	assert calls[("algorithm", "fib")] == {14: 88, 20: 88, 26: 1}
+	assert calls[("builtin", "out")] == {28: 1}
+
+def test_profile_is_saved_next_to_source(run, tmp_path):
+	run(FIB, "*profile")
+
+	assert (tmp_path / "main.synt.profile.json").is_file()
+
+def test_recursive_time_is_counted_once(monkeypatch):
+	clock = iter(range(0, 1000, 10))
+	monkeypatch.setattr(time, "perf_counter_ns", lambda: next(clock))
+
+	profiler = Profiler(logger = Logger(buffer_size = 0))
+	profiler.enter(Profiler.ALGORITHM, "f", 1)
+	profiler.enter(Profiler.ALGORITHM, "f", 1)
+	profiler.enter(Profiler.BUILTIN, "out", 2)
+	profiler.exit()
+	profiler.exit()
+	profiler.exit()
+
+	assert profiler.stats[(Profiler.ALGORITHM, "f", 1)] == [2, 50, 40]
+	assert profiler.stats[(Profiler.BUILTIN, "out", 2)] == [1, 10, 10]
+
+def test_unwind_closes_open_calls():
+	profiler = Profiler(logger = Logger(buffer_size = 0))
+	profiler.enter(Profiler.ALGORITHM, "f")
+	profiler.enter(Profiler.STRUCTURE, "repeat")
+	profiler.unwind(1)
+
+	assert len(profiler.stack) == 1
+	assert profiler.stats[(Profiler.STRUCTURE, "repeat", 0)][0] == 1
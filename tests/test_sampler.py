@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from modules.logger import Logger
+from modules.profiler import Sampler
+from modules.scope import Frame
+import re
+
+LOOP = """
+	alg(spin, args)
+		repeat(20000, i)
+			add(x)
+				i
+				1
+	spin(value)
+	out
+		"done
+"""
+
+def sampler_for(alg_cache: list, frames: list = [], call_lines: list = []) -> Sampler:
+	runtime = SimpleNamespace(alg_cache = alg_cache, call_lines = call_lines, frames = frames)
+	return Sampler(logger = Logger(buffer_size = 0), runtime = runtime)
+
+def test_samples_are_collapsed_stacks(run, tmp_path):
+	result = run(LOOP, "*sample=run.folded")
+	lines = (tmp_path / "run.folded").read_text().splitlines()
+
+	assert result.lines == ["done"]
+	assert lines
+	assert all(re.fullmatch(r"synt(;\S+)* \d+", line) for line in lines)
+	assert any(line.startswith("synt;spin:6") for line in lines)
+
+def test_samples_are_saved_next_to_source(run, tmp_path):
+	run(LOOP, "*sample")
+
+	assert (tmp_path / "main.synt.folded").is_file()
+
+def test_stack_names_of_tree_walker():
+	sampler = sampler_for([[1, "spin"], [0, "repeat"], [1, "add", "x"]], call_lines = [6, 2, 3])
+
+	assert sampler.stack_names() == ["synt", "spin:6", "repeat:2", "add:3"]
+
+def test_stack_names_of_virtual_machine_frames():
+	alg = SimpleNamespace(name = "spin")
+	sampler = sampler_for([[0, "repeat"]], [Frame(alg = alg, level = 1, line = 6)], [2])
+
+	assert sampler.stack_names() == ["synt", "repeat:2", "spin:6"]
+
+def test_unknown_lines_are_left_out():
+	sampler = sampler_for([[1, "spin"]])
+
+	assert sampler.stack_names() == ["synt", "spin"]
+
+def test_blocks_are_not_named():
+	sampler = sampler_for([[0, Sampler.BLOCK_NAME], [1, "spin"]])
+
+	assert sampler.stack_names() == ["synt", "spin"]
+
+def test_save_counts_samples(tmp_path):
+	sampler = sampler_for([[1, "spin"]])
+	sampler.sample()
+	sampler.sample()
+	sampler.save(str(tmp_path / "samples.folded"))
+
+	assert (tmp_path / "samples.folded").read_text() == "synt;spin 2\n"
@@ -0,0 +1,58 @@
+def test_recursive_calls_keep_their_own_arguments(run):
+	result = run("""
+		alg(down, args)
+			var(n)
+				number
+				item
+					args
+					0
+			if(n)
+				down(ignored)
+					subtract
+						n
+						1
+			out
+				n
+		down(x)
+			3
+	""")
+
+	assert result.lines == ["0", "1", "2", "3"]
+
+def test_loop_variable_does_not_leak_from_algorithm(run):
+	result = run("""
+		var(i)
+			text
+			"global
+		alg(loop)
+			repeat(2, i)
+				out
+					i
+		loop(x)
+		out
+			i
+	""")
+
+	assert result.lines == ["0", "1", "global"]
+
+def test_algorithm_updates_globals_and_keeps_new_names_local(run):
+	result = run("""
+		var(count)
+			number
+			0
+		alg(tick)
+			add(count)
+				count
+				1
+			var(fresh)
+				number
+				1
+		tick(x)
+		tick(x)
+		out
+			count
+			fresh
+	""")
+
+	assert result.lines[-1] == "2"
+	assert "Undefined value: fresh" in result.out
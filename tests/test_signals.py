@@ -0,0 +1,67 @@
+def test_withdraw_leaves_given_levels(run):
+	result = run("""
+		repeat(3, i)
+			repeat(3, j)
+				if(TRUE)
+					withdraw(2)
+				out
+					"never
+			out
+				i
+		out
+			"after
+	""")
+
+	assert result.lines == ["0", "1", "2", "after"]
+
+def test_withdraw_leaves_outer_loop(run):
+	result = run("""
+		repeat(3, i)
+			repeat(3, j)
+				if(TRUE)
+					withdraw(3)
+			out
+				"never
+		out
+			"after
+	""")
+
+	assert result.lines == ["after"]
+
+def test_withdraw_inside_algorithm_stays_in_algorithm(run):
+	result = run("""
+		alg(stop)
+			repeat(3, i)
+				out
+					i
+				withdraw(1)
+			out
+				"inside
+		stop(x)
+		out
+			"after
+	""")
+
+	assert result.lines == ["0", "inside", "after"]
+
+def test_result_from_nested_loops(run):
+	result = run("""
+		alg(find)
+			repeat(5, i)
+				repeat(5, j)
+					if(TRUE)
+						result
+							"found
+			result
+				"never
+		find(value)
+		out
+			value
+	""")
+
+	assert result.lines == ["found"]
+
+def test_withdraw_past_program_is_an_error(run):
+	assert "Can not exit from non existent process" in run("""
+		withdraw(5)
+	""").out
@@ -0,0 +1,74 @@
+from modules.logger import Logger
+from modules.components.functions import Statistics
+from modules.components.context import Number, Array, Void
+import textwrap
+import pytest
+
+ARRAY = """
+		array(a)
+			4
+			1
+			3
+			2
+"""
+
+@pytest.mark.parametrize(("name", "extra", "expected"), [
+	("sum", "", "10"),
+	("product", "\n\t2", "48"),
+	("min", "", "1"),
+	("max", "\n\t1.5", "4.0"),
+	("mean", "", "2.5"),
+	("variance", "", "1.25"),
+	("percentile", "\n\t50", "2.5")
+])
+def test_reductions(run, name, extra, expected):
+	source = textwrap.dedent(ARRAY) + f"{name}(s)\n\ta{extra}\nout\n\ts\n"
+
+	assert run(source).lines == [expected]
+
+def test_count_if_with_comparison(run):
+	result = run(ARRAY + """
+		count-if(n)
+			a
+			">
+			2
+		out
+			n
+	""")
+
+	assert result.lines == ["2"]
+
+def test_count_if_counts_true_values(run):
+	result = run("""
+		collection(c)
+			0
+			1
+			TRUE
+			5
+		count-if(n)
+			c
+		out
+			n
+	""")
+
+	assert result.lines == ["3"]
+
+def test_min_rejects_text(run):
+	result = run("""
+		min(m)
+			3
+			"x
+		out
+			m
+	""")
+
+	assert "Number required, got Text" in result.out
+
+def test_mean_of_nothing_is_an_error(run):
+	assert "Mean of no values" in run("mean(e)\n").out
+
+def test_results_use_shared_objects():
+	statistics = Statistics(Logger(exit_on_error = False))
+
+	assert statistics.total(Array(None, [1, 2])) is Number.of(3)
+	assert statistics.minimum(Array(None, [])) is Void.of()
@@ -0,0 +1,73 @@
+def test_lines_runs_once_per_line(run):
+	result = run("""
+		lines(l)
+			out
+				">
+				l
+		eof(e)
+		out
+			e
+	""", stdin = "a\nb\r\nc")
+
+	assert result.lines == [">a", ">b", ">c", "TRUE"]
+
+def test_input_and_lines_share_input(run):
+	result = run("""
+		input(first)
+		line(second)
+		lines(l)
+			out
+				l
+		out
+			first
+			second
+	""", stdin = "1\n2\n3\n4\n")
+
+	assert result.lines == ["3", "4", "12"]
+
+def test_reads_after_end_of_input(run):
+	result = run("""
+		eof(before)
+		line(a)
+		line(b)
+		input(c)
+		eof(after)
+		out
+			before
+		out
+			b
+		out
+			after
+	""", stdin = "only\n")
+
+	assert result.returncode == 0
+	assert result.lines == ["FALSE", "", "TRUE"]
+
+def test_withdraw_leaves_lines(run):
+	result = run("""
+		lines(l)
+			out
+				l
+			withdraw(1)
+		line(rest)
+		out
+			rest
+	""", stdin = "a\nb\n")
+
+	assert result.lines == ["a", "b"]
+
+def test_lines_in_algorithm_is_local(run):
+	result = run("""
+		var(l)
+			text
+			"outer
+		alg(read)
+			lines(l)
+				out
+					l
+		read(x)
+		out
+			l
+	""", stdin = "x\ny\n")
+
+	assert result.lines == ["x", "y", "outer"]
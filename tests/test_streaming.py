@@ -0,0 +1,39 @@
+from modules.logger import Logger
+from modules.iterator import Iterator
+
+def test_chunks_are_given_before_source_ends():
+	read = []
+	def source():
+		for piece in ["out\n\t\"a\nout\n", "\t\"b\n", "out\n\t\"c\n"]:
+			read.append(piece)
+			yield piece
+
+	chunks = Iterator(logger = Logger(buffer_size = 0)).iterate_stream(source())
+
+	assert next(chunks) == ["out", ["\"a"]]
+	assert len(read) == 1
+	assert list(chunks) == [["out", ["\"b"]], ["out", ["\"c"]]]
+
+def test_lines_split_across_pieces():
+	iterator = Iterator(logger = Logger(buffer_size = 0))
+
+	assert list(iterator.iterate_stream(["ou", "t\n\t", "\"ab", "c"])) == [["out", ["\"abc"]]]
+
+def test_streamed_run_matches_cached_run(synt):
+	source = "repeat(3, i)\n\tout\n\t\ti\nout\n\t\"done\n"
+
+	cached = synt(source)
+	streamed = synt(source, "*nocache")
+
+	assert streamed.lines == cached.lines == ["0", "1", "2", "done"]
+
+def test_streamed_run_starts_before_errors(run):
+	result = run("""
+		out
+			"first
+		out
+				"bad
+	""", "*nocache")
+
+	assert result.lines[0] == "first"
+	assert "Unexpected Indentation in Line 4" in result.out
@@ -0,0 +1,61 @@
+COUNTDOWN = """
+	alg(count, args)
+		var(n)
+			number
+			item
+				args
+				0
+		if(n)
+			result
+				count
+					subtract
+						n
+						1
+		result
+			"done
+	count(value)
+		100000
+	out
+		value
+"""
+
+def test_tail_calls_run_in_constant_depth(run):
+	assert run(COUNTDOWN).lines == ["done"]
+
+def test_mutual_tail_calls(run):
+	result = run("""
+		alg(even, args)
+			var(n)
+				number
+				item
+					args
+					0
+			if(n)
+				result
+					odd
+						subtract
+							n
+							1
+			result
+				TRUE
+		alg(odd, args)
+			var(n)
+				number
+				item
+					args
+					0
+			if(n)
+				result
+					even
+						subtract
+							n
+							1
+			result
+				FALSE
+		even(value)
+			20001
+		out
+			value
+	""")
+
+	assert result.lines == ["FALSE"]
@@ -0,0 +1,121 @@
+from conftest import BACKEND_ARGS, create_engine
+import modules.opcodes as opcodes
+import pytest
+
+PROGRAMS = {
+	"recursion": """
+		alg(fib, args)
+			lesser(small)
+				item
+					args
+					0
+				2
+			if(small)
+				result
+					item
+						args
+						0
+			result
+				add
+					fib
+						subtract
+							item
+								args
+								0
+							1
+					fib
+						subtract
+							item
+								args
+								0
+							2
+		fib(value)
+			15
+		out
+			value
+	""",
+	"loops": """
+		var(total)
+			number
+			0
+		repeat(20, i)
+			repeat(20, j)
+				if(TRUE)
+					add(total)
+						total
+						j
+				if(FALSE)
+					withdraw(2)
+		out
+			total
+			" 
+			i
+			" 
+			j
+	""",
+	"text": """
+		var(built)
+			text
+			"
+		repeat(5, i)
+			concat(built)
+				built
+				i
+				"-
+		out
+			built
+			length
+				built
+	""",
+	"globals": """
+		var(counter)
+			number
+			1
+		alg(bump)
+			add(counter)
+				counter
+				1
+		bump(ignored)
+		bump(ignored)
+		out
+			counter
+	"""
+}
+
+@pytest.mark.parametrize("name", list(PROGRAMS))
+def test_backends_give_same_output(synt, name):
+	outputs = [synt(PROGRAMS[name], *BACKEND_ARGS[backend]).out for backend in BACKEND_ARGS]
+
+	assert outputs[0]
+	assert outputs[0] == outputs[1]
+
+def test_recursion(run):
+	assert run(PROGRAMS["recursion"]).lines == ["610"]
+
+def test_nested_loops(run):
+	assert run(PROGRAMS["loops"]).lines == ["3800 19 19"]
+
+def test_algorithm_updates_existing_global(run):
+	assert run(PROGRAMS["globals"]).lines == ["3"]
+
+def test_calls_with_known_operands_skip_the_stack():
+	engine = create_engine()
+	chunks = list(engine.iterator.parse_lines(["add(x)", "\tx", "\t1"]))
+	code = engine.vm.compiler.compile(chunks)
+
+	assert [op for op, _ in code.instructions] == [opcodes.CALL_BUILTIN, opcodes.RETURN]
+
+def test_rebound_builtin_leaves_the_fast_path(run):
+	result = run("""
+		repeat(2, i)
+			add(x)
+				i
+				1
+			out
+				x
+			alg(add)
+				result
+					"user
+	""")
+
+	assert result.lines == ["1", "user"]